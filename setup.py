@@ -43,8 +43,10 @@ setup(
     extras_require={
         "dev": [
             "pytest>=7.0.0",
-            "pytest-asyncio>=0.21.0",
+            "pytest-asyncio>=0.24.0",
             "pytest-mock>=3.10.0",
+            "pytest-xdist>=3.0.0",
+            "async-timeout>=4.0.0; python_version < '3.11'",
             "black>=23.0.0",
             "mypy>=1.0.0",
             "ruff>=0.1.0",
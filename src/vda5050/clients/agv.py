@@ -1,11 +1,12 @@
 # src/vda5050/clients/agv.py
 
 import logging
-from typing import Callable, List
+from typing import Callable, List, Optional, Tuple, Union
 from ..core.base_client import VDA5050BaseClient
 from ..models import Order, InstantActions
 from ..models.factsheet import Factsheet
 from ..models.state import State
+from ..models.visualization import Visualization
 from ..models.connection import Connection, ConnectionState
 from ..utils.exceptions import VDA5050Error
 
@@ -14,7 +15,7 @@ logger = logging.getLogger(__name__)
 class AGVClient(VDA5050BaseClient):
     """
     AGV client: receives orders and instant actions from the master,
-    publishes factsheet, state, and connection updates.
+    publishes factsheet, state, visualization, and connection updates.
     """
 
     def __init__(
@@ -22,18 +23,22 @@ class AGVClient(VDA5050BaseClient):
         broker_url: str,
         manufacturer: str,
         serial_number: str,
+        telemetry_qos: int = 0,
         **kwargs
     ):
         # Initialize base client with identity
         super().__init__(manufacturer, serial_number, broker_url, **kwargs)
-        # Lists of user-registered callbacks
-        self._order_callbacks: List[Callable[[Order], None]] = []
-        self._instant_callbacks: List[Callable[[InstantActions], None]] = []
+        # QoS for high-rate state/visualization messages; lifecycle messages use QoS 1
+        self.telemetry_qos = telemetry_qos
+        # Lists of user-registered callbacks, each stored with an is-coroutine flag
+        self._order_callbacks: List[Tuple[Callable[[Order], None], bool]] = []
+        self._instant_callbacks: List[Tuple[Callable[[InstantActions], None], bool]] = []
         
         # Register handlers using base class API to ensure validation
         # Subscribe to this AGV's specific order and instantActions topics
-        self.register_handler("order", self._handle_order)
-        self.register_handler("instantActions", self._handle_instant_action)
+        # raw=True: the handlers parse the undecoded MQTT bytes directly
+        self.register_handler("order", self._handle_order, raw=True)
+        self.register_handler("instantActions", self._handle_instant_action, raw=True)
 
     async def _setup_subscriptions(self):
         # Subscriptions are now handled by register_handler calls in __init__
@@ -52,7 +57,7 @@ class AGVClient(VDA5050BaseClient):
         except Exception as e:
             logger.error("Failed to send connection state or factsheet on connect: %s", e)
 
-    async def _handle_order(self, topic: str, payload: str):
+    async def _handle_order(self, topic: str, payload: Union[str, bytes]):
         # Parse JSON into Order model
         try:
             order = Order.from_mqtt_payload(payload)
@@ -60,13 +65,9 @@ class AGVClient(VDA5050BaseClient):
             logger.error("Failed to parse Order payload: %s", e)
             return
         # Action: Invoke all registered order callbacks
-        for cb in self._order_callbacks:
-            try:
-                cb(order)
-            except Exception as e:
-                logger.error("Error in order callback: %s", e)
+        self._invoke_callbacks(self._order_callbacks, "order", order)
 
-    async def _handle_instant_action(self, topic: str, payload: str):
+    async def _handle_instant_action(self, topic: str, payload: Union[str, bytes]):
         # Parse JSON into InstantAction model
         try:
             action = InstantActions.from_mqtt_payload(payload)
@@ -74,23 +75,21 @@ class AGVClient(VDA5050BaseClient):
             logger.error("Failed to parse InstantAction payload: %s", e)
             return
         # Action: Invoke all registered instant-action callbacks
-        for cb in self._instant_callbacks:
-            try:
-                cb(action)
-            except Exception as e:
-                logger.error("Error in instant-action callback: %s", e)
+        self._invoke_callbacks(self._instant_callbacks, "instant-action", action)
 
     def on_order_received(self, callback: Callable[[Order], None]):
         """
         Register a callback invoked when an Order message arrives.
+        The callback may be a plain function or a coroutine function.
         """
-        self._order_callbacks.append(callback)
+        self._add_callback(self._order_callbacks, callback)
 
     def on_instant_action(self, callback: Callable[[InstantActions], None]):
         """
         Register a callback invoked when an InstantAction message arrives.
+        The callback may be a plain function or a coroutine function.
         """
-        self._instant_callbacks.append(callback)
+        self._add_callback(self._instant_callbacks, callback)
 
     async def send_factsheet(self, factsheet: Factsheet) -> bool:
         """
@@ -108,19 +107,36 @@ class AGVClient(VDA5050BaseClient):
             logger.error("Failed to send factsheet: %s", e)
             return False
 
-    async def send_state(self, state: State) -> bool:
+    async def send_state(self, state: State, qos: Optional[int] = None) -> bool:
         """
         Publish this AGV's state update.
+        Sent with the client's telemetry QoS unless qos is given.
         """
         try:
             return await self._publish_message(
                 message_type="state",
-                message=state
+                message=state,
+                qos=self.telemetry_qos if qos is None else qos
             )
         except VDA5050Error as e:
             logger.error("Failed to send state: %s", e)
             return False
 
+    async def send_visualization(self, visualization: Visualization, qos: Optional[int] = None) -> bool:
+        """
+        Publish this AGV's visualization update.
+        Sent with the client's telemetry QoS unless qos is given.
+        """
+        try:
+            return await self._publish_message(
+                message_type="visualization",
+                message=visualization,
+                qos=self.telemetry_qos if qos is None else qos
+            )
+        except VDA5050Error as e:
+            logger.error("Failed to send visualization: %s", e)
+            return False
+
     async def update_connection(self, connection_state: ConnectionState) -> bool:
         """
         Publish this AGV's connection status.
@@ -1,7 +1,7 @@
 # src/vda5050/clients/master_control.py
 
 import logging
-from typing import Callable, List
+from typing import Callable, List, Tuple, Union
 from ..core.base_client import VDA5050BaseClient
 from ..models.order import Order
 from ..models.instant_action import InstantActions
@@ -26,16 +26,17 @@ class MasterControlClient(VDA5050BaseClient):
         **kwargs
     ):
         super().__init__(manufacturer, serial_number, broker_url, **kwargs)
-        # Callbacks receive (serial: str, state: State)
-        self._state_callbacks: List[Callable[[str, State], None]] = []
-        self._connection_callbacks: List[Callable[[str, str], None]] = []
-        self._factsheet_callbacks: List[Callable[[str, Factsheet], None]] = []
+        # Callbacks receive (serial: str, state: State); each is stored with an is-coroutine flag
+        self._state_callbacks: List[Tuple[Callable[[str, State], None], bool]] = []
+        self._connection_callbacks: List[Tuple[Callable[[str, str], None], bool]] = []
+        self._factsheet_callbacks: List[Tuple[Callable[[str, Factsheet], None], bool]] = []
         
         # Register handlers using base class API to ensure validation
         # Use wildcards to listen to all AGVs
-        self.register_handler("state", self._handle_state, all_manufacturers=True, all_serials=True)
-        self.register_handler("connection", self._handle_connection, all_manufacturers=True, all_serials=True)
-        self.register_handler("factsheet", self._handle_factsheet, all_manufacturers=True, all_serials=True)
+        # raw=True: the handlers parse the undecoded MQTT bytes directly
+        self.register_handler("state", self._handle_state, all_manufacturers=True, all_serials=True, raw=True)
+        self.register_handler("connection", self._handle_connection, all_manufacturers=True, all_serials=True, raw=True)
+        self.register_handler("factsheet", self._handle_factsheet, all_manufacturers=True, all_serials=True, raw=True)
 
     async def _setup_subscriptions(self):
         # Subscriptions are handled by register_handler calls in __init__
@@ -44,7 +45,7 @@ class MasterControlClient(VDA5050BaseClient):
     async def _on_vda5050_connect(self):
         logger.debug("MasterControlClient connected to VDA5050")
 
-    async def _handle_state(self, topic: str, payload: str):
+    async def _handle_state(self, topic: str, payload: Union[str, bytes]):
         info = self.topic_manager.parse_topic(topic)
         if not info:
             logger.error("Invalid state topic: %s", topic)
@@ -55,13 +56,9 @@ class MasterControlClient(VDA5050BaseClient):
             logger.error("Failed to parse State payload: %s", e)
             return
         serial = info["serialNumber"]
-        for cb in self._state_callbacks:
-            try:
-                cb(serial, state)
-            except Exception as e:
-                logger.error("Error in state callback: %s", e)
+        self._invoke_callbacks(self._state_callbacks, "state", serial, state)
 
-    async def _handle_connection(self, topic: str, payload: str):
+    async def _handle_connection(self, topic: str, payload: Union[str, bytes]):
         info = self.topic_manager.parse_topic(topic)
         if not info:
             logger.error("Invalid connection topic: %s", topic)
@@ -73,13 +70,9 @@ class MasterControlClient(VDA5050BaseClient):
             return
         serial = info["serialNumber"]
         connection_state = connection.connectionState.value
-        for cb in self._connection_callbacks:
-            try:
-                cb(serial, connection_state)
-            except Exception as e:
-                logger.error("Error in connection callback: %s", e)
+        self._invoke_callbacks(self._connection_callbacks, "connection", serial, connection_state)
 
-    async def _handle_factsheet(self, topic: str, payload: str):
+    async def _handle_factsheet(self, topic: str, payload: Union[str, bytes]):
         info = self.topic_manager.parse_topic(topic)
         if not info:
             logger.error("Invalid factsheet topic: %s", topic)
@@ -90,32 +83,28 @@ class MasterControlClient(VDA5050BaseClient):
             logger.error("Failed to parse Factsheet payload: %s", e)
             return
         serial = info["serialNumber"]
-        for cb in self._factsheet_callbacks:
-            try:
-                cb(serial, factsheet)
-            except Exception as e:
-                logger.error("Error in factsheet callback: %s", e)
+        self._invoke_callbacks(self._factsheet_callbacks, "factsheet", serial, factsheet)
 
     def on_state_update(self, callback: Callable[[str, State], None]):
         """
         Register a callback for AGV state updates.
         Callback receives (serial_number, State).
         """
-        self._state_callbacks.append(callback)
+        self._add_callback(self._state_callbacks, callback)
 
     def on_connection_change(self, callback: Callable[[str, str], None]):
         """
         Register a callback for AGV connection state changes.
         Callback receives (serial_number, new_state).
         """
-        self._connection_callbacks.append(callback)
+        self._add_callback(self._connection_callbacks, callback)
 
     def on_factsheet(self, callback: Callable[[str, Factsheet], None]):
         """
         Register a callback for AGV factsheet updates.
         Callback receives (serial_number, Factsheet).
         """
-        self._factsheet_callbacks.append(callback)
+        self._add_callback(self._factsheet_callbacks, callback)
 
     async def send_order(
         self,
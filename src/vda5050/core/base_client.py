@@ -1,9 +1,11 @@
 # src/vda5050/core/base_client.py
 
 import asyncio
+import functools
+import inspect
 import logging
 from abc import ABC, abstractmethod
-from typing import Optional, Callable
+from typing import Optional, Callable, List, Set, Tuple, Union
 from .mqtt_abstraction import MQTTAbstraction
 from .topic_manager import TopicManager
 from ..models.base import VDA5050Message
@@ -28,7 +30,8 @@ class VDA5050BaseClient(ABC):
         version: str = "2.1.0",
         username: Optional[str] = None,
         password: Optional[str] = None,
-        validate_messages: bool = True
+        validate_messages: bool = True,
+        transport: Optional[MQTTAbstraction] = None
     ):
         # Store VDA5050 identity for topic construction
         self.manufacturer = manufacturer
@@ -39,8 +42,10 @@ class VDA5050BaseClient(ABC):
         # Initialize validation
         self.validator = MessageValidator() if validate_messages else None
         
-        # Initialize core components
-        self.mqtt = MQTTAbstraction(
+        # Initialize core components. A shared transport lets several clients
+        # reuse one broker connection; it stays owned by whoever created it.
+        self._owns_transport = transport is None
+        self.mqtt = transport or MQTTAbstraction(
             broker_url=broker_url,
             broker_port=broker_port,
             client_id=f"{manufacturer}_{serial_number}",
@@ -58,6 +63,13 @@ class VDA5050BaseClient(ABC):
         # Track connection state to prevent double connects
         self._connected = False
         
+        # Keep references to running async user callbacks until they finish
+        self._callback_tasks: Set[asyncio.Task] = set()
+        
+        # (topic, handler) pairs this client subscribed on the transport, so
+        # they can be removed again without touching other clients' handlers
+        self._subscriptions: List[Tuple[str, Callable]] = []
+        
     async def connect(self) -> bool:
         """
         Connect to VDA5050 system.
@@ -67,7 +79,7 @@ class VDA5050BaseClient(ABC):
         if self._connected:
             return True
             
-        logger.info(f"Connecting VDA5050 client: {self.manufacturer}/{self.serial_number}")
+        logger.info("Connecting VDA5050 client: %s/%s", self.manufacturer, self.serial_number)
         
         try:
             # Connect MQTT layer first
@@ -91,7 +103,7 @@ class VDA5050BaseClient(ABC):
             return True
             
         except Exception as e:
-            logger.error(f"Failed to connect VDA5050 client: {e}")
+            logger.error("Failed to connect VDA5050 client: %s", e)
             return False
     
     async def disconnect(self):
@@ -107,14 +119,23 @@ class VDA5050BaseClient(ABC):
             # Client-specific cleanup
             await self._on_vda5050_disconnect()
             
-            # Disconnect MQTT
-            await self.mqtt.disconnect()
+            # Stop async user callbacks that are still running
+            await self._cancel_callback_tasks()
+            
+            # Remove this client's subscriptions so its handlers stop firing on
+            # a shared transport and are not registered twice on reconnect
+            subscriptions, self._subscriptions = self._subscriptions, []
+            await self.mqtt.unsubscribe_many(subscriptions)
+            
+            # Disconnect MQTT unless the connection is shared with other clients
+            if self._owns_transport:
+                await self.mqtt.disconnect()
             
             self._connected = False
             logger.info("VDA5050 client disconnected")
             
         except Exception as e:
-            logger.error(f"Error during disconnect: {e}")
+            logger.error("Error during disconnect: %s", e)
     
     @abstractmethod
     async def _setup_subscriptions(self):
@@ -145,7 +166,8 @@ class VDA5050BaseClient(ABC):
         message: VDA5050Message,
         target_manufacturer: Optional[str] = None,
         target_serial: Optional[str] = None,
-        retain: bool = False
+        retain: bool = False,
+        qos: int = 1
     ) -> bool:
         """
         Publish a VDA5050 message to the appropriate MQTT topic.
@@ -162,7 +184,7 @@ class VDA5050BaseClient(ABC):
             # Validate message before publishing
             if self.validator:
                 self.validator.validate_message(message_type, payload)
-                logger.debug(f"Message {message_type} passed validation")
+                logger.debug("Message %s passed validation", message_type)
 
             if target_manufacturer and target_serial:
                 topic = self.topic_manager.get_target_topic(
@@ -170,26 +192,35 @@ class VDA5050BaseClient(ABC):
                 )
             else:
                 topic = self.topic_manager.get_publish_topic(message_type)
-            success = await self.mqtt.publish(topic, payload, retain=retain)
+            success = await self.mqtt.publish(topic, payload, qos=qos, retain=retain)
             if not success:
                 raise VDA5050Error(f"Failed to publish {message_type} message")
-            logger.debug(f"Published {message_type} to {topic}")
+            logger.debug("Published %s to %s", message_type, topic)
             return True
 
         except Exception as e:
-            logger.error(f"Error publishing {message_type}: {e}")
+            logger.error("Error publishing %s: %s", message_type, e)
             raise VDA5050Error(str(e))
     
-    def register_handler(self, message_type: str, handler: Callable, all_manufacturers: bool = False, all_serials: bool = False):
+    def register_handler(
+        self,
+        message_type: str,
+        handler: Callable,
+        all_manufacturers: bool = False,
+        all_serials: bool = False,
+        raw: bool = False
+    ):
         """
         Register handler for incoming VDA5050 messages.
         The actual subscription will be set up during connection.
         
         Args:
             message_type: VDA5050 message type to handle
-            handler: Async function to call when message received
+            handler: Async function called as handler(topic, payload)
             all_manufacturers: Subscribe to all manufacturers (wildcard)
             all_serials: Subscribe to all serials (wildcard)
+            raw: Pass the payload as the undecoded MQTT bytes instead of
+                a UTF-8 decoded str
         """
         # Store handler registration for later use during connection
         if not hasattr(self, '_registered_handlers'):
@@ -199,38 +230,95 @@ class VDA5050BaseClient(ABC):
             'message_type': message_type,
             'handler': handler,
             'all_manufacturers': all_manufacturers,
-            'all_serials': all_serials
+            'all_serials': all_serials,
+            'raw': raw
         })
     
     async def _setup_registered_handlers(self):
-        """Set up MQTT subscriptions for all registered handlers."""
+        """
+        Set up MQTT subscriptions for all registered handlers.
+        All topics are sent to the broker in a single SUBSCRIBE packet.
+        """
         if not hasattr(self, '_registered_handlers'):
             return
             
+        subscriptions = []
         for registration in self._registered_handlers:
             message_type = registration['message_type']
             handler = registration['handler']
             all_manufacturers = registration['all_manufacturers']
             all_serials = registration['all_serials']
+            raw = registration['raw']
             
             # Build topic for this message type
             topic = self.topic_manager.get_subscription_topic(
                 message_type, all_manufacturers=all_manufacturers, all_serials=all_serials
             )
             
-            # Create wrapper that handles JSON parsing and error catching
-            async def message_wrapper(topic: str, payload: str, msg_type=message_type, h=handler):
+            # Create wrapper that handles JSON parsing and error catching.
+            # It takes the raw bytes so the validator parses them directly,
+            # and decodes them only for handlers that expect str.
+            async def message_wrapper(topic: str, payload: Union[str, bytes], msg_type=message_type, h=handler, raw=raw):
                 try:
                     if self.validator:
                         self.validator.validate_message(msg_type, payload)
-                        logger.debug(f"Incoming {msg_type} message passed validation")
-                    logger.debug(f"Received {msg_type} message on {topic}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Received %s message on %s (validated=%s)",
+                                     msg_type, topic, self.validator is not None)
+                    if not raw and isinstance(payload, bytes):
+                        payload = payload.decode("utf-8")
                     await h(topic, payload)
                 except Exception as e:
-                    logger.error(f"Error in {msg_type} handler: {e}")
+                    logger.error("Error in %s handler: %s", msg_type, e)
             
-            # Subscribe to MQTT topic
-            await self.mqtt.subscribe(topic, message_wrapper)
+            subscriptions.append((topic, message_wrapper))
+        
+        # Subscribe to all MQTT topics at once
+        await self.mqtt.subscribe_many(subscriptions, raw=True)
+        self._subscriptions.extend(subscriptions)
+    
+    def _add_callback(self, callbacks: List[Tuple[Callable, bool]], callback: Callable):
+        """
+        Store a user callback together with whether it is a coroutine function.
+        The check is done once here rather than for every incoming message.
+        """
+        callbacks.append((callback, inspect.iscoroutinefunction(callback)))
+    
+    def _invoke_callbacks(self, callbacks: List[Tuple[Callable, bool]], kind: str, *args):
+        """
+        Invoke user callbacks for an incoming message.
+        Plain functions run inline on the event loop; coroutine functions
+        are scheduled as tasks so they do not delay message dispatch.
+        """
+        for cb, is_coroutine in callbacks:
+            try:
+                if is_coroutine:
+                    task = asyncio.create_task(cb(*args))
+                    self._callback_tasks.add(task)
+                    task.add_done_callback(
+                        functools.partial(self._on_callback_done, kind=kind)
+                    )
+                else:
+                    cb(*args)
+            except Exception as e:
+                logger.error("Error in %s callback: %s", kind, e)
+    
+    async def _cancel_callback_tasks(self):
+        """
+        Cancel running async user callbacks and wait until they have finished.
+        A callback that is itself calling disconnect() is left to finish.
+        """
+        current = asyncio.current_task()
+        tasks = [task for task in self._callback_tasks if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def _on_callback_done(self, task: asyncio.Task, kind: str):
+        """Release a finished async callback task and log its failure, if any."""
+        self._callback_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Error in %s callback: %s", kind, task.exception())
     
     def is_connected(self) -> bool:
         """Check if client is connected to VDA5050 system."""
@@ -1,11 +1,12 @@
 # src/vda5050/core/mqtt_abstraction.py
 
 import asyncio
+import collections
 import logging
 import re
 import uuid
 from enum import Enum
-from typing import Callable, Dict
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple, Union
 import paho.mqtt.client as mqtt
 
 logger = logging.getLogger(__name__)
@@ -23,6 +24,12 @@ class MQTTAbstraction:
     with automatic reconnection and message routing.
     """
 
+    # Upper bound on concurrently running message handlers
+    MAX_INFLIGHT = 64
+    # Reconnect backoff bounds in seconds; the delay doubles after each failure
+    RECONNECT_MIN_DELAY = 1
+    RECONNECT_MAX_DELAY = 60
+
     def __init__(
         self,
         broker_url: str,
@@ -37,9 +44,22 @@ class MQTTAbstraction:
         self.client_id = client_id or f"vda5050-{uuid.uuid4()}"
         self._state = ConnectionState.DISCONNECTED
         self._connection_event = asyncio.Event()
-        self._message_queue: asyncio.Queue = asyncio.Queue()
-        self._handlers: Dict[str, Callable] = {}
-        self._wildcard_handlers: Dict[str, Callable] = {}
+        # Serializes connect() so concurrent callers share one attempt
+        self._connect_lock = asyncio.Lock()
+        # Incoming (topic, payload) pairs; _msg_event wakes the processor
+        self._msg_deque: Deque[Tuple[str, Union[str, bytes]]] = collections.deque()
+        self._msg_event = asyncio.Event()
+        # Set by disconnect() so the processor stops waiting for a free slot
+        self._stop_event = asyncio.Event()
+        # Handlers per topic, each with whether it takes the raw bytes payload.
+        # Several clients sharing this connection may subscribe the same topic.
+        self._handlers: Dict[str, List[Tuple[Callable, bool]]] = {}
+        self._wildcard_handlers: Dict[str, List[Tuple[Callable, bool]]] = {}
+        # Compiled matcher per wildcard pattern, built once at subscribe time
+        self._wildcard_regexes: Dict[str, re.Pattern] = {}
+        self._pending: Set[asyncio.Task] = set()
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._processor_task: Optional[asyncio.Task] = None
         self._running = False
         # Capture event loop for thread-safe operations
         self._loop = asyncio.get_event_loop()
@@ -55,10 +75,19 @@ class MQTTAbstraction:
     async def connect(self, timeout: float = 10.0) -> bool:
         """
         Connect to the MQTT broker asynchronously.
-        Returns True on success, False on failure.
+        Returns True on success, False on failure. Concurrent calls wait for
+        the attempt already in progress instead of starting another.
+        """
+        async with self._connect_lock:
+            if self._state == ConnectionState.CONNECTED:
+                return True
+            return await self._connect(timeout)
+
+    async def _connect(self, timeout: float) -> bool:
+        """
+        Open the broker connection and start the message processor.
+        Callers must hold _connect_lock.
         """
-        if self._state == ConnectionState.CONNECTED:
-            return True
         self._state = ConnectionState.CONNECTING
         loop = asyncio.get_event_loop()
         try:
@@ -74,8 +103,11 @@ class MQTTAbstraction:
             # Wait for on_connect callback
             await asyncio.wait_for(self._connection_event.wait(), timeout)
             self._running = True
-            # Start processing incoming messages
-            asyncio.create_task(self._message_processor())
+            self._stop_event.clear()
+            # Start processing incoming messages, unless the processor from
+            # before an unexpected disconnect is still running
+            if self._processor_task is None or self._processor_task.done():
+                self._processor_task = asyncio.create_task(self._message_processor())
             return True
         except Exception as e:
             logger.error("MQTT connect failed: %s", e)
@@ -87,11 +119,37 @@ class MQTTAbstraction:
         Disconnect gracefully from the MQTT broker.
         """
         self._running = False
+        self._stop_event.set()
+        # Stop a reconnect backoff in progress so it cannot reconnect afterwards
+        if self._reconnect_task is not None:
+            if self._reconnect_task is not asyncio.current_task():
+                self._reconnect_task.cancel()
+                await asyncio.gather(self._reconnect_task, return_exceptions=True)
+            self._reconnect_task = None
+        # Cancel handlers still running so none outlive the connection; this
+        # also frees the processor if it is waiting for an in-flight slot
+        await self._cancel_pending()
+        # Wake the message processor so it sees _running, and wait for it to exit
+        self._msg_event.set()
+        if self._processor_task is not None:
+            await self._processor_task
+            self._processor_task = None
         if self._state == ConnectionState.CONNECTED:
             self._client.loop_stop()
             self._client.disconnect()
         self._state = ConnectionState.DISCONNECTED
 
+    async def _cancel_pending(self):
+        """
+        Cancel in-flight dispatch tasks and wait until they have finished.
+        A handler that is itself calling disconnect() is left to finish.
+        """
+        current = asyncio.current_task()
+        pending = [task for task in self._pending if task is not current]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
     async def publish(self, topic: str, payload: str, qos: int = 1, retain: bool = False) -> bool:
         """
         Publish a message to the given MQTT topic.
@@ -109,18 +167,89 @@ class MQTTAbstraction:
             logger.error("Publish failed on topic %s: %s", topic, e)
             return False
 
-    async def subscribe(self, topic: str, handler: Callable, qos: int = 1):
+    async def subscribe(self, topic: str, handler: Callable, qos: int = 1, raw: bool = False):
         """
         Subscribe to a topic and register an async handler.
         Supports MQTT wildcards ('+' or '#').
+        The handler is called as handler(topic, payload) with the payload
+        decoded from UTF-8 to str, or as the undecoded bytes if raw is True.
         """
         rc, _ = self._client.subscribe(topic, qos=qos)
         if rc != mqtt.MQTT_ERR_SUCCESS:
             raise RuntimeError(f"Subscribe failed for topic {topic}: {rc}")
+        self._register_handler(topic, handler, raw)
+
+    async def subscribe_many(
+        self, subscriptions: List[Tuple[str, Callable]], qos: int = 1, raw: bool = False
+    ):
+        """
+        Subscribe to several topics with a single SUBSCRIBE packet.
+        Each (topic, handler) pair is registered as in subscribe().
+        """
+        if not subscriptions:
+            return
+        rc, _ = self._client.subscribe([(topic, qos) for topic, _ in subscriptions])
+        if rc != mqtt.MQTT_ERR_SUCCESS:
+            topics = ", ".join(topic for topic, _ in subscriptions)
+            raise RuntimeError(f"Subscribe failed for topics {topics}: {rc}")
+        for topic, handler in subscriptions:
+            self._register_handler(topic, handler, raw)
+
+    async def unsubscribe(self, topic: str, handler: Callable):
+        """
+        Remove a handler registered with subscribe().
+        The broker subscription is dropped once no handler is left for the topic.
+        """
+        await self.unsubscribe_many([(topic, handler)])
+
+    async def unsubscribe_many(self, subscriptions: List[Tuple[str, Callable]]):
+        """
+        Remove several (topic, handler) registrations, dropping the broker
+        subscriptions left without handlers in a single UNSUBSCRIBE packet.
+        Handlers are always removed; the packet is only sent while connected.
+        """
+        topics = [
+            topic for topic, handler in subscriptions
+            if self._unregister_handler(topic, handler)
+        ]
+        if not topics or self._state != ConnectionState.CONNECTED:
+            return
+        rc, _ = self._client.unsubscribe(topics)
+        if rc != mqtt.MQTT_ERR_SUCCESS:
+            raise RuntimeError(f"Unsubscribe failed for topics {', '.join(topics)}: {rc}")
+
+    def _register_handler(self, topic: str, handler: Callable, raw: bool = False):
+        """
+        Store the handler for a subscribed topic, keeping wildcard
+        patterns separate from exact topics.
+        """
         if '+' in topic or '#' in topic:
-            self._wildcard_handlers[topic] = handler
+            self._wildcard_handlers.setdefault(topic, []).append((handler, raw))
+            if topic not in self._wildcard_regexes:
+                self._wildcard_regexes[topic] = self._compile_wildcard(topic)
         else:
-            self._handlers[topic] = handler
+            self._handlers.setdefault(topic, []).append((handler, raw))
+
+    def _unregister_handler(self, topic: str, handler: Callable) -> bool:
+        """
+        Drop one registration of handler for topic.
+        Returns True if the topic has no handlers left.
+        """
+        wildcard = '+' in topic or '#' in topic
+        handlers = self._wildcard_handlers if wildcard else self._handlers
+        entries = handlers.get(topic)
+        if not entries:
+            return False
+        for i, (registered, _) in enumerate(entries):
+            if registered is handler:
+                del entries[i]
+                break
+        if entries:
+            return False
+        del handlers[topic]
+        if wildcard:
+            del self._wildcard_regexes[topic]
+        return True
 
     def _on_connect(self, client, userdata, flags, rc, properties=None):
         """
@@ -142,56 +271,107 @@ class MQTTAbstraction:
         self._connection_event.clear()
         if rc != 0:
             # Unexpected disconnect: start reconnect loop using thread-safe method
-            self._loop.call_soon_threadsafe(
-                lambda: asyncio.create_task(self._reconnect())
-            )
+            self._loop.call_soon_threadsafe(self._start_reconnect)
+
+    def _start_reconnect(self):
+        """
+        Start the reconnect loop on the event loop, keeping a reference to
+        the task so it is not garbage-collected while it runs.
+        """
+        self._reconnect_task = asyncio.create_task(self._reconnect())
 
     def _on_message(self, client, userdata, msg, properties=None):
         """
         Callback for incoming messages.
-        Queues messages for async processing.
+        Queues messages for async processing. The payload is kept as raw
+        bytes until routing, which decodes it only for handlers that are
+        not registered as raw.
+        """
+        # Use thread-safe method to queue message; no per-message task is needed
+        self._loop.call_soon_threadsafe(self._enqueue, msg.topic, msg.payload)
+
+    def _enqueue(self, topic: str, payload: Union[str, bytes]):
+        """
+        Append a message for the processor and wake it up.
+        Must be called on the event loop thread.
         """
-        payload = msg.payload.decode('utf-8')
-        # Use thread-safe method to queue message
-        self._loop.call_soon_threadsafe(
-            lambda: asyncio.create_task(self._message_queue.put((msg.topic, payload)))
-        )
+        self._msg_deque.append((topic, payload))
+        self._msg_event.set()
 
     async def _message_processor(self):
         """
         Async loop to process queued messages and dispatch to handlers.
+        Each message is handled in its own task so a slow handler does not
+        hold up later messages; at most MAX_INFLIGHT run at once. As a
+        result, async handlers may finish out of order, even for messages
+        on the same topic. Setting _msg_event without queuing anything
+        wakes the loop to re-check _running.
         """
         while self._running:
+            await self._msg_event.wait()
+            self._msg_event.clear()
+            while self._msg_deque and self._running:
+                topic, payload = self._msg_deque.popleft()
+                task = asyncio.create_task(self._route(topic, payload))
+                self._pending.add(task)
+                task.add_done_callback(self._pending.discard)
+                if len(self._pending) >= self.MAX_INFLIGHT:
+                    await self._wait_for_slot()
+
+    async def _wait_for_slot(self):
+        """
+        Wait until an in-flight dispatch task finishes, or until
+        disconnect() signals the processor to stop.
+        """
+        stop_waiter = asyncio.ensure_future(self._stop_event.wait())
+        try:
+            await asyncio.wait(
+                {*self._pending, stop_waiter}, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            stop_waiter.cancel()
+
+    async def _route(self, topic: str, payload: Union[str, bytes]):
+        """
+        Route messages to every handler subscribed to the exact topic or to
+        a matching MQTT-style wildcard pattern. A failing handler, or a
+        payload that cannot be decoded, is logged and does not stop the
+        others.
+        """
+        entries = list(self._handlers.get(topic, ()))
+        for pattern, candidates in self._wildcard_handlers.items():
+            if self._wildcard_regexes[pattern].fullmatch(topic):
+                entries.extend(candidates)
+        text = None
+        for handler, raw in entries:
             try:
-                topic, payload = await asyncio.wait_for(self._message_queue.get(), timeout=1.0)
-                await self._route(topic, payload)
-            except asyncio.TimeoutError:
-                continue
+                if raw or not isinstance(payload, bytes):
+                    await handler(topic, payload)
+                else:
+                    if text is None:
+                        text = payload.decode("utf-8")
+                    await handler(topic, text)
+            except Exception as e:
+                logger.error("Error handling message on topic %s: %s", topic, e)
 
-    async def _route(self, topic: str, payload: str):
+    @staticmethod
+    def _compile_wildcard(pattern: str) -> re.Pattern:
         """
-        Route messages to registered handlers, matching exact topics first,
-        then MQTT-style wildcard patterns.
+        Convert an MQTT wildcard pattern to a compiled regex: '+' matches
+        one topic level and '#' any remainder. Other characters are literal.
         """
-        if topic in self._handlers:
-            await self._handlers[topic](topic, payload)
-            return
-        for pattern, handler in self._wildcard_handlers.items():
-            # Convert MQTT wildcard to regex
-            regex = '^' + pattern.replace('+', '[^/]+').replace('#', '.*') + '$'
-            if re.match(regex, topic):
-                await handler(topic, payload)
-                return
+        regex = re.escape(pattern).replace(r'\+', '[^/]+').replace(r'\#', '.*')
+        return re.compile(regex)
 
     async def _reconnect(self):
         """
         Automatic reconnection with exponential backoff.
         """
-        delay = 1
+        delay = self.RECONNECT_MIN_DELAY
         while self._state != ConnectionState.CONNECTED:
             logger.info("Reconnecting to MQTT broker in %s seconds...", delay)
             await asyncio.sleep(delay)
             success = await self.connect()
             if success:
                 return
-            delay = min(delay * 2, 60)
+            delay = min(delay * 2, self.RECONNECT_MAX_DELAY)
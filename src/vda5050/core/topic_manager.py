@@ -14,6 +14,8 @@ class TopicManager:
         "instantActions",
         "visualization"
     ]
+    # Set view of MESSAGE_TYPES for constant-time membership checks
+    _MESSAGE_TYPE_SET = frozenset(MESSAGE_TYPES)
 
     def __init__(
         self,
@@ -27,6 +29,11 @@ class TopicManager:
         self.major_version = version.split(".")[0]  # “2”
         self.manufacturer = manufacturer  # AGV vendor
         self.serial_number = serial_number  # AGV identifier
+        # This client's own topics never change, so build them once
+        base = self._base_topic()
+        self._publish_topics = {
+            message_type: f"{base}/{message_type}" for message_type in self.MESSAGE_TYPES
+        }
 
     def _base_topic(self) -> str:
         # Base prefix for this client’s own messages
@@ -37,10 +44,11 @@ class TopicManager:
         Return the MQTT topic for publishing a VDA5050 message from THIS client.
         e.g., "uagv/v2/RobotCorp/robot001/state"
         """
-        if message_type not in self.MESSAGE_TYPES:
-            raise ValueError(f"Invalid message type: {message_type}")
-        # Append messageType to base topic
-        return f"{self._base_topic()}/{message_type}"
+        # Look up the precomputed topic for this messageType
+        try:
+            return self._publish_topics[message_type]
+        except KeyError:
+            raise ValueError(f"Invalid message type: {message_type}") from None
 
     def get_target_topic(
         self,
@@ -52,7 +60,7 @@ class TopicManager:
         Return the MQTT topic for sending a message to a specific AGV.
         e.g., "uagv/v2/VendorX/robot123/order"
         """
-        if message_type not in self.MESSAGE_TYPES:
+        if message_type not in self._MESSAGE_TYPE_SET:
             raise ValueError(f"Invalid message type: {message_type}")
         # Build topic for target AGV
         return f"{self.interface}/v{self.major_version}/{target_manufacturer}/{target_serial}/{message_type}"
@@ -67,7 +75,7 @@ class TopicManager:
         Return the MQTT topic for subscribing to messages.
         Use '+' wildcards for multiple manufacturers or serials.
         """
-        if message_type not in self.MESSAGE_TYPES:
+        if message_type not in self._MESSAGE_TYPE_SET:
             raise ValueError(f"Invalid message type: {message_type}")
         # Use '+' if wildcard requested
         man = "+" if all_manufacturers else self.manufacturer
@@ -93,7 +101,7 @@ class TopicManager:
             raise ValueError(f"Invalid version tag: {version_tag}")
 
         version = version_tag[1:]
-        if msg_type not in self.MESSAGE_TYPES:
+        if msg_type not in self._MESSAGE_TYPE_SET:
             raise ValueError(f"Unknown message type: {msg_type}")
 
         # Return structured info
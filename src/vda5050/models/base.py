@@ -53,13 +53,15 @@ class VDA5050Message(BaseModel):
     def to_mqtt_payload(self) -> str:
         """
         Convert the message to a JSON payload for MQTT.
+        Serialized directly by pydantic-core, using the schema's field aliases.
         """
-        return self.model_dump_json(exclude_none=True)
+        return self.model_dump_json(by_alias=True, exclude_none=True)
     
     @classmethod
-    def from_mqtt_payload(cls, payload: str):
+    def from_mqtt_payload(cls, payload: Union[str, bytes]):
         """
         Create a message from a JSON payload received from MQTT.
+        Raw bytes are parsed directly, without decoding to str first.
         """
         return cls.model_validate_json(payload)
 
@@ -1,8 +1,8 @@
-import json
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional
 import jsonschema
+from pydantic_core import from_json
 from jsonschema import ValidationError as JSONSchemaValidationError
 from ..utils.exceptions import ValidationError as VDA5050ValidationError
 
@@ -17,32 +17,54 @@ class MessageValidator:
         # Default to src/vda5050/validation/schemas
         self.schema_dir = schema_dir or Path(__file__).parent / "schemas"
         self._schema_cache: Dict[str, Dict] = {}
+        self._validator_cache: Dict[str, Any] = {}
     
     def _load_schema(self, message_type: str) -> Dict[str, Any]:
         """Load and cache JSON schema for a message type."""
         if message_type not in self._schema_cache:
             schema_path = self.schema_dir / f"{message_type}.schema.json"
-            if not schema_path.exists():
+            # Read directly and treat a missing file as the error, rather
+            # than probing the filesystem with exists() first
+            try:
+                raw = schema_path.read_bytes()
+            except FileNotFoundError:
                 raise VDA5050ValidationError(
                     f"Schema for '{message_type}' not found at {schema_path}"
-                )
-            with open(schema_path, 'r') as f:
-                self._schema_cache[message_type] = json.load(f)
+                ) from None
+            # Parse the raw bytes with pydantic-core, skipping the text decode
+            self._schema_cache[message_type] = from_json(raw)
         return self._schema_cache[message_type]
     
-    def validate_message(self, message_type: str, payload: str | dict) -> bool:
+    def _get_validator(self, message_type: str) -> Any:
+        """Build, check and cache the jsonschema validator for a message type."""
+        validator = self._validator_cache.get(message_type)
+        if validator is None:
+            schema = self._load_schema(message_type)
+            validator_cls = jsonschema.validators.validator_for(schema)
+            validator_cls.check_schema(schema)
+            validator = self._validator_cache[message_type] = validator_cls(schema)
+        return validator
+    
+    def validate_message(self, message_type: str, payload: str | bytes | dict) -> bool:
         """
         Validate a VDA5050 message against its JSON schema.
         
+        String and bytes payloads are parsed by pydantic-core rather than the
+        stdlib json module, which is several times faster for large messages.
+        
         Raises VDA5050ValidationError on JSON or schema validation failure.
         """
         try:
-            schema = self._load_schema(message_type)
-            data = json.loads(payload) if isinstance(payload, str) else payload
-            jsonschema.validate(instance=data, schema=schema)
-            logger.debug(f"Message '{message_type}' validation successful")
+            validator = self._get_validator(message_type)
+            data = from_json(payload) if isinstance(payload, (str, bytes)) else payload
+            # Same error selection as jsonschema.validate(), without re-checking
+            # the schema and rebuilding the validator on every call
+            error = jsonschema.exceptions.best_match(validator.iter_errors(data))
+            if error is not None:
+                raise error
+            logger.debug("Message '%s' validation successful", message_type)
             return True
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             raise VDA5050ValidationError(f"Invalid JSON for '{message_type}': {e}")
         except JSONSchemaValidationError as e:
             msg = f"Schema validation failed for '{message_type}': {e.message}"
@@ -6,6 +6,7 @@ import pytest
 import asyncio
 import sys
 import os
+from types import SimpleNamespace
 
 # Add src directory to Python path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
@@ -19,3 +20,35 @@ def event_loop():
     loop = asyncio.get_event_loop_policy().new_event_loop()
     yield loop
     loop.close()
+
+@pytest.fixture(scope="session")
+def vda_models():
+    """
+    Namespace of the VDA5050 message models, imported on first use.
+
+    Tests that only need plain dict payloads never pay for building the
+    pydantic schemas; tests that need the models opt in via this fixture.
+    """
+    from vda5050.models.connection import Connection, ConnectionState
+    from vda5050.models.factsheet import Factsheet
+    from vda5050.models.instant_action import InstantActions
+    from vda5050.models.order import Order
+    from vda5050.models.state import OperatingMode, State
+    from vda5050.models.visualization import Visualization
+
+    return SimpleNamespace(
+        Connection=Connection,
+        ConnectionState=ConnectionState,
+        Factsheet=Factsheet,
+        InstantActions=InstantActions,
+        Order=Order,
+        OperatingMode=OperatingMode,
+        State=State,
+        Visualization=Visualization,
+    )
+
+@pytest.fixture
+def error_caplog(caplog):
+    """caplog capturing ERROR and above, for tests that check logged failures."""
+    caplog.set_level("ERROR")
+    return caplog
@@ -0,0 +1,28 @@
+"""
+Pytest configuration for VDA5050 integration tests.
+"""
+
+import pytest_asyncio
+
+from vda5050.core.mqtt_abstraction import MQTTAbstraction
+
+BROKER_URL = "127.0.0.1"
+BROKER_PORT = 1883
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def mqtt_transport():
+    """
+    Single broker connection shared by every client in the integration tests.
+
+    Clients constructed with ``transport=mqtt_transport`` reuse this connection
+    instead of opening their own, so the CONNECT/CONNACK handshake is paid once
+    per session.
+    """
+    transport = MQTTAbstraction(
+        broker_url=BROKER_URL,
+        broker_port=BROKER_PORT,
+        client_id="vda5050-integration"
+    )
+    assert await transport.connect(), f"MQTT broker not reachable at {BROKER_URL}:{BROKER_PORT}"
+    yield transport
+    await transport.disconnect()
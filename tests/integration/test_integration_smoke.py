@@ -28,6 +28,7 @@ CLIENT CONFIGURATION:
 - MasterControlClient: manufacturer="MasterControl", serial="MC001" 
 - Wildcard subscriptions: MasterControlClient subscribes to all manufacturers/serials
 - Retained messages: Connection state and factsheet use MQTT retain flag
+- Shared transport: both clients reuse one session-wide broker connection
 - Message validation: All messages validated against VDA5050 JSON schemas
 
 NETWORK REQUIREMENTS:
@@ -52,25 +53,24 @@ AGV and Master Control systems.
 """
 
 import asyncio
+import os
 import pytest
 import logging
-from vda5050.clients.agv import AGVClient
-from vda5050.clients.master_control import MasterControlClient
-from vda5050.models.factsheet import Factsheet
-from vda5050.models.state import State
-from vda5050.models.order import Order
-from vda5050.models.instant_action import InstantActions
-from vda5050.models.connection import ConnectionState
-from vda5050.models.state import OperatingMode
 
-logging.basicConfig(level=logging.INFO)
+try:
+    from asyncio import timeout as _deadline  # Python 3.11+
+except ImportError:
+    from async_timeout import timeout as _deadline
+
+# Quiet by default; set VDA5050_TEST_LOG_LEVEL=INFO to follow the message flow
+logging.basicConfig(level=os.environ.get("VDA5050_TEST_LOG_LEVEL", "WARNING"))
 LOGGER = logging.getLogger("integration")
 
 BROKER_URL = "127.0.0.1"
 BROKER_PORT = 1883
 
-@pytest.mark.asyncio
-async def test_integration_smoke():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_integration_smoke(vda_models, mqtt_transport):
     """
     Integration smoke test verifying the complete VDA5050 message flow
     across all layers: schema validation, Pydantic parsing, MQTT transport, and callback invocation.
@@ -83,6 +83,15 @@ async def test_integration_smoke():
     5. InstantActions
     6. Connection OFFLINE
     """
+    # Clients and models are imported here rather than at module scope so that
+    # collecting the test suite does not build the pydantic schemas up front.
+    from vda5050.clients.agv import AGVClient
+    from vda5050.clients.master_control import MasterControlClient
+    Factsheet = vda_models.Factsheet
+    State = vda_models.State
+    Order = vda_models.Order
+    InstantActions = vda_models.InstantActions
+    OperatingMode = vda_models.OperatingMode
     
     # ============================================================================
     # TEST SETUP: Synchronization events and message storage
@@ -106,7 +115,7 @@ async def test_integration_smoke():
     serial_number = "AGV001"
     
     # ============================================================================
-    # PHASE 1: AGV CLIENT SETUP AND CONNECTION
+    # PHASE 1: AGV CLIENT SETUP
     # ============================================================================
     # 1. Start AGVClient
     agv = AGVClient(
@@ -114,7 +123,8 @@ async def test_integration_smoke():
         manufacturer=manufacturer,
         serial_number=serial_number,
         broker_port=BROKER_PORT,
-        validate_messages=True
+        validate_messages=True,
+        transport=mqtt_transport
     )
     
     # Register AGV callbacks with proper signatures
@@ -123,13 +133,13 @@ async def test_integration_smoke():
         nonlocal received_order
         received_order = order
         order_received.set()
-        LOGGER.info(f"AGV received Order: {order.orderId}")
+        LOGGER.info("AGV received Order: %s", order.orderId)
     
     def on_instant_action_received(action: InstantActions):
         nonlocal received_instant_action
         received_instant_action = action
         instant_action_received.set()
-        LOGGER.info(f"AGV received InstantActions: {action.actions[0].actionType}")
+        LOGGER.info("AGV received InstantActions: %s", action.actions[0].actionType)
     
     agv.on_order_received(on_order_received)
     agv.on_instant_action(on_instant_action_received)
@@ -174,14 +184,11 @@ async def test_integration_smoke():
         }
     )
     
-    # Connect AGV (this will publish ONLINE connection state and factsheet)
-    # Note: Connection state and factsheet are published as retained messages
-    agv._factsheet = factsheet  # Set factsheet before connect
-    await agv.connect()
-    LOGGER.info("AGV connected - should have published ONLINE connection state and factsheet")
+    # Store factsheet so it is published on connect
+    agv._factsheet = factsheet
     
     # ============================================================================
-    # PHASE 2: MASTER CONTROL CLIENT SETUP AND CONNECTION
+    # PHASE 2: MASTER CONTROL CLIENT SETUP AND CONCURRENT CONNECTION
     # ============================================================================
     # 2. Start MasterControlClient
     # Note: Uses wildcard subscriptions to receive messages from all AGVs
@@ -190,13 +197,14 @@ async def test_integration_smoke():
         manufacturer="MasterControl",
         serial_number="MC001",
         broker_port=BROKER_PORT,
-        validate_messages=True
+        validate_messages=True,
+        transport=mqtt_transport
     )
     
     # Register Master callbacks with proper signatures
     # These callbacks will be invoked when the Master receives messages from AGVs
     def on_connection_change(serial: str, connection_state: str):
-        LOGGER.info(f"Master received connection change: {serial} -> {connection_state}")
+        LOGGER.info("Master received connection change: %s -> %s", serial, connection_state)
         if connection_state == "ONLINE":
             connection_online_received.set()
         elif connection_state == "OFFLINE":
@@ -206,151 +214,158 @@ async def test_integration_smoke():
         nonlocal received_factsheet
         received_factsheet = factsheet_msg
         factsheet_received.set()
-        LOGGER.info(f"Master received Factsheet from {serial}: {factsheet_msg.typeSpecification.seriesName}")
+        LOGGER.info("Master received Factsheet from %s: %s", serial, factsheet_msg.typeSpecification.seriesName)
     
     def on_state_update_received(serial: str, state_msg: State):
         nonlocal received_state
         received_state = state_msg
         state_received.set()
-        LOGGER.info(f"Master received State from {serial}: operatingMode={state_msg.operatingMode}")
+        LOGGER.info("Master received State from %s: operatingMode=%s", serial, state_msg.operatingMode)
     
     master.on_connection_change(on_connection_change)
     master.on_factsheet(on_factsheet_received)
     master.on_state_update(on_state_update_received)
     
-    await master.connect()
-    LOGGER.info("Master connected")
-    
-    # ============================================================================
-    # PHASE 3: VALIDATE AGV → MASTER MESSAGE FLOW
-    # ============================================================================
-    # Wait for AGV → Master messages (Connection ONLINE and Factsheet)
-    # These are retained messages, so Master receives them even after AGV connected
-    LOGGER.info("Waiting for Connection ONLINE message...")
-    await asyncio.wait_for(connection_online_received.wait(), timeout=10.0)
-    assert connection_online_received.is_set(), "Connection ONLINE message not received"
-    
-    LOGGER.info("Waiting for Factsheet message...")
-    await asyncio.wait_for(factsheet_received.wait(), timeout=10.0)
-    assert factsheet_received.is_set(), "Factsheet message not received"
-    assert received_factsheet is not None, "Factsheet message not stored"
-    assert received_factsheet.serialNumber == serial_number, "Factsheet serial number mismatch"
-    
-    # ============================================================================
-    # PHASE 4: AGV STATE UPDATE
-    # ============================================================================
-    # 3. AGV sends State update
-    state = State(
-        headerId=2,
-        timestamp="2025-01-01T12:00:01Z",
-        version="2.1.0",
-        manufacturer=manufacturer,
-        serialNumber=serial_number,
-        orderId="",
-        orderUpdateId=0,
-        lastNodeId="",
-        lastNodeSequenceId=0,
-        nodeStates=[],
-        edgeStates=[],
-        driving=False,
-        actionStates=[],
-        batteryState={"batteryCharge": 100.0, "charging": False},
-        operatingMode="AUTOMATIC",
-        errors=[],
-        safetyState={"eStop": "NONE", "fieldViolation": False}
-    )
-    
-    LOGGER.info("AGV sending State update...")
-    await agv.send_state(state)
-    
-    LOGGER.info("Waiting for State message...")
-    await asyncio.wait_for(state_received.wait(), timeout=10.0)
-    assert state_received.is_set(), "State message not received"
-    assert received_state is not None, "State message not stored"
-    assert received_state.operatingMode == OperatingMode.AUTOMATIC, "State operating mode mismatch"
-    
-    # ============================================================================
-    # PHASE 5: MASTER → AGV MESSAGE FLOW (ORDER)
-    # ============================================================================
-    # 4. Master sends an Order to AGV
-    order = Order(
-        headerId=3,
-        timestamp="2025-01-01T12:00:02Z",
-        version="2.1.0",
-        manufacturer=manufacturer,
-        serialNumber=serial_number,
-        orderId="Order123",
-        orderUpdateId=1,
-        nodes=[{
-            "nodeId": "N1",
-            "sequenceId": 1,
-            "released": True,
-            "nodePosition": {"x": 0.0, "y": 0.0, "theta": 0.0, "mapId": "test_map"},
-            "nodeDescription": "Start position",
-            "actions": []
-        }],
-        edges=[{
-            "edgeId": "E1",
-            "sequenceId": 1,
-            "released": True,
-            "startNodeId": "N1",
-            "endNodeId": "N1",
-            "trajectory": {"degree": 3, "knotVector": [0.0, 0.0, 0.0, 1.0, 1.0, 1.0], "controlPoints": []},
-            "actions": []
-        }]
-    )
-    
-    LOGGER.info("Master sending Order to AGV...")
-    await master.send_order(manufacturer, serial_number, order)
-    
-    LOGGER.info("Waiting for Order message...")
-    await asyncio.wait_for(order_received.wait(), timeout=10.0)
-    assert order_received.is_set(), "Order message not received"
-    assert received_order is not None, "Order message not stored"
-    assert received_order.orderId == "Order123", "Order ID mismatch"
-    assert len(received_order.nodes) == 1, "Order nodes count mismatch"
-    
-    # ============================================================================
-    # PHASE 6: MASTER → AGV MESSAGE FLOW (INSTANT ACTIONS)
-    # ============================================================================
-    # 5. Master sends an InstantActions to AGV
-    instant_action = InstantActions(
-        headerId=4,
-        timestamp="2025-01-01T12:00:03Z",
-        version="2.1.0",
-        manufacturer=manufacturer,
-        serialNumber=serial_number,
-        actions=[{
-            "actionId": "A1",
-            "actionType": "TEST",
-            "blockingType": "NONE",
-            "actionParameters": []
-        }]
-    )
-    
-    LOGGER.info("Master sending InstantActions to AGV...")
-    await master.send_instant_action(manufacturer, serial_number, instant_action)
-    
-    LOGGER.info("Waiting for InstantActions message...")
-    await asyncio.wait_for(instant_action_received.wait(), timeout=10.0)
-    assert instant_action_received.is_set(), "InstantActions message not received"
-    assert received_instant_action is not None, "InstantActions message not stored"
-    assert len(received_instant_action.actions) == 1, "InstantActions actions count mismatch"
-    assert received_instant_action.actions[0].actionType == "TEST", "InstantActions type mismatch"
-    
-    # ============================================================================
-    # PHASE 7: AGV DISCONNECTION AND CLEANUP
-    # ============================================================================
-    # 6. AGV disconnects → Master should receive OFFLINE connection state
-    LOGGER.info("AGV disconnecting...")
-    await agv.disconnect()  # This will publish OFFLINE connection state
-    
-    LOGGER.info("Waiting for Connection OFFLINE message...")
-    await asyncio.wait_for(connection_offline_received.wait(), timeout=10.0)
-    assert connection_offline_received.is_set(), "Connection OFFLINE message not received"
-    
-    # Cleanup
-    await master.disconnect()
+    # Connect both clients concurrently. The AGV publishes its ONLINE connection
+    # state and factsheet on connect; both are retained, so the master receives
+    # them regardless of which subscription completes first.
+    agv_connected, master_connected = await asyncio.gather(agv.connect(), master.connect())
+    assert agv_connected and master_connected, "Client connection failed"
+    LOGGER.info("AGV and Master connected")
+    
+    # All message-flow phases share one overall deadline instead of a
+    # separate wait_for() timeout per event.
+    async with _deadline(60):
+        # ============================================================================
+        # PHASE 3: VALIDATE AGV → MASTER MESSAGE FLOW
+        # ============================================================================
+        # Wait for AGV → Master messages (Connection ONLINE and Factsheet)
+        # These are retained messages, so Master receives them even after AGV connected
+        LOGGER.info("Waiting for Connection ONLINE message...")
+        await connection_online_received.wait()
+        assert connection_online_received.is_set(), "Connection ONLINE message not received"
+    
+        LOGGER.info("Waiting for Factsheet message...")
+        await factsheet_received.wait()
+        assert factsheet_received.is_set(), "Factsheet message not received"
+        assert received_factsheet is not None, "Factsheet message not stored"
+        assert received_factsheet.serialNumber == serial_number, "Factsheet serial number mismatch"
+    
+        # ============================================================================
+        # PHASE 4: AGV STATE UPDATE
+        # ============================================================================
+        # 3. AGV sends State update
+        state = State(
+            headerId=2,
+            timestamp="2025-01-01T12:00:01Z",
+            version="2.1.0",
+            manufacturer=manufacturer,
+            serialNumber=serial_number,
+            orderId="",
+            orderUpdateId=0,
+            lastNodeId="",
+            lastNodeSequenceId=0,
+            nodeStates=[],
+            edgeStates=[],
+            driving=False,
+            actionStates=[],
+            batteryState={"batteryCharge": 100.0, "charging": False},
+            operatingMode="AUTOMATIC",
+            errors=[],
+            safetyState={"eStop": "NONE", "fieldViolation": False}
+        )
+    
+        LOGGER.info("AGV sending State update at QoS 0...")
+        await agv.send_state(state, qos=0)
+    
+        LOGGER.info("Waiting for State message...")
+        await state_received.wait()
+        assert state_received.is_set(), "State message not received"
+        assert received_state is not None, "State message not stored"
+        assert received_state.operatingMode == OperatingMode.AUTOMATIC, "State operating mode mismatch"
+    
+        # ============================================================================
+        # PHASE 5: MASTER → AGV MESSAGE FLOW (ORDER)
+        # ============================================================================
+        # 4. Master sends an Order to AGV
+        order = Order(
+            headerId=3,
+            timestamp="2025-01-01T12:00:02Z",
+            version="2.1.0",
+            manufacturer=manufacturer,
+            serialNumber=serial_number,
+            orderId="Order123",
+            orderUpdateId=1,
+            nodes=[{
+                "nodeId": "N1",
+                "sequenceId": 1,
+                "released": True,
+                "nodePosition": {"x": 0.0, "y": 0.0, "theta": 0.0, "mapId": "test_map"},
+                "nodeDescription": "Start position",
+                "actions": []
+            }],
+            edges=[{
+                "edgeId": "E1",
+                "sequenceId": 1,
+                "released": True,
+                "startNodeId": "N1",
+                "endNodeId": "N1",
+                "trajectory": {"degree": 3, "knotVector": [0.0, 0.0, 0.0, 1.0, 1.0, 1.0], "controlPoints": []},
+                "actions": []
+            }]
+        )
+    
+        LOGGER.info("Master sending Order to AGV...")
+        await master.send_order(manufacturer, serial_number, order)
+    
+        LOGGER.info("Waiting for Order message...")
+        await order_received.wait()
+        assert order_received.is_set(), "Order message not received"
+        assert received_order is not None, "Order message not stored"
+        assert received_order.orderId == "Order123", "Order ID mismatch"
+        assert len(received_order.nodes) == 1, "Order nodes count mismatch"
+    
+        # ============================================================================
+        # PHASE 6: MASTER → AGV MESSAGE FLOW (INSTANT ACTIONS)
+        # ============================================================================
+        # 5. Master sends an InstantActions to AGV
+        instant_action = InstantActions(
+            headerId=4,
+            timestamp="2025-01-01T12:00:03Z",
+            version="2.1.0",
+            manufacturer=manufacturer,
+            serialNumber=serial_number,
+            actions=[{
+                "actionId": "A1",
+                "actionType": "TEST",
+                "blockingType": "NONE",
+                "actionParameters": []
+            }]
+        )
+    
+        LOGGER.info("Master sending InstantActions to AGV...")
+        await master.send_instant_action(manufacturer, serial_number, instant_action)
+    
+        LOGGER.info("Waiting for InstantActions message...")
+        await instant_action_received.wait()
+        assert instant_action_received.is_set(), "InstantActions message not received"
+        assert received_instant_action is not None, "InstantActions message not stored"
+        assert len(received_instant_action.actions) == 1, "InstantActions actions count mismatch"
+        assert received_instant_action.actions[0].actionType == "TEST", "InstantActions type mismatch"
+    
+        # ============================================================================
+        # PHASE 7: AGV DISCONNECTION AND CLEANUP
+        # ============================================================================
+        # 6. AGV disconnects → Master should receive OFFLINE connection state
+        LOGGER.info("AGV disconnecting...")
+        await agv.disconnect()  # This will publish OFFLINE connection state
+    
+        LOGGER.info("Waiting for Connection OFFLINE message...")
+        await connection_offline_received.wait()
+        assert connection_offline_received.is_set(), "Connection OFFLINE message not received"
+    
+        # Cleanup
+        await master.disconnect()
     
     # ============================================================================
     # FINAL VALIDATION: COMPREHENSIVE MESSAGE FLOW VERIFICATION
@@ -0,0 +1,26 @@
+"""
+Shared fixtures for the client unit tests.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+
+class _FakeMQTT:
+    """
+    Stand-in for MQTTAbstraction exposing only the calls the clients make.
+    Cheaper to build per test than a Mock specced on the whole class.
+    """
+
+    def __init__(self):
+        self.subscribe = AsyncMock(return_value=None)
+        self.subscribe_many = AsyncMock(return_value=None)
+        self.unsubscribe_many = AsyncMock(return_value=None)
+        self.publish = AsyncMock(return_value=True)
+        self.disconnect = AsyncMock(return_value=None)
+
+
+@pytest.fixture
+def mock_mqtt():
+    """Fake MQTT transport so subscribe and publish calls are captured."""
+    return _FakeMQTT()
@@ -5,55 +5,67 @@ This module provides reusable test data and utilities for testing all VDA5050 mo
 """
 
 from datetime import datetime
-from typing import Any, Dict, List
-from copy import deepcopy
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+
+if TYPE_CHECKING:
+    from vda5050.models.connection import Connection
 
 
 # =============================================================================
 # Timestamp Utilities
 # =============================================================================
 
-def get_valid_timestamps() -> List[str]:
-    """Return list of valid ISO-8601 timestamp formats."""
-    return [
-        "2025-10-01T12:00:00Z",
-        "2025-10-01T12:00:00.123Z",
-        "2025-10-01T12:00:00.123456Z",
-        "2025-10-01T12:00:00+00:00",
-        "2025-10-01T12:00:00-05:00",
-        "1991-03-11T11:40:03.12Z",
-    ]
-
-
-def get_invalid_timestamps() -> List[Any]:
-    """Return list of invalid timestamp values that Pydantic cannot parse."""
-    return [
-        "12:00:00",  # Time only
-        "2025/10/01 12:00:00",  # Wrong separators
-        "invalid-timestamp",
-        "",  # Empty string
-        None,  # None
-        "2025-13-01T12:00:00Z",  # Invalid month
-        "2025-10-32T12:00:00Z",  # Invalid day
-        "not a date",
-    ]
+VALID_TIMESTAMPS: Tuple[str, ...] = (
+    "2025-10-01T12:00:00Z",
+    "2025-10-01T12:00:00.123Z",
+    "2025-10-01T12:00:00.123456Z",
+    "2025-10-01T12:00:00+00:00",
+    "2025-10-01T12:00:00-05:00",
+    "1991-03-11T11:40:03.12Z",
+)
+
+INVALID_TIMESTAMPS: Tuple[Any, ...] = (
+    "12:00:00",  # Time only
+    "2025/10/01 12:00:00",  # Wrong separators
+    "invalid-timestamp",
+    "",  # Empty string
+    None,  # None
+    "2025-13-01T12:00:00Z",  # Invalid month
+    "2025-10-32T12:00:00Z",  # Invalid day
+    "not a date",
+)
+
+
+def get_valid_timestamps() -> Tuple[str, ...]:
+    """Return valid ISO-8601 timestamp formats."""
+    return VALID_TIMESTAMPS
+
+
+def get_invalid_timestamps() -> Tuple[Any, ...]:
+    """Return invalid timestamp values that Pydantic cannot parse."""
+    return INVALID_TIMESTAMPS
 
 
 # =============================================================================
 # VDA5050Message Base Payload
 # =============================================================================
 
+_HEADER_TEMPLATE = {
+    "headerId": 1,
+    "timestamp": "2025-10-01T12:00:00Z",
+    "version": "2.1.0",
+    "manufacturer": "TestManufacturer",
+    "serialNumber": "AGV001",
+}
+
+
 def make_vda5050_header(**overrides) -> Dict[str, Any]:
     """Create minimal valid VDA5050Message header fields."""
-    header = {
-        "headerId": 1,
-        "timestamp": "2025-10-01T12:00:00Z",
-        "version": "2.1.0",
-        "manufacturer": "TestManufacturer",
-        "serialNumber": "AGV001",
-    }
-    header.update(overrides)
-    return header
+    return {**_HEADER_TEMPLATE, **overrides}
 
 
 # =============================================================================
@@ -68,6 +80,23 @@ def make_minimal_connection(**overrides) -> Dict[str, Any]:
     return payload
 
 
+def build_connection_trusted(payload: Dict[str, Any]) -> "Connection":
+    """
+    Build a Connection from a known-good payload without running validation.
+    
+    Only for tests that need a message object as scaffolding. Timestamp and
+    enum values are converted to their field types so the result serializes
+    exactly like a validated instance.
+    """
+    # Imported here so the payload helpers above stay free of the models
+    from vda5050.models.connection import Connection, ConnectionState
+
+    fields = dict(payload)
+    fields["timestamp"] = datetime.fromisoformat(fields["timestamp"].replace("Z", "+00:00"))
+    fields["connectionState"] = ConnectionState(fields["connectionState"])
+    return Connection.model_construct(**fields)
+
+
 def get_connection_required_fields() -> List[str]:
     """Return list of required fields for Connection model."""
     return ["headerId", "timestamp", "version", "manufacturer", "serialNumber", "connectionState"]
@@ -77,39 +106,46 @@ def get_connection_required_fields() -> List[str]:
 # InstantActions Model Fixtures
 # =============================================================================
 
-def make_minimal_instant_actions(**overrides) -> Dict[str, Any]:
-    """Create minimal valid InstantActions payload."""
-    payload = make_vda5050_header()
-    payload["actions"] = [
+# Read-only; the default actions list is shared between payloads, so replace
+# it rather than mutating it in place
+_INSTANT_ACTIONS_TEMPLATE: Mapping[str, Any] = MappingProxyType({
+    **_HEADER_TEMPLATE,
+    "actions": [
         {
             "actionId": "action_001",
             "actionType": "testAction",
             "blockingType": "NONE",
         }
-    ]
-    payload.update(overrides)
-    return payload
+    ],
+})
+
+
+def make_minimal_instant_actions(**overrides) -> Dict[str, Any]:
+    """Create minimal valid InstantActions payload."""
+    return {**_INSTANT_ACTIONS_TEMPLATE, **overrides}
+
+
+_ACTION_TEMPLATE = {
+    "actionId": "action_001",
+    "actionType": "pick",
+    "blockingType": "SOFT",
+}
 
 
 def make_action(**overrides) -> Dict[str, Any]:
     """Create minimal valid Action object."""
-    action = {
-        "actionId": "action_001",
-        "actionType": "pick",
-        "blockingType": "SOFT",
-    }
-    action.update(overrides)
-    return action
+    return {**_ACTION_TEMPLATE, **overrides}
+
+
+_ACTION_PARAMETER_TEMPLATE = {
+    "key": "duration",
+    "value": 5.0,
+}
 
 
 def make_action_parameter(**overrides) -> Dict[str, Any]:
     """Create minimal valid ActionParameter object."""
-    param = {
-        "key": "duration",
-        "value": 5.0,
-    }
-    param.update(overrides)
-    return param
+    return {**_ACTION_PARAMETER_TEMPLATE, **overrides}
 
 
 # =============================================================================
@@ -118,52 +154,39 @@ def make_action_parameter(**overrides) -> Dict[str, Any]:
 
 def make_minimal_visualization(**overrides) -> Dict[str, Any]:
     """Create minimal valid Visualization payload."""
-    payload = make_vda5050_header()
-    payload.update(overrides)
-    return payload
+    return {**_HEADER_TEMPLATE, **overrides}
+
+
+_AGV_POSITION_TEMPLATE = {
+    "x": 10.5,
+    "y": 20.3,
+    "theta": 1.57,
+    "mapId": "warehouse_floor1",
+    "positionInitialized": True,
+}
 
 
 def make_agv_position(**overrides) -> Dict[str, Any]:
     """Create minimal valid AgvPosition object."""
-    position = {
-        "x": 10.5,
-        "y": 20.3,
-        "theta": 1.57,
-        "mapId": "warehouse_floor1",
-        "positionInitialized": True,
-    }
-    position.update(overrides)
-    return position
+    return {**_AGV_POSITION_TEMPLATE, **overrides}
+
+
+_VELOCITY_TEMPLATE = {
+    "vx": 1.5,
+    "vy": 0.0,
+    "omega": 0.1,
+}
 
 
 def make_velocity(**overrides) -> Dict[str, Any]:
     """Create minimal valid Velocity object."""
-    velocity = {
-        "vx": 1.5,
-        "vy": 0.0,
-        "omega": 0.1,
-    }
-    velocity.update(overrides)
-    return velocity
+    return {**_VELOCITY_TEMPLATE, **overrides}
 
 
 # =============================================================================
 # Order Model Fixtures
 # =============================================================================
 
-def make_minimal_order(**overrides) -> Dict[str, Any]:
-    """Create minimal valid Order payload."""
-    payload = make_vda5050_header()
-    payload.update({
-        "orderId": "order_001",
-        "orderUpdateId": 0,
-        "nodes": [make_node(nodeId="node_1", sequenceId=0)],
-        "edges": [],
-    })
-    payload.update(overrides)
-    return payload
-
-
 def make_node(**overrides) -> Dict[str, Any]:
     """Create minimal valid Node object."""
     node = {
@@ -176,15 +199,47 @@ def make_node(**overrides) -> Dict[str, Any]:
     return node
 
 
+# Read-only; the default nodes/edges lists are shared between payloads, so
+# replace them rather than mutating them in place
+_ORDER_TEMPLATE: Mapping[str, Any] = MappingProxyType({
+    **_HEADER_TEMPLATE,
+    "orderId": "order_001",
+    "orderUpdateId": 0,
+    "nodes": [make_node(nodeId="node_1", sequenceId=0)],
+    "edges": [],
+})
+
+_REQUIRED_ORDER_FIELDS: Tuple[str, ...] = (
+    "headerId", "timestamp", "version", "manufacturer", "serialNumber",
+    "orderId", "orderUpdateId", "nodes", "edges",
+)
+
+
+def make_minimal_order(**overrides) -> Dict[str, Any]:
+    """Create minimal valid Order payload."""
+    return {**_ORDER_TEMPLATE, **overrides}
+
+
+def make_order_missing(field: str) -> Dict[str, Any]:
+    """Create a minimal Order payload with one top-level field left out."""
+    return {k: v for k, v in _ORDER_TEMPLATE.items() if k != field}
+
+
+def get_order_required_fields() -> Tuple[str, ...]:
+    """Return the required top-level fields of the Order model."""
+    return _REQUIRED_ORDER_FIELDS
+
+
+_NODE_POSITION_TEMPLATE = {
+    "x": 10.5,
+    "y": 20.3,
+    "mapId": "warehouse_floor1",
+}
+
+
 def make_node_position(**overrides) -> Dict[str, Any]:
     """Create minimal valid NodePosition object."""
-    position = {
-        "x": 10.5,
-        "y": 20.3,
-        "mapId": "warehouse_floor1",
-    }
-    position.update(overrides)
-    return position
+    return {**_NODE_POSITION_TEMPLATE, **overrides}
 
 
 def make_edge(**overrides) -> Dict[str, Any]:
@@ -215,81 +270,65 @@ def make_trajectory(**overrides) -> Dict[str, Any]:
     return trajectory
 
 
+_CONTROL_POINT_TEMPLATE = {
+    "x": 5.0,
+    "y": 3.0,
+}
+
+
 def make_control_point(**overrides) -> Dict[str, Any]:
     """Create minimal valid ControlPoint object."""
-    point = {
-        "x": 5.0,
-        "y": 3.0,
-    }
-    point.update(overrides)
-    return point
+    return {**_CONTROL_POINT_TEMPLATE, **overrides}
 
 
 # =============================================================================
 # State Model Fixtures
 # =============================================================================
 
-def make_minimal_state(**overrides) -> Dict[str, Any]:
-    """Create minimal valid State payload."""
-    payload = make_vda5050_header()
-    payload.update({
-        "orderId": "order_001",
-        "orderUpdateId": 0,
-        "lastNodeId": "node_001",
-        "lastNodeSequenceId": 0,
-        "driving": False,
-        "operatingMode": "AUTOMATIC",
-        "nodeStates": [],
-        "edgeStates": [],
-        "actionStates": [],
-        "batteryState": make_battery_state(),
-        "errors": [],
-        "safetyState": make_safety_state(),
-    })
-    payload.update(overrides)
-    return payload
+_NODE_STATE_TEMPLATE = {
+    "nodeId": "node_001",
+    "sequenceId": 0,
+    "released": True,
+}
 
 
 def make_node_state(**overrides) -> Dict[str, Any]:
     """Create minimal valid NodeState object."""
-    node_state = {
-        "nodeId": "node_001",
-        "sequenceId": 0,
-        "released": True,
-    }
-    node_state.update(overrides)
-    return node_state
+    return {**_NODE_STATE_TEMPLATE, **overrides}
+
+
+_EDGE_STATE_TEMPLATE = {
+    "edgeId": "edge_001",
+    "sequenceId": 1,
+    "released": True,
+}
 
 
 def make_edge_state(**overrides) -> Dict[str, Any]:
     """Create minimal valid EdgeState object."""
-    edge_state = {
-        "edgeId": "edge_001",
-        "sequenceId": 1,
-        "released": True,
-    }
-    edge_state.update(overrides)
-    return edge_state
+    return {**_EDGE_STATE_TEMPLATE, **overrides}
+
+
+_ACTION_STATE_TEMPLATE = {
+    "actionId": "action_001",
+    "actionStatus": "WAITING",
+}
 
 
 def make_action_state(**overrides) -> Dict[str, Any]:
     """Create minimal valid ActionState object."""
-    action_state = {
-        "actionId": "action_001",
-        "actionStatus": "WAITING",
-    }
-    action_state.update(overrides)
-    return action_state
+    return {**_ACTION_STATE_TEMPLATE, **overrides}
+
+
+_BATTERY_STATE_TEMPLATE = {
+    "batteryCharge": 80.0,
+    "charging": False,
+}
 
 
 def make_battery_state(**overrides) -> Dict[str, Any]:
     """Create minimal valid BatteryState object."""
-    battery = {
-        "batteryCharge": 80.0,
-        "charging": False,
-    }
-    battery.update(overrides)
-    return battery
+    return {**_BATTERY_STATE_TEMPLATE, **overrides}
 
 
 def make_load(**overrides) -> Dict[str, Any]:
@@ -299,34 +338,61 @@ def make_load(**overrides) -> Dict[str, Any]:
     return load
 
 
+_ERROR_TEMPLATE = {
+    "errorType": "navigationError",
+    "errorLevel": "WARNING",
+}
+
+
 def make_error(**overrides) -> Dict[str, Any]:
     """Create minimal valid Error object."""
-    error = {
-        "errorType": "navigationError",
-        "errorLevel": "WARNING",
-    }
-    error.update(overrides)
-    return error
+    return {**_ERROR_TEMPLATE, **overrides}
+
+
+_INFORMATION_TEMPLATE = {
+    "infoType": "debugInfo",
+    "infoLevel": "INFO",
+}
 
 
 def make_information(**overrides) -> Dict[str, Any]:
     """Create minimal valid Information object."""
-    info = {
-        "infoType": "debugInfo",
-        "infoLevel": "INFO",
-    }
-    info.update(overrides)
-    return info
+    return {**_INFORMATION_TEMPLATE, **overrides}
+
+
+_SAFETY_STATE_TEMPLATE = {
+    "eStop": "NONE",
+    "fieldViolation": False,
+}
 
 
 def make_safety_state(**overrides) -> Dict[str, Any]:
     """Create minimal valid SafetyState object."""
-    safety = {
-        "eStop": "NONE",
-        "fieldViolation": False,
-    }
-    safety.update(overrides)
-    return safety
+    return {**_SAFETY_STATE_TEMPLATE, **overrides}
+
+
+# Read-only; nested values (batteryState, safetyState, empty lists) are shared
+# between payloads, so replace them rather than mutating them in place
+_STATE_TEMPLATE: Mapping[str, Any] = MappingProxyType({
+    **_HEADER_TEMPLATE,
+    "orderId": "order_001",
+    "orderUpdateId": 0,
+    "lastNodeId": "node_001",
+    "lastNodeSequenceId": 0,
+    "driving": False,
+    "operatingMode": "AUTOMATIC",
+    "nodeStates": [],
+    "edgeStates": [],
+    "actionStates": [],
+    "batteryState": make_battery_state(),
+    "errors": [],
+    "safetyState": make_safety_state(),
+})
+
+
+def make_minimal_state(**overrides) -> Dict[str, Any]:
+    """Create minimal valid State payload."""
+    return {**_STATE_TEMPLATE, **overrides}
 
 
 # =============================================================================
@@ -348,57 +414,64 @@ def make_minimal_factsheet(**overrides) -> Dict[str, Any]:
     return payload
 
 
+# The nested Factsheet templates below are read-only and their list/dict
+# values are shared between payloads; replace a nested value instead of
+# mutating it in place (set_field does this).
+_TYPE_SPECIFICATION_TEMPLATE: Mapping[str, Any] = MappingProxyType({
+    "seriesName": "TestSeries",
+    "agvKinematic": "DIFF",
+    "agvClass": "FORKLIFT",
+    "maxLoadMass": 1000.0,
+    "localizationTypes": ["NATURAL"],
+    "navigationTypes": ["AUTONOMOUS"],
+})
+
+
 def make_type_specification(**overrides) -> Dict[str, Any]:
     """Create minimal valid TypeSpecification object."""
-    spec = {
-        "seriesName": "TestSeries",
-        "agvKinematic": "DIFF",
-        "agvClass": "FORKLIFT",
-        "maxLoadMass": 1000.0,
-        "localizationTypes": ["NATURAL"],
-        "navigationTypes": ["AUTONOMOUS"],
-    }
-    spec.update(overrides)
-    return spec
+    return {**_TYPE_SPECIFICATION_TEMPLATE, **overrides}
+
+
+_PHYSICAL_PARAMETERS_TEMPLATE = {
+    "speedMin": 0.0,
+    "speedMax": 2.0,
+    "accelerationMax": 1.0,
+    "decelerationMax": 1.0,
+    "heightMax": 2.0,
+    "width": 1.0,
+    "length": 1.5,
+}
 
 
 def make_physical_parameters(**overrides) -> Dict[str, Any]:
     """Create minimal valid PhysicalParameters object."""
-    params = {
-        "speedMin": 0.0,
-        "speedMax": 2.0,
-        "accelerationMax": 1.0,
-        "decelerationMax": 1.0,
-        "heightMax": 2.0,
-        "width": 1.0,
-        "length": 1.5,
-    }
-    params.update(overrides)
-    return params
+    return {**_PHYSICAL_PARAMETERS_TEMPLATE, **overrides}
+
+
+_PROTOCOL_LIMITS_TEMPLATE: Mapping[str, Any] = MappingProxyType({
+    "maxStringLens": {},
+    "maxArrayLens": {},
+    "timing": {
+        "minOrderInterval": 1.0,
+        "minStateInterval": 1.0,
+    },
+})
 
 
 def make_protocol_limits(**overrides) -> Dict[str, Any]:
     """Create minimal valid ProtocolLimits object."""
-    limits = {
-        "maxStringLens": {},
-        "maxArrayLens": {},
-        "timing": {
-            "minOrderInterval": 1.0,
-            "minStateInterval": 1.0,
-        },
-    }
-    limits.update(overrides)
-    return limits
+    return {**_PROTOCOL_LIMITS_TEMPLATE, **overrides}
+
+
+_PROTOCOL_FEATURES_TEMPLATE: Mapping[str, Any] = MappingProxyType({
+    "optionalParameters": [],
+    "agvActions": [],
+})
 
 
 def make_protocol_features(**overrides) -> Dict[str, Any]:
     """Create minimal valid ProtocolFeatures object."""
-    features = {
-        "optionalParameters": [],
-        "agvActions": [],
-    }
-    features.update(overrides)
-    return features
+    return {**_PROTOCOL_FEATURES_TEMPLATE, **overrides}
 
 
 def make_agv_geometry(**overrides) -> Dict[str, Any]:
@@ -443,31 +516,39 @@ def make_agv_action(**overrides) -> Dict[str, Any]:
 # Shared Nested Model Fixtures
 # =============================================================================
 
+_BOUNDING_BOX_REFERENCE_TEMPLATE = {
+    "x": 0.0,
+    "y": 0.0,
+    "z": 0.0,
+}
+
+
 def make_bounding_box_reference(**overrides) -> Dict[str, Any]:
     """Create minimal valid BoundingBoxReference object."""
-    bbox = {
-        "x": 0.0,
-        "y": 0.0,
-        "z": 0.0,
-    }
-    bbox.update(overrides)
-    return bbox
+    return {**_BOUNDING_BOX_REFERENCE_TEMPLATE, **overrides}
+
+
+_LOAD_DIMENSIONS_TEMPLATE = {
+    "length": 1.2,
+    "width": 0.8,
+}
 
 
 def make_load_dimensions(**overrides) -> Dict[str, Any]:
     """Create minimal valid LoadDimensions object."""
-    dims = {
-        "length": 1.2,
-        "width": 0.8,
-    }
-    dims.update(overrides)
-    return dims
+    return {**_LOAD_DIMENSIONS_TEMPLATE, **overrides}
 
 
 # =============================================================================
 # Utility Functions
 # =============================================================================
 
+@lru_cache(maxsize=None)
+def _split_path(field_path: str) -> Tuple[str, ...]:
+    """Split a dot-separated field path, caching the result per path."""
+    return tuple(field_path.split('.'))
+
+
 def remove_field(payload: Dict[str, Any], field_path: str) -> Dict[str, Any]:
     """
     Remove a field from a nested dictionary.
@@ -477,21 +558,19 @@ def remove_field(payload: Dict[str, Any], field_path: str) -> Dict[str, Any]:
         field_path: Dot-separated path to the field (e.g., 'batteryState.charging')
     
     Returns:
-        Modified copy of the payload
+        Modified copy of the payload (the input is left unchanged)
     """
-    result = deepcopy(payload)
-    parts = field_path.split('.')
+    # Only the dicts along the path are copied; untouched siblings are shared
+    result = dict(payload)
+    parts = _split_path(field_path)
     
-    if len(parts) == 1:
-        result.pop(parts[0], None)
-    else:
-        current = result
-        for part in parts[:-1]:
-            if part in current:
-                current = current[part]
-            else:
-                return result
-        current.pop(parts[-1], None)
+    current = result
+    for part in parts[:-1]:
+        if part not in current:
+            return result
+        current[part] = dict(current[part])
+        current = current[part]
+    current.pop(parts[-1], None)
     
     return result
 
@@ -506,48 +585,71 @@ def set_field(payload: Dict[str, Any], field_path: str, value: Any) -> Dict[str,
         value: The value to set
     
     Returns:
-        Modified copy of the payload
+        Modified copy of the payload (the input is left unchanged)
     """
-    result = deepcopy(payload)
-    parts = field_path.split('.')
+    # Only the dicts along the path are copied; untouched siblings are shared
+    result = dict(payload)
+    parts = _split_path(field_path)
     
-    if len(parts) == 1:
-        result[parts[0]] = value
-    else:
-        current = result
-        for part in parts[:-1]:
-            if part not in current:
-                current[part] = {}
-            current = current[part]
-        current[parts[-1]] = value
+    current = result
+    for part in parts[:-1]:
+        # One lookup per level; missing levels start from an empty dict
+        child = dict(current.get(part, ()))
+        current[part] = child
+        current = child
+    current[parts[-1]] = value
     
     return result
 
 
-def get_all_enum_values() -> Dict[str, List[str]]:
+# Built once at import and exposed read-only
+_ENUM_VALUES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "ConnectionState": ("ONLINE", "OFFLINE", "CONNECTIONBROKEN"),
+    "BlockingType": ("NONE", "SOFT", "HARD"),
+    "OperatingMode": ("AUTOMATIC", "SEMIAUTOMATIC", "MANUAL", "SERVICE", "TEACHIN"),
+    "ActionStatus": ("WAITING", "INITIALIZING", "RUNNING", "PAUSED", "FINISHED", "FAILED"),
+    "ErrorLevel": ("WARNING", "FATAL"),
+    "InfoLevel": ("INFO", "DEBUG"),
+    "EStop": ("AUTOACK", "MANUAL", "REMOTE", "NONE"),
+    "MapStatus": ("ENABLED", "DISABLED"),
+    "AgvKinematic": ("DIFF", "OMNI", "THREEWHEEL"),
+    "AgvClass": ("FORKLIFT", "CONVEYOR", "TUGGER", "CARRIER"),
+    "LocalizationType": ("NATURAL", "REFLECTOR", "RFID", "DMC", "SPOT", "GRID"),
+    "NavigationType": ("PHYSICAL_LINE_GUIDED", "VIRTUAL_LINE_GUIDED", "AUTONOMOUS"),
+    "ActionScope": ("INSTANT", "NODE", "EDGE"),
+    "ValueDataType": ("BOOL", "NUMBER", "INTEGER", "FLOAT", "STRING", "OBJECT", "ARRAY"),
+    "Type": ("DRIVE", "CASTER", "FIXED", "MECANUM"),
+    "Support": ("SUPPORTED", "REQUIRED"),
+    "CorridorRefPoint": ("KINEMATICCENTER", "CONTOUR"),
+})
+
+
+def error_locs(exc: ValidationError) -> List[Tuple[Any, ...]]:
+    """Return the loc tuple of every error, without rendering the message."""
+    return [e["loc"] for e in exc.errors(include_url=False)]
+
+
+def get_all_enum_values() -> Mapping[str, Tuple[str, ...]]:
     """Return all valid enum values for VDA5050 enums."""
-    return {
-        "ConnectionState": ["ONLINE", "OFFLINE", "CONNECTIONBROKEN"],
-        "BlockingType": ["NONE", "SOFT", "HARD"],
-        "OperatingMode": ["AUTOMATIC", "SEMIAUTOMATIC", "MANUAL", "SERVICE", "TEACHIN"],
-        "ActionStatus": ["WAITING", "INITIALIZING", "RUNNING", "PAUSED", "FINISHED", "FAILED"],
-        "ErrorLevel": ["WARNING", "FATAL"],
-        "InfoLevel": ["INFO", "DEBUG"],
-        "EStop": ["AUTOACK", "MANUAL", "REMOTE", "NONE"],
-        "MapStatus": ["ENABLED", "DISABLED"],
-        "AgvKinematic": ["DIFF", "OMNI", "THREEWHEEL"],
-        "AgvClass": ["FORKLIFT", "CONVEYOR", "TUGGER", "CARRIER"],
-        "LocalizationType": ["NATURAL", "REFLECTOR", "RFID", "DMC", "SPOT", "GRID"],
-        "NavigationType": ["PHYSICAL_LINE_GUIDED", "VIRTUAL_LINE_GUIDED", "AUTONOMOUS"],
-        "ActionScope": ["INSTANT", "NODE", "EDGE"],
-        "ValueDataType": ["BOOL", "NUMBER", "INTEGER", "FLOAT", "STRING", "OBJECT", "ARRAY"],
-        "Type": ["DRIVE", "CASTER", "FIXED", "MECANUM"],
-        "Support": ["SUPPORTED", "REQUIRED"],
-        "CorridorRefPoint": ["KINEMATICCENTER", "CONTOUR"],
-    }
+    return _ENUM_VALUES
 
 
 def get_invalid_enum_value() -> str:
     """Return a generic invalid enum value."""
     return "INVALID_ENUM_VALUE"
 
+
+@lru_cache(maxsize=None)
+def get_type_adapter(model_cls: type) -> TypeAdapter:
+    """Return a TypeAdapter for a model class, built once per class."""
+    return TypeAdapter(model_cls)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model_cls: type) -> TypeAdapter:
+    return TypeAdapter(List[model_cls])
+
+
+def batch_validate(model_cls: type, payloads: List[Dict[str, Any]]) -> List[Any]:
+    """Validate a list of payloads as model_cls instances in a single call."""
+    return _list_adapter(model_cls).validate_python(payloads)
@@ -28,9 +28,12 @@ from vda5050.models.base import (
     BoundingBoxReference,
     LoadDimensions,
 )
+from vda5050.models.connection import Connection
 
 from .fixtures import (
     make_vda5050_header,
+    make_minimal_connection,
+    build_connection_trusted,
     make_action,
     make_action_parameter,
     make_control_point,
@@ -39,10 +42,13 @@ from .fixtures import (
     make_velocity,
     make_bounding_box_reference,
     make_load_dimensions,
-    get_valid_timestamps,
-    get_invalid_timestamps,
+    VALID_TIMESTAMPS,
+    INVALID_TIMESTAMPS,
     remove_field,
     set_field,
+    get_type_adapter,
+    batch_validate,
+    error_locs,
 )
 
 
@@ -56,8 +62,6 @@ class TestVDA5050Message:
     def test_valid_minimal_header(self):
         """Test that VDA5050Message accepts minimal valid header."""
         # VDA5050Message is abstract, but we can test it through a concrete subclass
-        from vda5050.models.connection import Connection
-        
         payload = make_vda5050_header()
         payload["connectionState"] = "ONLINE"
         
@@ -67,37 +71,28 @@ class TestVDA5050Message:
         assert msg.manufacturer == "TestManufacturer"
         assert msg.serialNumber == "AGV001"
     
-    @pytest.mark.parametrize("field", [
-        "headerId", "timestamp", "version", "manufacturer", "serialNumber"
-    ])
-    def test_missing_required_header_field(self, field):
+    def test_missing_required_header_fields(self):
         """Test that missing any required header field raises ValidationError."""
-        from vda5050.models.connection import Connection
-        
-        payload = make_vda5050_header()
-        payload["connectionState"] = "ONLINE"
-        del payload[field]
-        
-        with pytest.raises(ValidationError) as exc_info:
-            Connection(**payload)
-        assert field in str(exc_info.value)
-    
-    @pytest.mark.parametrize("timestamp", get_valid_timestamps())
+        base = make_vda5050_header()
+        base["connectionState"] = "ONLINE"
+        for field in ("headerId", "timestamp", "version", "manufacturer", "serialNumber"):
+            payload = {k: v for k, v in base.items() if k != field}
+            with pytest.raises(ValidationError) as exc_info:
+                Connection(**payload)
+            assert (field,) in error_locs(exc_info.value)
+    
+    @pytest.mark.parametrize("timestamp", VALID_TIMESTAMPS)
     def test_valid_timestamp_formats(self, timestamp):
         """Test that all valid ISO-8601 timestamp formats are accepted."""
-        from vda5050.models.connection import Connection
-        
         payload = make_vda5050_header(timestamp=timestamp)
         payload["connectionState"] = "ONLINE"
         
         msg = Connection(**payload)
         assert isinstance(msg.timestamp, datetime)
     
-    @pytest.mark.parametrize("invalid_timestamp", get_invalid_timestamps())
+    @pytest.mark.parametrize("invalid_timestamp", INVALID_TIMESTAMPS)
     def test_invalid_timestamp_formats(self, invalid_timestamp):
         """Test that invalid timestamp formats are rejected."""
-        from vda5050.models.connection import Connection
-        
         payload = make_vda5050_header(timestamp=invalid_timestamp)
         payload["connectionState"] = "ONLINE"
         
@@ -120,24 +115,17 @@ class TestVDA5050Message:
     ])
     def test_invalid_header_field_types(self, field, invalid_value):
         """Test that wrong types for header fields are rejected."""
-        from vda5050.models.connection import Connection
-        
         payload = make_vda5050_header()
         payload["connectionState"] = "ONLINE"
         payload[field] = invalid_value
         
         with pytest.raises(ValidationError) as exc_info:
             Connection(**payload)
-        assert field in str(exc_info.value)
+        assert (field,) in error_locs(exc_info.value)
     
     def test_to_mqtt_payload(self):
         """Test serialization to MQTT JSON payload."""
-        from vda5050.models.connection import Connection
-        
-        payload = make_vda5050_header()
-        payload["connectionState"] = "ONLINE"
-        
-        msg = Connection(**payload)
+        msg = build_connection_trusted(make_minimal_connection())
         json_str = msg.to_mqtt_payload()
         
         assert isinstance(json_str, str)
@@ -146,12 +134,7 @@ class TestVDA5050Message:
     
     def test_from_mqtt_payload(self):
         """Test deserialization from MQTT JSON payload."""
-        from vda5050.models.connection import Connection
-        
-        payload = make_vda5050_header()
-        payload["connectionState"] = "ONLINE"
-        
-        original = Connection(**payload)
+        original = build_connection_trusted(make_minimal_connection())
         json_str = original.to_mqtt_payload()
         reconstructed = Connection.from_mqtt_payload(json_str)
         
@@ -193,38 +176,40 @@ class TestActionParameter:
         assert param.key == "duration"
         assert param.value == 5.0
     
-    @pytest.mark.parametrize("field", ["key", "value"])
-    def test_missing_required_field(self, field):
-        """Test that missing required fields raise ValidationError."""
-        payload = make_action_parameter()
-        del payload[field]
-        
-        with pytest.raises(ValidationError) as exc_info:
-            ActionParameter(**payload)
-        assert field in str(exc_info.value)
-    
-    @pytest.mark.parametrize("value,expected_type", [
-        (5.0, float),
-        ("text", str),
-        (True, bool),
-        ([1, 2, 3], list),
-        ({"nested": "value"}, dict),
-    ])
-    def test_various_value_types(self, value, expected_type):
+    def test_missing_required_fields(self):
+        """Test that missing any required field raises ValidationError."""
+        base = make_action_parameter()
+        for field in ("key", "value"):
+            payload = {k: v for k, v in base.items() if k != field}
+            with pytest.raises(ValidationError) as exc_info:
+                ActionParameter(**payload)
+            assert (field,) in error_locs(exc_info.value)
+    
+    def test_various_value_types(self):
         """Test that ActionParameter accepts various value types."""
-        payload = make_action_parameter(value=value)
+        cases = (
+            (5.0, float),
+            ("text", str),
+            (True, bool),
+            ([1, 2, 3], list),
+            ({"nested": "value"}, dict),
+        )
+        params = batch_validate(
+            ActionParameter, [make_action_parameter(value=value) for value, _ in cases]
+        )
         
-        param = ActionParameter(**payload)
-        assert isinstance(param.value, expected_type)
-        assert param.value == value
+        for param, (value, expected_type) in zip(params, cases):
+            assert isinstance(param.value, expected_type)
+            assert param.value == value
     
     def test_json_round_trip(self):
         """Test JSON serialization and deserialization preserves data."""
         payload = make_action_parameter(key="testKey", value=[1, 2, 3])
         
         original = ActionParameter(**payload)
-        json_str = original.model_dump_json()
-        reconstructed = ActionParameter.model_validate_json(json_str)
+        adapter = get_type_adapter(ActionParameter)
+        json_bytes = adapter.dump_json(original)
+        reconstructed = adapter.validate_json(json_bytes)
         
         assert reconstructed.key == original.key
         assert reconstructed.value == original.value
@@ -246,15 +231,14 @@ class TestAction:
         assert action.actionType == "pick"
         assert action.blockingType == BlockingType.SOFT
     
-    @pytest.mark.parametrize("field", ["actionType", "actionId", "blockingType"])
-    def test_missing_required_field(self, field):
-        """Test that missing required fields raise ValidationError."""
-        payload = make_action()
-        del payload[field]
-        
-        with pytest.raises(ValidationError) as exc_info:
-            Action(**payload)
-        assert field in str(exc_info.value)
+    def test_missing_required_fields(self):
+        """Test that missing any required field raises ValidationError."""
+        base = make_action()
+        for field in ("actionType", "actionId", "blockingType"):
+            payload = {k: v for k, v in base.items() if k != field}
+            with pytest.raises(ValidationError) as exc_info:
+                Action(**payload)
+            assert (field,) in error_locs(exc_info.value)
     
     def test_optional_action_description(self):
         """Test that actionDescription is optional."""
@@ -284,13 +268,14 @@ class TestAction:
         assert len(action.actionParameters) == 2
         assert action.actionParameters[0].key == "duration"
     
-    @pytest.mark.parametrize("blocking_type", ["NONE", "SOFT", "HARD"])
-    def test_valid_blocking_types(self, blocking_type):
+    def test_valid_blocking_types(self):
         """Test that all valid BlockingType enum values are accepted."""
-        payload = make_action(blockingType=blocking_type)
+        blocking_types = ("NONE", "SOFT", "HARD")
+        actions = batch_validate(
+            Action, [make_action(blockingType=value) for value in blocking_types]
+        )
         
-        action = Action(**payload)
-        assert action.blockingType.value == blocking_type
+        assert [a.blockingType.value for a in actions] == list(blocking_types)
     
     def test_invalid_blocking_type(self):
         """Test that invalid BlockingType values are rejected."""
@@ -321,8 +306,9 @@ class TestAction:
         )
         
         original = Action(**payload)
-        json_str = original.model_dump_json()
-        reconstructed = Action.model_validate_json(json_str)
+        adapter = get_type_adapter(Action)
+        json_bytes = adapter.dump_json(original)
+        reconstructed = adapter.validate_json(json_bytes)
         
         assert reconstructed.actionId == original.actionId
         assert reconstructed.actionType == original.actionType
@@ -346,15 +332,14 @@ class TestControlPoint:
         assert point.y == 3.0
         assert point.weight is None
     
-    @pytest.mark.parametrize("field", ["x", "y"])
-    def test_missing_required_field(self, field):
-        """Test that missing required fields raise ValidationError."""
-        payload = make_control_point()
-        del payload[field]
-        
-        with pytest.raises(ValidationError) as exc_info:
-            ControlPoint(**payload)
-        assert field in str(exc_info.value)
+    def test_missing_required_fields(self):
+        """Test that missing any required field raises ValidationError."""
+        base = make_control_point()
+        for field in ("x", "y"):
+            payload = {k: v for k, v in base.items() if k != field}
+            with pytest.raises(ValidationError) as exc_info:
+                ControlPoint(**payload)
+            assert (field,) in error_locs(exc_info.value)
     
     def test_optional_weight_field(self):
         """Test that weight field is optional and can be set."""
@@ -416,15 +401,14 @@ class TestTrajectory:
         assert len(traj.knotVector) == 4
         assert len(traj.controlPoints) == 2
     
-    @pytest.mark.parametrize("field", ["degree", "knotVector", "controlPoints"])
-    def test_missing_required_field(self, field):
-        """Test that missing required fields raise ValidationError."""
-        payload = make_trajectory()
-        del payload[field]
-        
-        with pytest.raises(ValidationError) as exc_info:
-            Trajectory(**payload)
-        assert field in str(exc_info.value)
+    def test_missing_required_fields(self):
+        """Test that missing any required field raises ValidationError."""
+        base = make_trajectory()
+        for field in ("degree", "knotVector", "controlPoints"):
+            payload = {k: v for k, v in base.items() if k != field}
+            with pytest.raises(ValidationError) as exc_info:
+                Trajectory(**payload)
+            assert (field,) in error_locs(exc_info.value)
     
     def test_degree_must_be_at_least_one(self):
         """Test that degree must be >= 1."""
@@ -478,8 +462,9 @@ class TestTrajectory:
         )
         
         original = Trajectory(**payload)
-        json_str = original.model_dump_json()
-        reconstructed = Trajectory.model_validate_json(json_str)
+        adapter = get_type_adapter(Trajectory)
+        json_bytes = adapter.dump_json(original)
+        reconstructed = adapter.validate_json(json_bytes)
         
         assert reconstructed.degree == original.degree
         assert reconstructed.knotVector == original.knotVector
@@ -504,15 +489,14 @@ class TestAgvPosition:
         assert pos.mapId == "warehouse_floor1"
         assert pos.positionInitialized is True
     
-    @pytest.mark.parametrize("field", ["x", "y", "theta", "mapId", "positionInitialized"])
-    def test_missing_required_field(self, field):
-        """Test that missing required fields raise ValidationError."""
-        payload = make_agv_position()
-        del payload[field]
-        
-        with pytest.raises(ValidationError) as exc_info:
-            AgvPosition(**payload)
-        assert field in str(exc_info.value)
+    def test_missing_required_fields(self):
+        """Test that missing any required field raises ValidationError."""
+        base = make_agv_position()
+        for field in ("x", "y", "theta", "mapId", "positionInitialized"):
+            payload = {k: v for k, v in base.items() if k != field}
+            with pytest.raises(ValidationError) as exc_info:
+                AgvPosition(**payload)
+            assert (field,) in error_locs(exc_info.value)
     
     def test_optional_fields(self):
         """Test that optional fields default to None."""
@@ -637,15 +621,14 @@ class TestBoundingBoxReference:
         assert bbox.z == 0.0
         assert bbox.theta is None
     
-    @pytest.mark.parametrize("field", ["x", "y", "z"])
-    def test_missing_required_field(self, field):
-        """Test that missing required fields raise ValidationError."""
-        payload = make_bounding_box_reference()
-        del payload[field]
-        
-        with pytest.raises(ValidationError) as exc_info:
-            BoundingBoxReference(**payload)
-        assert field in str(exc_info.value)
+    def test_missing_required_fields(self):
+        """Test that missing any required field raises ValidationError."""
+        base = make_bounding_box_reference()
+        for field in ("x", "y", "z"):
+            payload = {k: v for k, v in base.items() if k != field}
+            with pytest.raises(ValidationError) as exc_info:
+                BoundingBoxReference(**payload)
+            assert (field,) in error_locs(exc_info.value)
     
     def test_optional_theta_field(self):
         """Test that theta field is optional."""
@@ -676,15 +659,14 @@ class TestLoadDimensions:
         assert dims.width == 0.8
         assert dims.height is None
     
-    @pytest.mark.parametrize("field", ["length", "width"])
-    def test_missing_required_field(self, field):
-        """Test that missing required fields raise ValidationError."""
-        payload = make_load_dimensions()
-        del payload[field]
-        
-        with pytest.raises(ValidationError) as exc_info:
-            LoadDimensions(**payload)
-        assert field in str(exc_info.value)
+    def test_missing_required_fields(self):
+        """Test that missing any required field raises ValidationError."""
+        base = make_load_dimensions()
+        for field in ("length", "width"):
+            payload = {k: v for k, v in base.items() if k != field}
+            with pytest.raises(ValidationError) as exc_info:
+                LoadDimensions(**payload)
+            assert (field,) in error_locs(exc_info.value)
     
     def test_optional_height_field(self):
         """Test that height field is optional."""
@@ -703,10 +685,28 @@ class TestLoadDimensions:
         payload = make_load_dimensions(length=2.0, width=1.0, height=1.5)
         
         original = LoadDimensions(**payload)
-        json_str = original.model_dump_json()
-        reconstructed = LoadDimensions.model_validate_json(json_str)
+        adapter = get_type_adapter(LoadDimensions)
+        json_bytes = adapter.dump_json(original)
+        reconstructed = adapter.validate_json(json_bytes)
         
         assert reconstructed.length == original.length
         assert reconstructed.width == original.width
         assert reconstructed.height == original.height
 
+
+
+# =============================================================================
+# Schema Build Tests
+# =============================================================================
+
+class TestSchemaBuild:
+    """Tests that message schemas are built once, when the models are imported."""
+    
+    def test_message_schemas_complete_at_import(self):
+        """Test no message model defers its core schema to first validation."""
+        from vda5050.models import (
+            Connection, Factsheet, InstantActions, Order, State, Visualization
+        )
+        
+        for model_cls in (Connection, Factsheet, InstantActions, Order, State, Visualization):
+            assert model_cls.__pydantic_complete__, model_cls.__name__
@@ -8,13 +8,15 @@ with deep nesting.
 Tests verify all 9 Pydantic model validation requirements.
 """
 
+from types import MappingProxyType
+
 import pytest
 from pydantic import ValidationError
 
 from vda5050.models.factsheet import (
-    Factsheet,
+    Factsheet, PhysicalParameters, TypeSpecification,
     AgvKinematic, AgvClass, LocalizationType, NavigationType,
-    Support, ActionScope, ValueDataType, Type as WheelType
+    Type as WheelType
 )
 
 from .fixtures import (
@@ -22,22 +24,107 @@ from .fixtures import (
     make_type_specification,
     make_physical_parameters,
     make_protocol_limits,
-    make_protocol_features,
-    make_agv_geometry,
-    make_load_specification,
     make_wheel_definition,
     make_agv_action,
+    get_type_adapter,
+    error_locs,
+    get_all_enum_values,
+    remove_field,
+    set_field,
 )
 
 
+# Built once and read-only; tests derive variants with remove_field/set_field,
+# which copy only the dicts along the changed path
+_BASE_FACTSHEET = MappingProxyType(make_minimal_factsheet())
+
+_BASE_TYPE_SPEC = MappingProxyType(make_type_specification())
+
+
+def _enum_cases(field, enum_cls, as_list=False):
+    """Build (payload, field, expected value) rows for one enum field."""
+    for value in get_all_enum_values()[enum_cls.__name__]:
+        raw, expected = ([value], [enum_cls(value)]) if as_list else (value, enum_cls(value))
+        payload = {**_BASE_FACTSHEET, "typeSpecification": {**_BASE_TYPE_SPEC, field: raw}}
+        yield pytest.param(payload, field, expected, id=f"{field}-{value}")
+
+
+# Every accepted TypeSpecification enum value, swept by one parametrized test;
+# payloads are built here at collection rather than in the test body
+_ENUM_CASES = [
+    *_enum_cases("agvKinematic", AgvKinematic),
+    *_enum_cases("agvClass", AgvClass),
+    *_enum_cases("localizationTypes", LocalizationType, as_list=True),
+    *_enum_cases("navigationTypes", NavigationType, as_list=True),
+]
+
+# Module-level validator for the rejection and enum-sweep tests, skipping
+# the BaseModel.__init__ wrapper
+_FACTSHEET_TA = get_type_adapter(Factsheet)
+
+
+@pytest.fixture(scope="module")
+def minimal_factsheet():
+    """One validated Factsheet shared by tests that only read from it."""
+    return Factsheet(**_BASE_FACTSHEET)
+
+
+@pytest.fixture(scope="module")
+def max_complexity_factsheet():
+    """The largest Factsheet in the suite, built and validated once."""
+    payload = make_minimal_factsheet(
+        typeSpecification=make_type_specification(
+            seriesDescription="Full description",
+            localizationTypes=["NATURAL", "REFLECTOR"],
+            navigationTypes=["AUTONOMOUS", "VIRTUAL_LINE_GUIDED"]
+        ),
+        physicalParameters=make_physical_parameters(
+            heightMin=0.5
+        ),
+        vehicleConfig={
+            "versions": [
+                {"key": "firmware", "value": "1.0"},
+                {"key": "software", "value": "2.0"}
+            ],
+            "network": {
+                "dnsServers": ["8.8.8.8"],
+                "localIpAddress": "192.168.1.100",
+                "ntpServers": ["pool.ntp.org"],
+                "netmask": "255.255.255.0",
+                "defaultGateway": "192.168.1.1"
+            }
+        },
+        protocolFeatures={
+            "optionalParameters": [
+                {
+                    "parameter": "order.nodes.nodePosition.theta",
+                    "support": "REQUIRED"
+                }
+            ],
+            "agvActions": [
+                make_agv_action(
+                    actionType="pick",
+                    actionScopes=["NODE", "INSTANT"],
+                    actionParameters=[
+                        {
+                            "key": "loadId",
+                            "valueDataType": "STRING",
+                            "isOptional": False
+                        }
+                    ]
+                )
+            ]
+        }
+    )
+    return Factsheet(**payload)
+
+
 class TestFactsheetValidPayloads:
     """Test that Factsheet accepts valid payloads (Requirement 1)."""
     
-    def test_minimal_valid_factsheet(self):
+    def test_minimal_valid_factsheet(self, minimal_factsheet):
         """Test minimal valid Factsheet."""
-        payload = make_minimal_factsheet()
-        
-        factsheet = Factsheet(**payload)
+        factsheet = minimal_factsheet
         
         assert factsheet.headerId == 1
         assert factsheet.typeSpecification.seriesName == "TestSeries"
@@ -76,11 +163,12 @@ class TestFactsheetMissingFields:
     ])
     def test_missing_required_field(self, field):
         """Test that missing required fields raise ValidationError."""
-        payload = make_minimal_factsheet()
-        del payload[field]
+        payload = remove_field(_BASE_FACTSHEET, field)
         
-        with pytest.raises(ValidationError):
-            Factsheet(**payload)
+        with pytest.raises(ValidationError) as exc_info:
+            _FACTSHEET_TA.validate_python(payload)
+        
+        assert error_locs(exc_info.value) == [(field,)]
     
     def test_type_specification_missing_required_fields(self):
         """Test that typeSpecification with missing required fields is rejected."""
@@ -91,8 +179,12 @@ class TestFactsheetMissingFields:
             }
         )
         
-        with pytest.raises(ValidationError):
-            Factsheet(**payload)
+        with pytest.raises(ValidationError) as exc_info:
+            _FACTSHEET_TA.validate_python(payload)
+        
+        locs = error_locs(exc_info.value)
+        for field in ("agvKinematic", "agvClass", "maxLoadMass"):
+            assert ("typeSpecification", field) in locs, field
 
 
 class TestFactsheetInvalidTypes:
@@ -105,31 +197,26 @@ class TestFactsheetInvalidTypes:
         )
         
         with pytest.raises(ValidationError):
-            Factsheet(**payload)
+            _FACTSHEET_TA.validate_python(payload)
     
     def test_invalid_physical_parameters(self):
         """Test that invalid PhysicalParameters are rejected."""
-        payload = make_minimal_factsheet()
-        payload["physicalParameters"]["speedMax"] = "not_a_number"
+        payload = set_field(_BASE_FACTSHEET, "physicalParameters.speedMax", "not_a_number")
         
         with pytest.raises(ValidationError):
-            Factsheet(**payload)
+            _FACTSHEET_TA.validate_python(payload)
 
 
 class TestFactsheetOptionalFields:
     """Test that Factsheet handles optional fields correctly (Requirement 4)."""
     
-    def test_vehicle_config_is_optional(self):
+    def test_vehicle_config_is_optional(self, minimal_factsheet):
         """Test that vehicleConfig is optional."""
         # Without vehicleConfig
-        payload = make_minimal_factsheet()
-        factsheet = Factsheet(**payload)
-        assert factsheet.vehicleConfig is None
+        assert minimal_factsheet.vehicleConfig is None
         
         # With vehicleConfig
-        payload = make_minimal_factsheet(
-            vehicleConfig={"versions": []}
-        )
+        payload = {**_BASE_FACTSHEET, "vehicleConfig": {"versions": []}}
         factsheet = Factsheet(**payload)
         assert factsheet.vehicleConfig is not None
     
@@ -144,13 +231,10 @@ class TestFactsheetOptionalFields:
         factsheet = Factsheet(**payload)
         assert factsheet.typeSpecification.seriesDescription == "Optional description"
     
-    def test_optional_fields_in_physical_parameters(self):
+    def test_optional_fields_in_physical_parameters(self, minimal_factsheet):
         """Test optional fields in PhysicalParameters."""
-        payload = make_minimal_factsheet()
-        factsheet = Factsheet(**payload)
-        
         # heightMin is optional
-        assert factsheet.physicalParameters.heightMin is None
+        assert minimal_factsheet.physicalParameters.heightMin is None
 
 
 class TestFactsheetNestedValidation:
@@ -235,55 +319,11 @@ class TestFactsheetNestedValidation:
 class TestFactsheetEnumValidation:
     """Test enum value enforcement (Requirement 6)."""
     
-    @pytest.mark.parametrize("kinematic", ["DIFF", "OMNI", "THREEWHEEL"])
-    def test_valid_agv_kinematics(self, kinematic):
-        """Test that all valid AgvKinematic values are accepted."""
-        payload = make_minimal_factsheet(
-            typeSpecification=make_type_specification(agvKinematic=kinematic)
-        )
-        
-        factsheet = Factsheet(**payload)
-        assert factsheet.typeSpecification.agvKinematic.value == kinematic
-    
-    @pytest.mark.parametrize("agv_class", [
-        "FORKLIFT", "CONVEYOR", "TUGGER", "CARRIER"
-    ])
-    def test_valid_agv_classes(self, agv_class):
-        """Test that all valid AgvClass values are accepted."""
-        payload = make_minimal_factsheet(
-            typeSpecification=make_type_specification(agvClass=agv_class)
-        )
-        
-        factsheet = Factsheet(**payload)
-        assert factsheet.typeSpecification.agvClass.value == agv_class
-    
-    @pytest.mark.parametrize("loc_type", [
-        "NATURAL", "REFLECTOR", "RFID", "DMC", "SPOT", "GRID"
-    ])
-    def test_valid_localization_types(self, loc_type):
-        """Test that all valid LocalizationType values are accepted."""
-        payload = make_minimal_factsheet(
-            typeSpecification=make_type_specification(
-                localizationTypes=[loc_type]
-            )
-        )
-        
-        factsheet = Factsheet(**payload)
-        assert factsheet.typeSpecification.localizationTypes[0].value == loc_type
-    
-    @pytest.mark.parametrize("nav_type", [
-        "PHYSICAL_LINE_GUIDED", "VIRTUAL_LINE_GUIDED", "AUTONOMOUS"
-    ])
-    def test_valid_navigation_types(self, nav_type):
-        """Test that all valid NavigationType values are accepted."""
-        payload = make_minimal_factsheet(
-            typeSpecification=make_type_specification(
-                navigationTypes=[nav_type]
-            )
-        )
-        
-        factsheet = Factsheet(**payload)
-        assert factsheet.typeSpecification.navigationTypes[0].value == nav_type
+    @pytest.mark.parametrize("payload,field,expected", _ENUM_CASES)
+    def test_valid_type_specification_enums(self, payload, field, expected):
+        """Test that all valid TypeSpecification enum values are accepted."""
+        factsheet = _FACTSHEET_TA.validate_python(payload)
+        assert getattr(factsheet.typeSpecification, field) == expected
 
 
 class TestFactsheetSerialization:
@@ -299,8 +339,9 @@ class TestFactsheetSerialization:
         )
         
         original = Factsheet(**payload)
-        json_str = original.model_dump_json()
-        reconstructed = Factsheet.model_validate_json(json_str)
+        # dump_json returns bytes, which validate_json reads without re-encoding
+        json_bytes = _FACTSHEET_TA.dump_json(original, exclude_none=True)
+        reconstructed = _FACTSHEET_TA.validate_json(json_bytes)
         
         assert reconstructed.typeSpecification.seriesName == "TestBot3000"
         assert reconstructed.typeSpecification.maxLoadMass == 500.0
@@ -326,10 +367,27 @@ class TestFactsheetSerialization:
         )
         
         original = Factsheet(**payload)
-        reconstructed = Factsheet.model_validate(original.model_dump())
+        # Unset optionals come back as None, so they need not be dumped
+        reconstructed = Factsheet.model_validate(original.model_dump(exclude_none=True))
         
         assert len(reconstructed.agvGeometry.wheelDefinitions) == 1
         assert len(reconstructed.agvGeometry.envelopes2d) == 1
+    
+    def test_to_mqtt_payload_uses_field_aliases(self):
+        """Test that aliased maxArrayLens keys survive the MQTT round-trip."""
+        payload = make_minimal_factsheet(
+            protocolLimits=make_protocol_limits(
+                maxArrayLens={"order.nodes": 100, "order.edges": 99}
+            )
+        )
+        
+        original = Factsheet(**payload)
+        mqtt_json = original.to_mqtt_payload()
+        reconstructed = Factsheet.from_mqtt_payload(mqtt_json)
+        
+        assert '"order.nodes":100' in mqtt_json
+        assert reconstructed.protocolLimits.maxArrayLens.order_nodes == 100
+        assert reconstructed.protocolLimits.maxArrayLens.order_edges == 99
 
 
 class TestFactsheetDataIntegrity:
@@ -337,30 +395,28 @@ class TestFactsheetDataIntegrity:
     
     def test_float_precision_in_physical_parameters(self):
         """Test that float precision is maintained."""
-        payload = make_minimal_factsheet(
-            physicalParameters=make_physical_parameters(
-                speedMin=0.123456,
-                speedMax=2.987654,
-                accelerationMax=1.234567
-            )
+        payload = make_physical_parameters(
+            speedMin=0.123456,
+            speedMax=2.987654,
+            accelerationMax=1.234567
         )
         
-        factsheet = Factsheet(**payload)
-        assert factsheet.physicalParameters.speedMin == 0.123456
-        assert factsheet.physicalParameters.speedMax == 2.987654
+        # Only the sub-model is under test, so validate it on its own
+        params = get_type_adapter(PhysicalParameters).validate_python(payload)
+        assert params.speedMin == 0.123456
+        assert params.speedMax == 2.987654
+        assert params.accelerationMax == 1.234567
     
     def test_array_order_preserved(self):
         """Test that array order is preserved."""
-        payload = make_minimal_factsheet(
-            typeSpecification=make_type_specification(
-                localizationTypes=["NATURAL", "REFLECTOR", "GRID"]
-            )
+        payload = make_type_specification(
+            localizationTypes=["NATURAL", "REFLECTOR", "GRID"]
         )
         
-        factsheet = Factsheet(**payload)
-        assert factsheet.typeSpecification.localizationTypes[0] == LocalizationType.NATURAL
-        assert factsheet.typeSpecification.localizationTypes[1] == LocalizationType.REFLECTOR
-        assert factsheet.typeSpecification.localizationTypes[2] == LocalizationType.GRID
+        spec = get_type_adapter(TypeSpecification).validate_python(payload)
+        assert spec.localizationTypes[0] == LocalizationType.NATURAL
+        assert spec.localizationTypes[1] == LocalizationType.REFLECTOR
+        assert spec.localizationTypes[2] == LocalizationType.GRID
 
 
 class TestFactsheetErrorMessages:
@@ -368,14 +424,12 @@ class TestFactsheetErrorMessages:
     
     def test_missing_nested_field_error(self):
         """Test that missing nested fields produce clear errors."""
-        payload = make_minimal_factsheet()
-        del payload["typeSpecification"]["agvKinematic"]
+        payload = remove_field(_BASE_FACTSHEET, "typeSpecification.agvKinematic")
         
         with pytest.raises(ValidationError) as exc_info:
             Factsheet(**payload)
         
-        error_str = str(exc_info.value)
-        assert "agvKinematic" in error_str or "kinematic" in error_str.lower()
+        assert ("typeSpecification", "agvKinematic") in error_locs(exc_info.value)
     
     def test_invalid_enum_in_nested_object(self):
         """Test that invalid enums in nested objects produce clear errors."""
@@ -386,8 +440,7 @@ class TestFactsheetErrorMessages:
         with pytest.raises(ValidationError) as exc_info:
             Factsheet(**payload)
         
-        error_str = str(exc_info.value)
-        assert "agvKinematic" in error_str or "kinematic" in error_str.lower()
+        assert ("typeSpecification", "agvKinematic") in error_locs(exc_info.value)
 
 
 class TestFactsheetEdgeCases:
@@ -415,54 +468,9 @@ class TestFactsheetEdgeCases:
         assert len(factsheet.protocolFeatures.agvActions) == 0
         assert len(factsheet.agvGeometry.wheelDefinitions) == 0
     
-    def test_maximum_complexity_factsheet(self):
+    def test_maximum_complexity_factsheet(self, max_complexity_factsheet):
         """Test Factsheet with maximum complexity and all fields."""
-        payload = make_minimal_factsheet(
-            typeSpecification=make_type_specification(
-                seriesDescription="Full description",
-                localizationTypes=["NATURAL", "REFLECTOR"],
-                navigationTypes=["AUTONOMOUS", "VIRTUAL_LINE_GUIDED"]
-            ),
-            physicalParameters=make_physical_parameters(
-                heightMin=0.5
-            ),
-            vehicleConfig={
-                "versions": [
-                    {"key": "firmware", "value": "1.0"},
-                    {"key": "software", "value": "2.0"}
-                ],
-                "network": {
-                    "dnsServers": ["8.8.8.8"],
-                    "localIpAddress": "192.168.1.100",
-                    "ntpServers": ["pool.ntp.org"],
-                    "netmask": "255.255.255.0",
-                    "defaultGateway": "192.168.1.1"
-                }
-            },
-            protocolFeatures={
-                "optionalParameters": [
-                    {
-                        "parameter": "order.nodes.nodePosition.theta",
-                        "support": "REQUIRED"
-                    }
-                ],
-                "agvActions": [
-                    make_agv_action(
-                        actionType="pick",
-                        actionScopes=["NODE", "INSTANT"],
-                        actionParameters=[
-                            {
-                                "key": "loadId",
-                                "valueDataType": "STRING",
-                                "isOptional": False
-                            }
-                        ]
-                    )
-                ]
-            }
-        )
-        
-        factsheet = Factsheet(**payload)
+        factsheet = max_complexity_factsheet
         assert len(factsheet.typeSpecification.localizationTypes) == 2
         assert len(factsheet.vehicleConfig.versions) == 2
         assert len(factsheet.protocolFeatures.agvActions) == 1
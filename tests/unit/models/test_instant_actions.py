@@ -16,8 +16,11 @@ Tests verify all 9 Pydantic model validation requirements:
 9. Produces clear error messages
 """
 
+from types import MappingProxyType
+
 import pytest
 from pydantic import ValidationError
+from pydantic_core import from_json, to_json
 
 from vda5050.models.instant_action import InstantActions
 from vda5050.models.base import Action, BlockingType
@@ -26,11 +29,28 @@ from .fixtures import (
     make_minimal_instant_actions,
     make_action,
     make_action_parameter,
-    get_valid_timestamps,
-    remove_field,
-    set_field,
+    get_type_adapter,
+    error_locs,
+)
+
+
+# Module-level validator for the rejection and parametrized tests, skipping
+# the BaseModel.__init__ wrapper
+_IA_TA = get_type_adapter(InstantActions)
+
+# Built once; per-row variants are shallow merges over these
+_BASE_ACTION = MappingProxyType(make_action())
+_BASE_INSTANT_ACTIONS = MappingProxyType(make_minimal_instant_actions())
+
+# 100 read-only actions for the bulk test, built once at import
+_LARGE_ACTIONS = tuple(
+    make_action(actionId=f"action_{i}", blockingType="NONE") for i in range(100)
 )
 
+# The base payload as JSON bytes, for tests that only need a valid message
+# and do not exercise dict ingestion
+_BASE_INSTANT_ACTIONS_JSON = _IA_TA.dump_json(_IA_TA.validate_python(_BASE_INSTANT_ACTIONS))
+
 
 # =============================================================================
 # Requirement 1: Accepts Minimally Valid Payload
@@ -52,23 +72,6 @@ class TestInstantActionsValidPayloads:
         assert len(msg.actions) == 1
         assert msg.actions[0].actionId == "action_001"
     
-    def test_instant_actions_with_multiple_actions(self):
-        """Test InstantActions with multiple actions."""
-        payload = make_minimal_instant_actions(
-            actions=[
-                make_action(actionId="action_1", actionType="pick", blockingType="SOFT"),
-                make_action(actionId="action_2", actionType="drop", blockingType="HARD"),
-                make_action(actionId="action_3", actionType="wait", blockingType="NONE"),
-            ]
-        )
-        
-        msg = InstantActions(**payload)
-        
-        assert len(msg.actions) == 3
-        assert msg.actions[0].actionId == "action_1"
-        assert msg.actions[1].actionId == "action_2"
-        assert msg.actions[2].actionId == "action_3"
-    
     def test_instant_actions_with_action_parameters(self):
         """Test InstantActions with actions containing parameters."""
         payload = make_minimal_instant_actions(
@@ -101,24 +104,22 @@ class TestInstantActionsValidPayloads:
 class TestInstantActionsMissingFields:
     """Tests that InstantActions rejects missing required fields (Requirement 2)."""
     
-    @pytest.mark.parametrize("field", [
-        "headerId",
-        "timestamp",
-        "version",
-        "manufacturer",
-        "serialNumber",
-        "actions",
-    ])
-    def test_missing_required_field(self, field):
+    def test_missing_required_fields(self):
         """Test that missing any required field raises ValidationError."""
-        payload = make_minimal_instant_actions()
-        del payload[field]
-        
-        with pytest.raises(ValidationError) as exc_info:
-            InstantActions(**payload)
-        
-        error_message = str(exc_info.value)
-        assert field in error_message.lower() or field in error_message
+        for field in (
+            "headerId",
+            "timestamp",
+            "version",
+            "manufacturer",
+            "serialNumber",
+            "actions",
+        ):
+            payload = {k: v for k, v in _BASE_INSTANT_ACTIONS.items() if k != field}
+            
+            with pytest.raises(ValidationError) as exc_info:
+                _IA_TA.validate_python(payload)
+            
+            assert error_locs(exc_info.value) == [(field,)], field
     
     def test_missing_action_required_fields(self):
         """Test that actions with missing required fields are rejected."""
@@ -132,10 +133,11 @@ class TestInstantActionsMissingFields:
         )
         
         with pytest.raises(ValidationError) as exc_info:
-            InstantActions(**payload)
+            _IA_TA.validate_python(payload)
         
-        error_message = str(exc_info.value)
-        assert "actionType" in error_message or "blockingType" in error_message
+        locs = error_locs(exc_info.value)
+        assert ("actions", 0, "actionType") in locs
+        assert ("actions", 0, "blockingType") in locs
 
 
 # =============================================================================
@@ -156,10 +158,9 @@ class TestInstantActionsInvalidTypes:
         payload = make_minimal_instant_actions(actions=invalid_actions)
         
         with pytest.raises(ValidationError) as exc_info:
-            InstantActions(**payload)
+            _IA_TA.validate_python(payload)
         
-        error_message = str(exc_info.value).lower()
-        assert "actions" in error_message
+        assert all(loc[0] == "actions" for loc in error_locs(exc_info.value))
     
     def test_actions_with_invalid_action_object(self):
         """Test that invalid action objects in the list are rejected."""
@@ -171,7 +172,7 @@ class TestInstantActionsInvalidTypes:
         )
         
         with pytest.raises(ValidationError):
-            InstantActions(**payload)
+            _IA_TA.validate_python(payload)
     
     @pytest.mark.parametrize("field,invalid_value", [
         ("actionId", 123),
@@ -183,13 +184,11 @@ class TestInstantActionsInvalidTypes:
     ])
     def test_invalid_action_field_types(self, field, invalid_value):
         """Test that invalid types in Action fields are rejected."""
-        action_payload = make_action()
-        action_payload[field] = invalid_value
-        
-        payload = make_minimal_instant_actions(actions=[action_payload])
+        action = {**_BASE_ACTION, field: invalid_value}
+        payload = {**_BASE_INSTANT_ACTIONS, "actions": [action]}
         
         with pytest.raises(ValidationError):
-            InstantActions(**payload)
+            _IA_TA.validate_python(payload)
 
 
 # =============================================================================
@@ -202,8 +201,7 @@ class TestInstantActionsOptionalFields:
     def test_action_description_is_optional(self):
         """Test that actionDescription is optional in actions."""
         # Without description
-        payload = make_minimal_instant_actions()
-        msg = InstantActions(**payload)
+        msg = InstantActions.model_validate_json(_BASE_INSTANT_ACTIONS_JSON)
         assert msg.actions[0].actionDescription is None
         
         # With description
@@ -218,8 +216,7 @@ class TestInstantActionsOptionalFields:
     def test_action_parameters_is_optional(self):
         """Test that actionParameters is optional in actions."""
         # Without parameters
-        payload = make_minimal_instant_actions()
-        msg = InstantActions(**payload)
+        msg = InstantActions.model_validate_json(_BASE_INSTANT_ACTIONS_JSON)
         assert msg.actions[0].actionParameters is None
         
         # With parameters
@@ -270,26 +267,31 @@ class TestInstantActionsNestedValidation:
         assert msg.actions[0].actionId == "action_1"
         assert msg.actions[0].blockingType == BlockingType.SOFT
     
-    def test_nested_action_parameters_validation(self):
-        """Test that deeply nested ActionParameter objects are validated."""
-        payload = make_minimal_instant_actions(
-            actions=[
-                make_action(
-                    actionParameters=[
-                        make_action_parameter(key="param1", value=10),
-                        make_action_parameter(key="param2", value="text"),
-                        make_action_parameter(key="param3", value=[1, 2, 3]),
-                    ]
-                )
-            ]
-        )
+    @pytest.mark.parametrize("n_actions,n_params", [(1, 0), (3, 0), (1, 3), (2, 1)])
+    def test_action_shapes(self, n_actions, n_params):
+        """Test that N actions with M parameters each validate in order."""
+        actions = [
+            make_action(
+                actionId=f"action_{i}",
+                actionParameters=[
+                    make_action_parameter(key=f"p{i}_{j}", value=j) for j in range(n_params)
+                ] or None,
+            )
+            for i in range(n_actions)
+        ]
+        payload = {**_BASE_INSTANT_ACTIONS, "actions": actions}
         
-        msg = InstantActions(**payload)
+        msg = _IA_TA.validate_python(payload)
         
-        assert len(msg.actions[0].actionParameters) == 3
-        assert msg.actions[0].actionParameters[0].value == 10
-        assert msg.actions[0].actionParameters[1].value == "text"
-        assert msg.actions[0].actionParameters[2].value == [1, 2, 3]
+        assert [a.actionId for a in msg.actions] == [f"action_{i}" for i in range(n_actions)]
+        for i, action in enumerate(msg.actions):
+            assert isinstance(action, Action)
+            if n_params:
+                assert [(p.key, p.value) for p in action.actionParameters] == [
+                    (f"p{i}_{j}", j) for j in range(n_params)
+                ]
+            else:
+                assert action.actionParameters is None
     
     def test_invalid_nested_action_parameter(self):
         """Test that invalid nested ActionParameter raises error."""
@@ -306,31 +308,6 @@ class TestInstantActionsNestedValidation:
         
         with pytest.raises(ValidationError):
             InstantActions(**payload)
-    
-    def test_multiple_actions_with_nested_objects(self):
-        """Test validation of multiple actions with nested parameters."""
-        payload = make_minimal_instant_actions(
-            actions=[
-                make_action(
-                    actionId="action_1",
-                    actionParameters=[
-                        make_action_parameter(key="p1", value=1)
-                    ]
-                ),
-                make_action(
-                    actionId="action_2",
-                    actionParameters=[
-                        make_action_parameter(key="p2", value=2)
-                    ]
-                ),
-            ]
-        )
-        
-        msg = InstantActions(**payload)
-        
-        assert len(msg.actions) == 2
-        assert msg.actions[0].actionParameters[0].key == "p1"
-        assert msg.actions[1].actionParameters[0].key == "p2"
 
 
 # =============================================================================
@@ -349,27 +326,31 @@ class TestInstantActionsEnumValidation:
             ]
         )
         
-        msg = InstantActions(**payload)
+        msg = _IA_TA.validate_python(payload)
         assert msg.actions[0].blockingType.value == blocking_type
     
-    @pytest.mark.parametrize("invalid_blocking", [
-        "INVALID",
-        "none",  # lowercase
-        "Soft",  # mixed case
-        "",
-        123,
-        None,
-    ])
-    def test_invalid_blocking_types(self, invalid_blocking):
+    def test_invalid_blocking_types(self):
         """Test that invalid BlockingType values are rejected."""
-        payload = make_minimal_instant_actions(
-            actions=[
-                make_action(blockingType=invalid_blocking)
-            ]
+        invalid_values = (
+            "INVALID",
+            "none",  # lowercase
+            "Soft",  # mixed case
+            "",
+            123,
+            None,
         )
+        # One action per invalid value; every action must be reported
+        payload = {
+            **_BASE_INSTANT_ACTIONS,
+            "actions": [{**_BASE_ACTION, "blockingType": v} for v in invalid_values],
+        }
         
-        with pytest.raises(ValidationError):
-            InstantActions(**payload)
+        with pytest.raises(ValidationError) as exc_info:
+            _IA_TA.validate_python(payload)
+        
+        assert error_locs(exc_info.value) == [
+            ("actions", i, "blockingType") for i in range(len(invalid_values))
+        ]
     
     def test_mixed_blocking_types_in_actions(self):
         """Test that different blocking types can be used in different actions."""
@@ -381,11 +362,11 @@ class TestInstantActionsEnumValidation:
             ]
         )
         
-        msg = InstantActions(**payload)
+        msg = _IA_TA.validate_python(payload)
         
-        assert msg.actions[0].blockingType == BlockingType.NONE
-        assert msg.actions[1].blockingType == BlockingType.SOFT
-        assert msg.actions[2].blockingType == BlockingType.HARD
+        assert tuple(a.blockingType for a in msg.actions) == (
+            BlockingType.NONE, BlockingType.SOFT, BlockingType.HARD
+        )
 
 
 # =============================================================================
@@ -412,15 +393,14 @@ class TestInstantActionsSerialization:
             ]
         )
         
-        original = InstantActions(**payload)
+        # The input is JSON too, so both directions go through the JSON path
+        original = InstantActions.model_validate_json(to_json(payload))
         json_str = original.model_dump_json()
         reconstructed = InstantActions.model_validate_json(json_str)
         
-        assert reconstructed.headerId == original.headerId
-        assert len(reconstructed.actions) == len(original.actions)
-        assert reconstructed.actions[0].actionId == original.actions[0].actionId
-        assert reconstructed.actions[0].actionDescription == original.actions[0].actionDescription
-        assert len(reconstructed.actions[0].actionParameters) == 1
+        # Model equality compares every field, nested ones included
+        assert reconstructed == original
+        assert reconstructed.headerId == 42
     
     def test_model_dump_dict_round_trip(self):
         """Test serialization with model_dump() and model_validate()."""
@@ -441,9 +421,7 @@ class TestInstantActionsSerialization:
     
     def test_to_mqtt_payload_round_trip(self):
         """Test MQTT payload serialization/deserialization."""
-        payload = make_minimal_instant_actions()
-        
-        original = InstantActions(**payload)
+        original = InstantActions.model_validate_json(_BASE_INSTANT_ACTIONS_JSON)
         mqtt_json = original.to_mqtt_payload()
         reconstructed = InstantActions.from_mqtt_payload(mqtt_json)
         
@@ -468,13 +446,12 @@ class TestInstantActionsSerialization:
             ]
         )
         
-        original = InstantActions(**payload)
-        reconstructed = InstantActions.model_validate_json(original.model_dump_json())
+        original = InstantActions.model_validate_json(to_json(payload))
+        # Compare the serialized form directly; re-validation is covered by
+        # test_model_dump_json_round_trip
+        serialized = from_json(original.model_dump_json())
         
-        assert len(reconstructed.actions[0].actionParameters) == 4
-        assert reconstructed.actions[0].actionParameters[0].value == 1.5
-        assert reconstructed.actions[0].actionParameters[2].value == [1, 2, 3]
-        assert reconstructed.actions[0].actionParameters[3].value == {"nested": "dict"}
+        assert serialized["actions"][0]["actionParameters"] == payload["actions"][0]["actionParameters"]
 
 
 # =============================================================================
@@ -539,7 +516,9 @@ class TestInstantActionsDataIntegrity:
         )
         
         msg = InstantActions(**payload)
-        reconstructed = InstantActions.model_validate(msg.model_dump())
+        # Enum members are singletons, so a shallow copy is enough here; the
+        # dump/validate path is covered by test_model_dump_dict_round_trip
+        reconstructed = msg.model_copy()
         
         assert reconstructed.actions[0].blockingType == BlockingType.NONE
         assert reconstructed.actions[1].blockingType == BlockingType.SOFT
@@ -555,14 +534,12 @@ class TestInstantActionsErrorMessages:
     
     def test_missing_actions_field_error(self):
         """Test that missing actions field produces clear error."""
-        payload = make_minimal_instant_actions()
-        del payload["actions"]
+        payload = {k: v for k, v in _BASE_INSTANT_ACTIONS.items() if k != "actions"}
         
         with pytest.raises(ValidationError) as exc_info:
             InstantActions(**payload)
         
-        error_str = str(exc_info.value)
-        assert "actions" in error_str.lower()
+        assert error_locs(exc_info.value) == [("actions",)]
     
     def test_invalid_action_field_error(self):
         """Test that errors in nested Action objects reference the field path."""
@@ -579,8 +556,7 @@ class TestInstantActionsErrorMessages:
         with pytest.raises(ValidationError) as exc_info:
             InstantActions(**payload)
         
-        error_str = str(exc_info.value)
-        assert "blockingType" in error_str or "blocking" in error_str.lower()
+        assert error_locs(exc_info.value) == [("actions", 0, "blockingType")]
     
     def test_error_location_for_nested_fields(self):
         """Test that errors include location path for nested fields."""
@@ -598,12 +574,8 @@ class TestInstantActionsErrorMessages:
         with pytest.raises(ValidationError) as exc_info:
             InstantActions(**payload)
         
-        errors = exc_info.value.errors()
-        
-        # Should have location information
-        for error in errors:
-            assert "loc" in error
-            assert len(error["loc"]) > 0
+        # The location points at the exact nested parameter
+        assert error_locs(exc_info.value) == [("actions", 0, "actionParameters", 1, "value")]
     
     def test_multiple_action_errors_collected(self):
         """Test that errors in multiple actions are all collected."""
@@ -618,9 +590,8 @@ class TestInstantActionsErrorMessages:
         with pytest.raises(ValidationError) as exc_info:
             InstantActions(**payload)
         
-        errors = exc_info.value.errors()
-        # Should have multiple errors
-        assert len(errors) >= 3
+        # Should have multiple errors; error_count() avoids building the list
+        assert exc_info.value.error_count() >= 3
 
 
 # =============================================================================
@@ -632,13 +603,8 @@ class TestInstantActionsEdgeCases:
     
     def test_large_number_of_actions(self):
         """Test that a large number of actions can be handled."""
-        actions = [
-            make_action(actionId=f"action_{i}", blockingType="NONE")
-            for i in range(100)
-        ]
-        
-        payload = make_minimal_instant_actions(actions=actions)
-        msg = InstantActions(**payload)
+        payload = {**_BASE_INSTANT_ACTIONS, "actions": list(_LARGE_ACTIONS)}
+        msg = _IA_TA.validate_python(payload)
         
         assert len(msg.actions) == 100
         assert msg.actions[0].actionId == "action_0"
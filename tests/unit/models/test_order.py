@@ -9,20 +9,51 @@ Tests verify all 9 Pydantic model validation requirements.
 
 import pytest
 from pydantic import ValidationError
+from pydantic_core import to_json
 
 from vda5050.models.order import Order, Node, Edge
 from vda5050.models.base import BlockingType
 
 from .fixtures import (
     make_minimal_order,
+    make_order_missing,
+    get_order_required_fields,
     make_node,
     make_edge,
     make_node_position,
     make_trajectory,
     make_action,
+    get_type_adapter,
+    error_locs,
 )
 
 
+# Module-level validator for the parametrized tests, skipping the
+# BaseModel.__init__ wrapper
+_ORDER_TA = get_type_adapter(Order)
+
+
+@pytest.fixture(scope="module")
+def ordered_order():
+    """One validated three-node Order shared by the read-only integrity tests."""
+    payload = make_minimal_order(
+        nodes=[
+            make_node(
+                nodeId="first",
+                sequenceId=0,
+                nodePosition=make_node_position(
+                    x=123.456789,
+                    y=987.654321,
+                    theta=3.14159265
+                )
+            ),
+            make_node(nodeId="second", sequenceId=2),
+            make_node(nodeId="third", sequenceId=4),
+        ]
+    )
+    return Order(**payload)
+
+
 class TestOrderValidPayloads:
     """Test that Order accepts valid payloads (Requirement 1)."""
     
@@ -98,17 +129,13 @@ class TestOrderValidPayloads:
 class TestOrderMissingFields:
     """Test that Order rejects missing required fields (Requirement 2)."""
     
-    @pytest.mark.parametrize("field", [
-        "headerId", "timestamp", "version", "manufacturer", "serialNumber",
-        "orderId", "orderUpdateId", "nodes", "edges"
-    ])
+    @pytest.mark.parametrize("field", get_order_required_fields())
     def test_missing_required_field(self, field):
         """Test that missing required fields raise ValidationError."""
-        payload = make_minimal_order()
-        del payload[field]
+        payload = make_order_missing(field)
         
         with pytest.raises(ValidationError):
-            Order(**payload)
+            _ORDER_TA.validate_python(payload)
     
     def test_node_missing_required_fields(self):
         """Test that nodes with missing required fields are rejected."""
@@ -136,7 +163,7 @@ class TestOrderInvalidTypes:
         payload[field] = invalid_value
         
         with pytest.raises(ValidationError):
-            Order(**payload)
+            _ORDER_TA.validate_python(payload)
     
     def test_invalid_node_sequence_id(self):
         """Test that negative sequenceId is rejected."""
@@ -250,19 +277,25 @@ class TestOrderNestedValidation:
 class TestOrderEnumValidation:
     """Test enum value enforcement (Requirement 6)."""
     
-    @pytest.mark.parametrize("blocking_type", ["NONE", "SOFT", "HARD"])
-    def test_valid_blocking_types_in_actions(self, blocking_type):
+    def test_valid_blocking_types_in_actions(self):
         """Test that valid BlockingType values are accepted in node actions."""
+        # The enum itself is swept in test_instant_actions.py; here one node
+        # carrying every value checks it is applied inside Order nodes
         payload = make_minimal_order(
             nodes=[
                 make_node(
-                    actions=[make_action(blockingType=blocking_type)]
+                    actions=[
+                        make_action(actionId=f"a_{bt}", blockingType=bt)
+                        for bt in ("NONE", "SOFT", "HARD")
+                    ]
                 )
             ]
         )
         
-        order = Order(**payload)
-        assert order.nodes[0].actions[0].blockingType.value == blocking_type
+        order = _ORDER_TA.validate_python(payload)
+        assert [a.blockingType for a in order.nodes[0].actions] == [
+            BlockingType.NONE, BlockingType.SOFT, BlockingType.HARD
+        ]
 
 
 class TestOrderSerialization:
@@ -282,50 +315,29 @@ class TestOrderSerialization:
             ]
         )
         
-        original = Order(**payload)
+        # The input is JSON too, so both directions go through the JSON path
+        original = Order.model_validate_json(to_json(payload))
         json_str = original.model_dump_json()
         reconstructed = Order.model_validate_json(json_str)
         
-        assert reconstructed.orderId == original.orderId
-        assert len(reconstructed.nodes) == 2
-        assert reconstructed.edges[0].startNodeId == "n1"
+        # Model equality compares every field, nested ones included
+        assert reconstructed == original
+        assert reconstructed.orderId == "order_123"
 
 
 class TestOrderDataIntegrity:
     """Test data integrity preservation (Requirement 8)."""
     
-    def test_node_order_preserved(self):
+    def test_node_order_preserved(self, ordered_order):
         """Test that node array order is preserved."""
-        payload = make_minimal_order(
-            nodes=[
-                make_node(nodeId="first", sequenceId=0),
-                make_node(nodeId="second", sequenceId=2),
-                make_node(nodeId="third", sequenceId=4),
-            ]
-        )
-        
-        order = Order(**payload)
-        
-        assert order.nodes[0].nodeId == "first"
-        assert order.nodes[1].nodeId == "second"
-        assert order.nodes[2].nodeId == "third"
+        assert [n.nodeId for n in ordered_order.nodes] == ["first", "second", "third"]
     
-    def test_float_precision_in_node_positions(self):
+    def test_float_precision_in_node_positions(self, ordered_order):
         """Test that float precision is maintained in node positions."""
-        payload = make_minimal_order(
-            nodes=[
-                make_node(
-                    nodePosition=make_node_position(
-                        x=123.456789,
-                        y=987.654321,
-                        theta=3.14159265
-                    )
-                )
-            ]
-        )
-        
-        order = Order(**payload)
-        assert order.nodes[0].nodePosition.x == 123.456789
+        position = ordered_order.nodes[0].nodePosition
+        assert position.x == 123.456789
+        assert position.y == 987.654321
+        assert position.theta == 3.14159265
 
 
 class TestOrderErrorMessages:
@@ -333,14 +345,12 @@ class TestOrderErrorMessages:
     
     def test_missing_field_error_clarity(self):
         """Test that missing fields produce clear errors."""
-        payload = make_minimal_order()
-        del payload["orderId"]
+        payload = make_order_missing("orderId")
         
         with pytest.raises(ValidationError) as exc_info:
             Order(**payload)
         
-        error_str = str(exc_info.value)
-        assert "orderId" in error_str or "order_id" in error_str.lower()
+        assert error_locs(exc_info.value) == [("orderId",)]
 
 
 class TestOrderEdgeCases:
@@ -7,6 +7,8 @@ battery, errors, safety state, and action/node/edge states.
 Tests verify all 9 Pydantic model validation requirements.
 """
 
+from types import MappingProxyType
+
 import pytest
 from pydantic import ValidationError
 
@@ -25,17 +27,69 @@ from .fixtures import (
     make_safety_state,
     make_agv_position,
     make_velocity,
+    get_all_enum_values,
+    get_type_adapter,
+    error_locs,
+)
+
+
+# Built once and read-only; tests copy it with {**_BASE_STATE, ...} before
+# changing fields
+_BASE_STATE = MappingProxyType(make_minimal_state())
+
+# Default nested payloads; validation only reads them, so tests can share them
+_DEFAULT_AGV_POSITION = make_agv_position()
+_DEFAULT_VELOCITY = make_velocity()
+_DEFAULT_NODE_STATE = make_node_state()
+_DEFAULT_EDGE_STATE = make_edge_state()
+_DEFAULT_ACTION_STATE = make_action_state()
+_DEFAULT_ERROR = make_error()
+_DEFAULT_INFORMATION = make_information()
+
+# Module-level validator for tests that are not about State.__init__
+_STATE_TA = get_type_adapter(State)
+
+# Serialized once so parse-only tests don't pay for model_dump_json() per run
+_MINIMAL_JSON = State(**_BASE_STATE).model_dump_json()
+
+_REQUIRED_FIELDS = (
+    "orderId", "orderUpdateId", "lastNodeId", "lastNodeSequenceId",
+    "driving", "operatingMode", "nodeStates", "edgeStates",
+    "actionStates", "batteryState", "errors", "safetyState",
+)
+
+_INVALID_CASES = (
+    ("orderId", 123),
+    ("orderUpdateId", "not_int"),
+    ("lastNodeId", 456),
+    ("lastNodeSequenceId", "not_int"),
+    ("driving", "not_bool"),
+    ("nodeStates", "not_list"),
+    ("edgeStates", "not_list"),
 )
 
 
+def _expect_invalid(payload):
+    """Validate payload and return the ValidationError it must raise."""
+    try:
+        _STATE_TA.validate_python(payload)
+    except ValidationError as exc:
+        return exc
+    raise AssertionError("expected ValidationError")
+
+
+@pytest.fixture(scope="module")
+def minimal_state():
+    """One validated State shared by tests that only read from it."""
+    return State(**_BASE_STATE)
+
+
 class TestStateValidPayloads:
     """Test that State accepts valid payloads (Requirement 1)."""
     
-    def test_minimal_valid_state(self):
+    def test_minimal_valid_state(self, minimal_state):
         """Test minimal valid State."""
-        payload = make_minimal_state()
-        
-        state = State(**payload)
+        state = minimal_state
         
         assert state.orderId == "order_001"
         assert state.orderUpdateId == 0
@@ -43,18 +97,18 @@ class TestStateValidPayloads:
         assert state.lastNodeSequenceId == 0
         assert state.driving is False
         assert state.operatingMode == OperatingMode.AUTOMATIC
-        assert len(state.nodeStates) == 0
-        assert len(state.edgeStates) == 0
-        assert len(state.actionStates) == 0
-        assert len(state.errors) == 0
+        assert not state.nodeStates
+        assert not state.edgeStates
+        assert not state.actionStates
+        assert not state.errors
         assert state.batteryState.batteryCharge == 80.0
         assert state.safetyState.eStop == EStop.NONE
     
     def test_state_with_position_and_velocity(self):
         """Test State with position and velocity."""
         payload = make_minimal_state(
-            agvPosition=make_agv_position(),
-            velocity=make_velocity()
+            agvPosition=_DEFAULT_AGV_POSITION,
+            velocity=_DEFAULT_VELOCITY
         )
         
         state = State(**payload)
@@ -82,18 +136,12 @@ class TestStateValidPayloads:
 class TestStateMissingFields:
     """Test that State rejects missing required fields (Requirement 2)."""
     
-    @pytest.mark.parametrize("field", [
-        "orderId", "orderUpdateId", "lastNodeId", "lastNodeSequenceId",
-        "driving", "operatingMode", "nodeStates", "edgeStates",
-        "actionStates", "batteryState", "errors", "safetyState"
-    ])
-    def test_missing_required_field(self, field):
+    def test_missing_required_fields(self):
         """Test that missing required fields raise ValidationError."""
-        payload = make_minimal_state()
-        del payload[field]
-        
-        with pytest.raises(ValidationError):
-            State(**payload)
+        for field in _REQUIRED_FIELDS:
+            payload = {k: v for k, v in _BASE_STATE.items() if k != field}
+            
+            assert error_locs(_expect_invalid(payload)) == [(field,)], field
     
     def test_battery_state_missing_required_fields(self):
         """Test that batteryState with missing required fields is rejected."""
@@ -102,37 +150,26 @@ class TestStateMissingFields:
         )
         
         with pytest.raises(ValidationError):
-            State(**payload)
+            _STATE_TA.validate_python(payload)
 
 
 class TestStateInvalidTypes:
     """Test that State rejects invalid field types (Requirement 3)."""
     
-    @pytest.mark.parametrize("field,invalid_value", [
-        ("orderId", 123),
-        ("orderUpdateId", "not_int"),
-        ("lastNodeId", 456),
-        ("lastNodeSequenceId", "not_int"),
-        ("driving", "not_bool"),
-        ("nodeStates", "not_list"),
-        ("edgeStates", "not_list"),
-    ])
-    def test_invalid_field_types(self, field, invalid_value):
+    def test_invalid_field_types(self):
         """Test that invalid types are rejected."""
-        payload = make_minimal_state()
-        payload[field] = invalid_value
-        
-        with pytest.raises(ValidationError):
-            State(**payload)
+        for field, invalid_value in _INVALID_CASES:
+            payload = {**_BASE_STATE, field: invalid_value}
+            
+            assert error_locs(_expect_invalid(payload)) == [(field,)], field
 
 
 class TestStateOptionalFields:
     """Test that State handles optional fields correctly (Requirement 4)."""
     
-    def test_optional_fields_default_to_none(self):
+    def test_optional_fields_default_to_none(self, minimal_state):
         """Test that optional fields default to None."""
-        payload = make_minimal_state()
-        state = State(**payload)
+        state = minimal_state
         
         assert state.zoneSetId is None
         assert state.paused is None
@@ -206,47 +243,30 @@ class TestStateNestedValidation:
 class TestStateEnumValidation:
     """Test enum value enforcement (Requirement 6)."""
     
-    @pytest.mark.parametrize("mode", [
-        "AUTOMATIC", "SEMIAUTOMATIC", "MANUAL", "SERVICE", "TEACHIN"
-    ])
-    def test_valid_operating_modes(self, mode):
+    def test_valid_operating_modes(self):
         """Test that all valid OperatingMode values are accepted."""
-        payload = make_minimal_state(operatingMode=mode)
-        
-        state = State(**payload)
-        assert state.operatingMode.value == mode
+        for mode in get_all_enum_values()["OperatingMode"]:
+            state = _STATE_TA.validate_python({**_BASE_STATE, "operatingMode": mode})
+            assert state.operatingMode.value == mode
     
-    @pytest.mark.parametrize("status", [
-        "WAITING", "INITIALIZING", "RUNNING", "PAUSED", "FINISHED", "FAILED"
-    ])
-    def test_valid_action_statuses(self, status):
+    def test_valid_action_statuses(self):
         """Test that all valid ActionStatus values are accepted."""
-        payload = make_minimal_state(
-            actionStates=[make_action_state(actionStatus=status)]
-        )
-        
-        state = State(**payload)
-        assert state.actionStates[0].actionStatus.value == status
+        for status in get_all_enum_values()["ActionStatus"]:
+            payload = {**_BASE_STATE, "actionStates": [make_action_state(actionStatus=status)]}
+            state = _STATE_TA.validate_python(payload)
+            assert state.actionStates[0].actionStatus.value == status
     
-    @pytest.mark.parametrize("level", ["WARNING", "FATAL"])
-    def test_valid_error_levels(self, level):
+    def test_valid_error_levels(self):
         """Test that all valid ErrorLevel values are accepted."""
-        payload = make_minimal_state(
-            errors=[make_error(errorLevel=level)]
-        )
-        
-        state = State(**payload)
-        assert state.errors[0].errorLevel.value == level
+        for level in get_all_enum_values()["ErrorLevel"]:
+            state = _STATE_TA.validate_python({**_BASE_STATE, "errors": [make_error(errorLevel=level)]})
+            assert state.errors[0].errorLevel.value == level
     
-    @pytest.mark.parametrize("estop", ["AUTOACK", "MANUAL", "REMOTE", "NONE"])
-    def test_valid_estop_values(self, estop):
+    def test_valid_estop_values(self):
         """Test that all valid EStop values are accepted."""
-        payload = make_minimal_state(
-            safetyState=make_safety_state(eStop=estop)
-        )
-        
-        state = State(**payload)
-        assert state.safetyState.eStop.value == estop
+        for estop in get_all_enum_values()["EStop"]:
+            state = _STATE_TA.validate_python({**_BASE_STATE, "safetyState": make_safety_state(eStop=estop)})
+            assert state.safetyState.eStop.value == estop
 
 
 class TestStateSerialization:
@@ -269,6 +289,10 @@ class TestStateSerialization:
         assert reconstructed.orderId == original.orderId
         assert reconstructed.driving == original.driving
         assert len(reconstructed.actionStates) == 1
+    
+    def test_model_validate_json_minimal(self, minimal_state):
+        """Test that the minimal payload parses back from JSON unchanged."""
+        assert State.model_validate_json(_MINIMAL_JSON) == minimal_state
 
 
 class TestStateDataIntegrity:
@@ -322,14 +346,12 @@ class TestStateErrorMessages:
     
     def test_missing_field_error_clarity(self):
         """Test that missing fields produce clear errors."""
-        payload = make_minimal_state()
-        del payload["batteryState"]
+        payload = {k: v for k, v in _BASE_STATE.items() if k != "batteryState"}
         
         with pytest.raises(ValidationError) as exc_info:
             State(**payload)
         
-        error_str = str(exc_info.value)
-        assert "batteryState" in error_str or "battery" in error_str.lower()
+        assert error_locs(exc_info.value) == [("batteryState",)]
     
     def test_invalid_enum_error_clarity(self):
         """Test that invalid enum values produce clear errors."""
@@ -338,8 +360,7 @@ class TestStateErrorMessages:
         with pytest.raises(ValidationError) as exc_info:
             State(**payload)
         
-        error_str = str(exc_info.value)
-        assert "operatingMode" in error_str or "operating" in error_str.lower()
+        assert error_locs(exc_info.value) == [("operatingMode",)]
 
 
 class TestStateEdgeCases:
@@ -356,10 +377,8 @@ class TestStateEdgeCases:
     def test_battery_charge_boundaries(self):
         """Test battery charge value range."""
         # Valid values
-        for charge in [0.0, 50.0, 100.0]:
-            payload = make_minimal_state(
-                batteryState=make_battery_state(batteryCharge=charge)
-            )
+        for charge in (0.0, 50.0, 100.0):
+            payload = {**_BASE_STATE, "batteryState": make_battery_state(batteryCharge=charge)}
             state = State(**payload)
             assert state.batteryState.batteryCharge == charge
     
@@ -370,14 +389,14 @@ class TestStateEdgeCases:
             paused=True,
             newBaseRequest=False,
             distanceSinceLastNode=10.5,
-            agvPosition=make_agv_position(),
-            velocity=make_velocity(),
-            nodeStates=[make_node_state()],
-            edgeStates=[make_edge_state()],
-            actionStates=[make_action_state()],
+            agvPosition=_DEFAULT_AGV_POSITION,
+            velocity=_DEFAULT_VELOCITY,
+            nodeStates=[_DEFAULT_NODE_STATE],
+            edgeStates=[_DEFAULT_EDGE_STATE],
+            actionStates=[_DEFAULT_ACTION_STATE],
             loads=[{"loadId": "L1", "loadType": "pallet"}],
-            errors=[make_error()],
-            information=[make_information()],
+            errors=[_DEFAULT_ERROR],
+            information=[_DEFAULT_INFORMATION],
         )
         
         state = State(**payload)
@@ -16,20 +16,51 @@ Tests verify all 9 Pydantic model validation requirements:
 9. Produces clear error messages
 """
 
+from types import MappingProxyType
+
 import pytest
 from pydantic import ValidationError
 
 from vda5050.models.visualization import Visualization
-from vda5050.models.base import AgvPosition, Velocity
 
 from .fixtures import (
     make_minimal_visualization,
     make_agv_position,
     make_velocity,
-    remove_field,
+    get_type_adapter,
+    error_locs,
+)
+
+
+# Built once and read-only; tests copy it with {**_BASE_VISUALIZATION, ...} before
+# changing fields
+_BASE_VISUALIZATION = MappingProxyType(make_minimal_visualization())
+
+# Default nested payloads; validation only reads them, so tests can share them
+_DEFAULT_AGV_POSITION = make_agv_position()
+_DEFAULT_VELOCITY = make_velocity()
+
+# Module-level validator for the rejection tests and the bytes-in/bytes-out
+# round-trips; the minimal round-trip keeps model_dump_json()/model_validate_json()
+_VISUALIZATION_TA = get_type_adapter(Visualization)
+
+_REQUIRED_HEADER_FIELDS = (
+    "headerId", "timestamp", "version", "manufacturer", "serialNumber",
 )
 
 
+@pytest.fixture(scope="module")
+def minimal_visualization():
+    """One validated Visualization shared by tests that only read from it."""
+    return Visualization(**_BASE_VISUALIZATION)
+
+
+@pytest.fixture(scope="module")
+def visualization_with_position():
+    """One validated Visualization with the default agvPosition, read-only."""
+    return Visualization(**{**_BASE_VISUALIZATION, "agvPosition": _DEFAULT_AGV_POSITION})
+
+
 # =============================================================================
 # Requirement 1: Accepts Minimally Valid Payload
 # =============================================================================
@@ -37,11 +68,9 @@ from .fixtures import (
 class TestVisualizationValidPayloads:
     """Tests that Visualization accepts valid payloads (Requirement 1)."""
     
-    def test_minimal_valid_visualization(self):
+    def test_minimal_valid_visualization(self, minimal_visualization):
         """Test that Visualization accepts minimal valid payload (header only)."""
-        payload = make_minimal_visualization()
-        
-        msg = Visualization(**payload)
+        msg = minimal_visualization
         
         assert msg.headerId == 1
         assert msg.version == "2.1.0"
@@ -50,13 +79,9 @@ class TestVisualizationValidPayloads:
         assert msg.agvPosition is None
         assert msg.velocity is None
     
-    def test_visualization_with_agv_position(self):
+    def test_visualization_with_agv_position(self, visualization_with_position):
         """Test Visualization with agvPosition set."""
-        payload = make_minimal_visualization(
-            agvPosition=make_agv_position()
-        )
-        
-        msg = Visualization(**payload)
+        msg = visualization_with_position
         
         assert msg.agvPosition is not None
         assert msg.agvPosition.x == 10.5
@@ -66,7 +91,7 @@ class TestVisualizationValidPayloads:
     def test_visualization_with_velocity(self):
         """Test Visualization with velocity set."""
         payload = make_minimal_visualization(
-            velocity=make_velocity()
+            velocity=_DEFAULT_VELOCITY
         )
         
         msg = Visualization(**payload)
@@ -105,23 +130,15 @@ class TestVisualizationValidPayloads:
 class TestVisualizationMissingFields:
     """Tests that Visualization rejects missing required fields (Requirement 2)."""
     
-    @pytest.mark.parametrize("field", [
-        "headerId",
-        "timestamp",
-        "version",
-        "manufacturer",
-        "serialNumber",
-    ])
-    def test_missing_required_header_field(self, field):
+    def test_missing_required_header_fields(self):
         """Test that missing any required header field raises ValidationError."""
-        payload = make_minimal_visualization()
-        del payload[field]
-        
-        with pytest.raises(ValidationError) as exc_info:
-            Visualization(**payload)
-        
-        error_message = str(exc_info.value)
-        assert field in error_message.lower() or field in error_message
+        for field in _REQUIRED_HEADER_FIELDS:
+            payload = {k: v for k, v in _BASE_VISUALIZATION.items() if k != field}
+            
+            with pytest.raises(ValidationError) as exc_info:
+                _VISUALIZATION_TA.validate_python(payload)
+            
+            assert error_locs(exc_info.value) == [(field,)], field
     
     def test_agv_position_missing_required_fields(self):
         """Test that agvPosition with missing required fields is rejected."""
@@ -133,7 +150,7 @@ class TestVisualizationMissingFields:
         )
         
         with pytest.raises(ValidationError):
-            Visualization(**payload)
+            _VISUALIZATION_TA.validate_python(payload)
 
 
 # =============================================================================
@@ -143,31 +160,16 @@ class TestVisualizationMissingFields:
 class TestVisualizationInvalidTypes:
     """Tests that Visualization rejects invalid field types (Requirement 3)."""
     
-    @pytest.mark.parametrize("invalid_position", [
-        "not_a_dict",
-        123,
-        ["list"],
-        True,
-    ])
-    def test_invalid_agv_position_type(self, invalid_position):
-        """Test that agvPosition must be a dict/object or None."""
-        payload = make_minimal_visualization(agvPosition=invalid_position)
-        
-        with pytest.raises(ValidationError):
-            Visualization(**payload)
-    
-    @pytest.mark.parametrize("invalid_velocity", [
-        "not_a_dict",
-        123,
-        ["list"],
-        True,
-    ])
-    def test_invalid_velocity_type(self, invalid_velocity):
-        """Test that velocity must be a dict/object or None."""
-        payload = make_minimal_visualization(velocity=invalid_velocity)
-        
-        with pytest.raises(ValidationError):
-            Visualization(**payload)
+    def test_invalid_nested_types(self):
+        """Test that agvPosition and velocity must be a dict/object or None."""
+        for field in ("agvPosition", "velocity"):
+            for invalid_value in ("not_a_dict", 123, ["list"], True):
+                payload = {**_BASE_VISUALIZATION, field: invalid_value}
+                
+                with pytest.raises(ValidationError) as exc_info:
+                    _VISUALIZATION_TA.validate_python(payload)
+                
+                assert error_locs(exc_info.value) == [(field,)], (field, invalid_value)
     
     def test_invalid_agv_position_field_types(self):
         """Test that invalid types in AgvPosition fields are rejected."""
@@ -182,7 +184,7 @@ class TestVisualizationInvalidTypes:
         )
         
         with pytest.raises(ValidationError):
-            Visualization(**payload)
+            _VISUALIZATION_TA.validate_python(payload)
 
 
 # =============================================================================
@@ -192,37 +194,32 @@ class TestVisualizationInvalidTypes:
 class TestVisualizationOptionalFields:
     """Tests that Visualization handles optional fields correctly (Requirement 4)."""
     
-    def test_agv_position_is_optional(self):
+    def test_agv_position_is_optional(
+        self, minimal_visualization, visualization_with_position
+    ):
         """Test that agvPosition is optional."""
         # Without agvPosition
-        payload = make_minimal_visualization()
-        msg = Visualization(**payload)
+        msg = minimal_visualization
         assert msg.agvPosition is None
         
         # With agvPosition
-        payload = make_minimal_visualization(agvPosition=make_agv_position())
-        msg = Visualization(**payload)
+        msg = visualization_with_position
         assert msg.agvPosition is not None
     
-    def test_velocity_is_optional(self):
+    def test_velocity_is_optional(self, minimal_visualization):
         """Test that velocity is optional."""
         # Without velocity
-        payload = make_minimal_visualization()
-        msg = Visualization(**payload)
+        msg = minimal_visualization
         assert msg.velocity is None
         
         # With velocity
-        payload = make_minimal_visualization(velocity=make_velocity())
+        payload = make_minimal_visualization(velocity=_DEFAULT_VELOCITY)
         msg = Visualization(**payload)
         assert msg.velocity is not None
     
-    def test_optional_fields_in_agv_position(self):
+    def test_optional_fields_in_agv_position(self, visualization_with_position):
         """Test that optional fields in AgvPosition default to None."""
-        payload = make_minimal_visualization(
-            agvPosition=make_agv_position()
-        )
-        
-        msg = Visualization(**payload)
+        msg = visualization_with_position
         
         # Optional fields should be None
         assert msg.agvPosition.mapDescription is None
@@ -275,27 +272,21 @@ class TestVisualizationOptionalFields:
 class TestVisualizationNestedValidation:
     """Tests nested object validation (Requirement 5)."""
     
-    def test_nested_agv_position_validation(self):
+    def test_nested_agv_position_validation(self, visualization_with_position):
         """Test that nested AgvPosition object is validated."""
-        payload = make_minimal_visualization(
-            agvPosition=make_agv_position()
-        )
+        msg = visualization_with_position
         
-        msg = Visualization(**payload)
-        
-        assert isinstance(msg.agvPosition, AgvPosition)
         assert msg.agvPosition.x == 10.5
         assert msg.agvPosition.positionInitialized is True
     
     def test_nested_velocity_validation(self):
         """Test that nested Velocity object is validated."""
         payload = make_minimal_visualization(
-            velocity=make_velocity()
+            velocity=_DEFAULT_VELOCITY
         )
         
         msg = Visualization(**payload)
         
-        assert isinstance(msg.velocity, Velocity)
         assert msg.velocity.vx == 1.5
     
     def test_invalid_nested_agv_position(self):
@@ -334,8 +325,8 @@ class TestVisualizationEnumValidation:
         # Visualization model doesn't have enum fields
         # AgvPosition and Velocity also don't have enums
         payload = make_minimal_visualization(
-            agvPosition=make_agv_position(),
-            velocity=make_velocity()
+            agvPosition=_DEFAULT_AGV_POSITION,
+            velocity=_DEFAULT_VELOCITY
         )
         
         msg = Visualization(**payload)
@@ -352,11 +343,9 @@ class TestVisualizationEnumValidation:
 class TestVisualizationSerialization:
     """Tests JSON round-trip serialization (Requirement 7)."""
     
-    def test_model_dump_json_round_trip_minimal(self):
+    def test_model_dump_json_round_trip_minimal(self, minimal_visualization):
         """Test serialization of minimal payload."""
-        payload = make_minimal_visualization()
-        
-        original = Visualization(**payload)
+        original = minimal_visualization
         json_str = original.model_dump_json()
         reconstructed = Visualization.model_validate_json(json_str)
         
@@ -375,8 +364,9 @@ class TestVisualizationSerialization:
         )
         
         original = Visualization(**payload)
-        json_str = original.model_dump_json()
-        reconstructed = Visualization.model_validate_json(json_str)
+        # dump_json returns bytes, which validate_json reads without re-encoding
+        json_bytes = _VISUALIZATION_TA.dump_json(original)
+        reconstructed = _VISUALIZATION_TA.validate_json(json_bytes)
         
         assert reconstructed.agvPosition.x == original.agvPosition.x
         assert reconstructed.agvPosition.y == original.agvPosition.y
@@ -389,8 +379,9 @@ class TestVisualizationSerialization:
         )
         
         original = Visualization(**payload)
-        json_str = original.model_dump_json()
-        reconstructed = Visualization.model_validate_json(json_str)
+        # dump_json returns bytes, which validate_json reads without re-encoding
+        json_bytes = _VISUALIZATION_TA.dump_json(original)
+        reconstructed = _VISUALIZATION_TA.validate_json(json_bytes)
         
         assert reconstructed.velocity.vx == 2.5
         assert reconstructed.velocity.vy == -1.0
@@ -399,8 +390,8 @@ class TestVisualizationSerialization:
     def test_model_dump_json_round_trip_complete(self):
         """Test serialization with all fields."""
         payload = make_minimal_visualization(
-            agvPosition=make_agv_position(),
-            velocity=make_velocity()
+            agvPosition=_DEFAULT_AGV_POSITION,
+            velocity=_DEFAULT_VELOCITY
         )
         
         original = Visualization(**payload)
@@ -412,7 +403,7 @@ class TestVisualizationSerialization:
     def test_to_mqtt_payload_round_trip(self):
         """Test MQTT payload serialization/deserialization."""
         payload = make_minimal_visualization(
-            agvPosition=make_agv_position()
+            agvPosition=_DEFAULT_AGV_POSITION
         )
         
         original = Visualization(**payload)
@@ -477,17 +468,16 @@ class TestVisualizationDataIntegrity:
         reconstructed = Visualization.model_validate(msg.model_dump())
         assert reconstructed.agvPosition.positionInitialized is False
     
-    def test_none_values_preserved(self):
+    def test_none_values_preserved(self, minimal_visualization):
         """Test that None values in optional fields are preserved."""
-        payload = make_minimal_visualization()
-        
-        msg = Visualization(**payload)
+        msg = minimal_visualization
         
         assert msg.agvPosition is None
         assert msg.velocity is None
         
-        # Round-trip
-        reconstructed = Visualization.model_validate_json(msg.model_dump_json())
+        # Copy; the JSON path for None is covered by
+        # test_model_dump_json_round_trip_minimal
+        reconstructed = msg.model_copy(deep=True)
         assert reconstructed.agvPosition is None
         assert reconstructed.velocity is None
 
@@ -501,14 +491,12 @@ class TestVisualizationErrorMessages:
     
     def test_missing_header_field_error(self):
         """Test that missing header field produces clear error."""
-        payload = make_minimal_visualization()
-        del payload["headerId"]
+        payload = {k: v for k, v in _BASE_VISUALIZATION.items() if k != "headerId"}
         
         with pytest.raises(ValidationError) as exc_info:
             Visualization(**payload)
         
-        error_str = str(exc_info.value)
-        assert "headerId" in error_str or "header_id" in error_str.lower()
+        assert error_locs(exc_info.value) == [("headerId",)]
     
     def test_invalid_nested_field_error(self):
         """Test that errors in nested objects reference the field path."""
@@ -525,13 +513,8 @@ class TestVisualizationErrorMessages:
         with pytest.raises(ValidationError) as exc_info:
             Visualization(**payload)
         
-        errors = exc_info.value.errors()
-        
-        # Should have location information
-        for error in errors:
-            assert "loc" in error
-            # Location should include 'agvPosition'
-            assert "agvPosition" in error["loc"] or "x" in error["loc"]
+        # The location includes the full path to the nested field
+        assert error_locs(exc_info.value) == [("agvPosition", "x")]
     
     def test_constraint_violation_error(self):
         """Test that constraint violations produce clear errors."""
@@ -542,8 +525,7 @@ class TestVisualizationErrorMessages:
         with pytest.raises(ValidationError) as exc_info:
             Visualization(**payload)
         
-        error_str = str(exc_info.value).lower()
-        assert "localizationscore" in error_str or "score" in error_str
+        assert error_locs(exc_info.value) == [("agvPosition", "localizationScore")]
 
 
 # =============================================================================
@@ -577,28 +559,24 @@ class TestVisualizationEdgeCases:
         assert msg.agvPosition.x == 0.0
         assert msg.velocity.vx == 0.0
     
-    def test_localization_score_boundaries(self):
-        """Test that localizationScore boundaries are enforced."""
-        # Valid boundaries
-        for score in [0.0, 0.5, 1.0]:
-            payload = make_minimal_visualization(
-                agvPosition=make_agv_position(localizationScore=score)
-            )
-            msg = Visualization(**payload)
-            assert msg.agvPosition.localizationScore == score
+    @pytest.mark.parametrize("score", [0.0, 0.5, 1.0])
+    def test_localization_score_within_bounds(self, score):
+        """Test that localizationScore accepts values from 0.0 to 1.0."""
+        payload = make_minimal_visualization(
+            agvPosition=make_agv_position(localizationScore=score)
+        )
         
-        # Invalid: > 1.0
-        with pytest.raises(ValidationError):
-            payload = make_minimal_visualization(
-                agvPosition=make_agv_position(localizationScore=1.1)
-            )
-            Visualization(**payload)
+        msg = Visualization(**payload)
+        assert msg.agvPosition.localizationScore == score
+    
+    @pytest.mark.parametrize("score", [1.1, -0.1])
+    def test_localization_score_out_of_bounds(self, score):
+        """Test that localizationScore outside 0.0-1.0 is rejected."""
+        payload = make_minimal_visualization(
+            agvPosition=make_agv_position(localizationScore=score)
+        )
         
-        # Invalid: < 0.0
         with pytest.raises(ValidationError):
-            payload = make_minimal_visualization(
-                agvPosition=make_agv_position(localizationScore=-0.1)
-            )
             Visualization(**payload)
     
     def test_special_characters_in_map_id(self):
@@ -1,24 +1,16 @@
 # tests/unit/test_agv_client.py
 
+import asyncio
 import pytest
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock
 from vda5050.clients.agv import AGVClient
-from vda5050.core.mqtt_abstraction import MQTTAbstraction
-from vda5050.core.topic_manager import TopicManager
+from vda5050.models.connection import ConnectionState
 from vda5050.models.factsheet import Factsheet
 from vda5050.models.order import Order
-from vda5050.models.instant_action import InstantActions
 from vda5050.models.state import State
-from vda5050.models.factsheet import (
-    TypeSpecification, PhysicalParameters, ProtocolLimits, ProtocolFeatures,
-    AgvGeometry, LoadSpecification, MaxStringLens, MaxArrayLens, Timing,
-    AgvKinematic, AgvClass, LocalizationType, NavigationType, ActionScope,
-    ValueDataType, ActionParameter, AgvAction, OptionalParameter, Support
-)
-from vda5050.models.order import Node, Edge, NodePosition
-from vda5050.models.base import Action, VDA5050Message
+from vda5050.models.visualization import Visualization
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def minimal_factsheet_dict():
     """Create a minimal valid Factsheet data structure."""
     return {
@@ -60,7 +52,7 @@ def minimal_factsheet_dict():
         "loadSpecification": {}
     }
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def minimal_order_dict():
     """Create a minimal valid Order data structure."""
     return {
@@ -80,7 +72,7 @@ def minimal_order_dict():
         "edges": []
     }
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def minimal_state_dict():
     """Create a minimal valid State data structure."""
     return {
@@ -109,117 +101,231 @@ def minimal_state_dict():
         }
     }
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def factsheet(minimal_factsheet_dict):
-    """Create a valid Factsheet instance."""
+    """Create a valid Factsheet instance, shared by the read-only tests."""
     return Factsheet(**minimal_factsheet_dict)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def factsheet_payload(factsheet):
+    """The Factsheet serialized once for the publish assertions."""
+    return factsheet.to_mqtt_payload()
+
+@pytest.fixture(scope="module")
 def order(minimal_order_dict):
-    """Create a valid Order instance."""
+    """Create a valid Order instance, shared by the read-only tests."""
     return Order(**minimal_order_dict)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def order_payload(order):
+    """The Order serialized once for the _handle_order tests."""
+    return order.to_mqtt_payload()
+
+@pytest.fixture(scope="module")
 def state(minimal_state_dict):
-    """Create a valid State instance."""
+    """Create a valid State instance, shared by the read-only tests."""
     return State(**minimal_state_dict)
 
-@pytest.fixture
-def mock_mqtt(monkeypatch):
-    """Mock MQTTAbstraction so subscribe and publish calls are captured."""
-    mqtt = Mock(spec=MQTTAbstraction)
-    mqtt.subscribe = AsyncMock(return_value=None)
-    mqtt.publish = AsyncMock(return_value=True)
-    monkeypatch.setattr(MQTTAbstraction, "__init__", lambda self, **kw: None)
-    monkeypatch.setattr(MQTTAbstraction, "connect", AsyncMock(return_value=True))
-    monkeypatch.setattr(MQTTAbstraction, "disconnect", AsyncMock(return_value=None))
-    monkeypatch.setattr(MQTTAbstraction, "subscribe", mqtt.subscribe)
-    monkeypatch.setattr(MQTTAbstraction, "publish", mqtt.publish)
-    return mqtt
+@pytest.fixture(scope="module")
+def state_payload(state):
+    """The State serialized once for the publish assertions."""
+    return state.to_mqtt_payload()
 
 @pytest.fixture
-def client(monkeypatch, mock_mqtt):
-    """Instantiate AGVClient with mocked MQTT and real TopicManager."""
-    monkeypatch.setattr(MQTTAbstraction, "__init__", lambda self, **kw: None)
-    agv = AGVClient("broker", "TestMan", "Test001")
-    agv.mqtt = mock_mqtt
-    agv.topic_manager = TopicManager("uagv", "2.1.0", "TestMan", "Test001")
+def client(mock_mqtt):
+    """Instantiate AGVClient over the mocked MQTT transport and real TopicManager."""
+    # Passing the mock as transport means no real MQTTAbstraction is built,
+    # so nothing on the class needs patching
+    agv = AGVClient("broker", "TestMan", "Test001", transport=mock_mqtt)
     agv._connected = True  # Mock the connection status
     return agv
 
-def test_setup_subscriptions(client, mock_mqtt):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_setup_subscriptions(client, mock_mqtt):
     """_setup_subscriptions should be a no-op since subscriptions are handled by base class."""
     # Call setup - should be a no-op now
-    import asyncio; asyncio.run(client._setup_subscriptions())
+    await client._setup_subscriptions()
     
     # No direct MQTT subscriptions should be made in _setup_subscriptions
     # The actual subscriptions are handled by register_handler calls in __init__
     # and set up during connection via _setup_registered_handlers
 
-def test_factsheet_sent_on_connect(client, mock_mqtt, factsheet):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_factsheet_sent_on_connect(client, mock_mqtt, factsheet, factsheet_payload):
     """_on_vda5050_connect should publish the stored Factsheet."""
     # store factsheet
-    import asyncio; asyncio.run(client.send_factsheet(factsheet))
+    await client.send_factsheet(factsheet)
 
     # simulate connect hook
-    import asyncio; asyncio.run(client._on_vda5050_connect())
+    await client._on_vda5050_connect()
 
     topic = "uagv/v2/TestMan/Test001/factsheet"
-    mock_mqtt.publish.assert_awaited_with(topic, factsheet.to_mqtt_payload(), retain=True)
+    mock_mqtt.publish.assert_awaited_with(topic, factsheet_payload, qos=1, retain=True)
 
-def test_handle_order_invokes_callbacks(client, order):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_handle_order_invokes_callbacks(client, order_payload):
     """_handle_order should parse payload and invoke registered callbacks."""
-    # prepare a valid Order
-    payload = order.to_mqtt_payload()
+    payload = order_payload
     called = []
     client.on_order_received(lambda o: called.append(o))
 
     topic = "uagv/v2/TestMan/Test001/order"
-    import asyncio; asyncio.run(client._handle_order(topic, payload))
+    await client._handle_order(topic, payload)
 
     assert len(called) == 1
     assert isinstance(called[0], Order)
     assert called[0].orderId == "o1"
 
-def test_handle_order_bad_payload_logs_error(client, caplog):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_handle_order_accepts_bytes_payload(client, order_payload):
+    """_handle_order should parse a raw bytes payload as delivered by MQTT."""
+    payload = order_payload.encode("utf-8")
+    called = []
+    client.on_order_received(lambda o: called.append(o))
+
+    await client._handle_order("uagv/v2/TestMan/Test001/order", payload)
+
+    assert len(called) == 1
+    assert called[0].orderId == "o1"
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_registered_handlers_get_decoded_payload(client, mock_mqtt, order_payload):
+    """User handlers get a str payload; the built-in order handler is fed raw bytes."""
+    received = []
+    async def handler(topic, payload):
+        received.append(payload)
+    client.register_handler("order", handler)
+
+    await client._setup_registered_handlers()
+    subscriptions, = mock_mqtt.subscribe_many.await_args[0]
+    assert mock_mqtt.subscribe_many.await_args[1] == {"raw": True}
+    topic, wrapper = subscriptions[-1]
+
+    await wrapper(topic, order_payload.encode("utf-8"))
+    assert received == [order_payload]
+    assert [r['raw'] for r in client._registered_handlers] == [True, True, False]
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_handle_order_runs_async_callbacks(client, order_payload):
+    """Coroutine callbacks should be scheduled as tasks and actually run."""
+    payload = order_payload
+    called = []
+    async def on_order(o):
+        called.append(o)
+    client.on_order_received(on_order)
+
+    await client._handle_order("uagv/v2/TestMan/Test001/order", payload)
+    await asyncio.gather(*client._callback_tasks)
+
+    assert len(called) == 1
+    assert called[0].orderId == "o1"
+    assert not client._callback_tasks
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_disconnect_cancels_async_callbacks(client, order_payload):
+    """disconnect() should cancel async callbacks that are still running."""
+    started = asyncio.Event()
+    async def on_order(o):
+        started.set()
+        await asyncio.Event().wait()
+    client.on_order_received(on_order)
+
+    await client._handle_order("uagv/v2/TestMan/Test001/order", order_payload)
+    task, = client._callback_tasks
+    await asyncio.wait_for(started.wait(), timeout=1.0)
+
+    await client.disconnect()
+    assert task.cancelled()
+    assert not client._callback_tasks
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_handle_order_bad_payload_logs_error(client, error_caplog):
     """Invalid Order JSON should log an error and not invoke callbacks."""
-    caplog.set_level("ERROR")
     called = []
     client.on_order_received(lambda o: called.append(o))
 
-    import asyncio; asyncio.run(client._handle_order("uagv/v2/TestMan/Test001/order", "bad"))
-    assert "Failed to parse Order payload" in caplog.text
+    await client._handle_order("uagv/v2/TestMan/Test001/order", "bad")
+    assert "Failed to parse Order payload" in error_caplog.text
     assert called == []
 
-def test_send_methods_publish(client, mock_mqtt, factsheet, state):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_send_methods_publish(
+    client, mock_mqtt, factsheet, state, factsheet_payload, state_payload
+):
     """send_factsheet, send_state, update_connection should call publish() correctly."""
     # Factsheet
-    import asyncio
-    res = asyncio.run(client.send_factsheet(factsheet))
+    res = await client.send_factsheet(factsheet)
     assert res is True
     mock_mqtt.publish.assert_awaited_with(
-        "uagv/v2/TestMan/Test001/factsheet", factsheet.to_mqtt_payload(), retain=True
+        "uagv/v2/TestMan/Test001/factsheet", factsheet_payload, qos=1, retain=True
     )
 
-    # State
-    res = asyncio.run(client.send_state(state))
+    # State (telemetry defaults to QoS 0)
+    res = await client.send_state(state)
     assert res is True
     mock_mqtt.publish.assert_awaited_with(
-        "uagv/v2/TestMan/Test001/state", state.to_mqtt_payload(), retain=False
+        "uagv/v2/TestMan/Test001/state", state_payload, qos=0, retain=False
+    )
+
+    # Visualization, with an explicit QoS override
+    visualization = Visualization(
+        headerId=1,
+        timestamp="2025-10-01T12:00:00Z",
+        version="2.1.0",
+        manufacturer="TestMan",
+        serialNumber="Test001"
+    )
+    res = await client.send_visualization(visualization, qos=1)
+    assert res is True
+    mock_mqtt.publish.assert_awaited_with(
+        "uagv/v2/TestMan/Test001/visualization", visualization.to_mqtt_payload(), qos=1, retain=False
     )
 
     # Connection
-    from vda5050.models.connection import ConnectionState
-    res = asyncio.run(client.update_connection(ConnectionState.OFFLINE))
+    res = await client.update_connection(ConnectionState.OFFLINE)
     assert res is True
     # The connection message will be properly serialized as JSON, not just a string
     # We'll verify the topic is correct and that publish was called
     mock_mqtt.publish.assert_awaited()
 
-def test_send_methods_handle_failure(client, mock_mqtt, factsheet, state):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_send_methods_handle_failure(client, mock_mqtt, factsheet, state):
     """Methods should return False when publish() fails."""
     mock_mqtt.publish = AsyncMock(return_value=False)
-    import asyncio
-    assert asyncio.run(client.send_factsheet(factsheet)) is False
-    assert asyncio.run(client.send_state(state)) is False
-    assert asyncio.run(client.update_connection("OK")) is False
+    assert await client.send_factsheet(factsheet) is False
+    assert await client.send_state(state) is False
+    assert await client.update_connection("OK") is False
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_shared_transport_left_connected_on_disconnect(mock_mqtt):
+    """A transport passed in by the caller is reused and not torn down by the client."""
+    shared = mock_mqtt
+
+    agv = AGVClient("broker", "TestMan", "Test001", transport=shared)
+    assert agv.mqtt is shared
+    await agv._setup_registered_handlers()
+    subscriptions, = shared.subscribe_many.await_args[0]
+    agv._connected = True
+
+    await agv.disconnect()
+
+    # OFFLINE state is still published over the shared connection
+    assert shared.publish.await_args[0][0] == "uagv/v2/TestMan/Test001/connection"
+    shared.disconnect.assert_not_awaited()
+    # Only this client's own subscriptions are removed from the transport
+    shared.unsubscribe_many.assert_awaited_once_with(subscriptions)
+    assert agv.is_connected() is False
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_owned_transport_disconnected_on_disconnect(monkeypatch, mock_mqtt):
+    """A client that built its own transport tears it down on disconnect."""
+    monkeypatch.setattr("vda5050.core.base_client.MQTTAbstraction", lambda **kwargs: mock_mqtt)
+
+    agv = AGVClient("broker", "TestMan", "Test001")
+    assert agv.mqtt is mock_mqtt
+    agv._connected = True
+
+    await agv.disconnect()
+
+    mock_mqtt.disconnect.assert_awaited_once()
+    assert agv.is_connected() is False
@@ -1,60 +1,30 @@
 # tests/unit/test_master_control_client.py
 
 import pytest
-from unittest.mock import AsyncMock, Mock
+from pydantic_core import to_json
 from vda5050.clients.master_control import MasterControlClient
-from vda5050.core.mqtt_abstraction import MQTTAbstraction
-from vda5050.core.topic_manager import TopicManager
 from vda5050.models.state import State
 from vda5050.models.order import Order
 from vda5050.models.instant_action import InstantActions
 
-@pytest.fixture
-def mock_mqtt(monkeypatch):
-    """Mock MQTTAbstraction so subscribe and publish calls are captured."""
-    mqtt = Mock(spec=MQTTAbstraction)
-    mqtt.subscribe = AsyncMock(return_value=None)
-    mqtt.publish = AsyncMock(return_value=True)
-    monkeypatch.setattr(MQTTAbstraction, "__init__", lambda self, **kwargs: None)
-    monkeypatch.setattr(MQTTAbstraction, "connect", AsyncMock(return_value=True))
-    monkeypatch.setattr(MQTTAbstraction, "disconnect", AsyncMock(return_value=None))
-    monkeypatch.setattr(MQTTAbstraction, "subscribe", mqtt.subscribe)
-    monkeypatch.setattr(MQTTAbstraction, "publish", mqtt.publish)
-    return mqtt
+def _never_call(*_):
+    """Callback for paths that must not reach the user callbacks."""
+    raise AssertionError("callback should not be invoked")
 
 @pytest.fixture
-def client(monkeypatch, mock_mqtt):
-    """Instantiate MasterControlClient with mocked MQTT and TopicManager."""
-    # Stub out MQTTAbstraction.__init__ so it doesn't overwrite mqtt/topic_manager
-    monkeypatch.setattr(MQTTAbstraction, "__init__", lambda self, *args, **kwargs: None)
-
-    # Create the client instance
-    mc = MasterControlClient("broker", "TestMan", "Test001")
-    # Inject the mocked MQTTAbstraction instance
-    mc.mqtt = mock_mqtt
-    # Create and assign a real TopicManager instance
-    mc.topic_manager = TopicManager("uagv", "2.1.0", "TestMan", "Test001")
+def client(mock_mqtt):
+    """Instantiate MasterControlClient over the mocked MQTT transport and real TopicManager."""
+    # Passing the mock as transport means no real MQTTAbstraction is built,
+    # so nothing on the class needs patching
+    mc = MasterControlClient("broker", "TestMan", "Test001", transport=mock_mqtt)
     # Mark as connected for testing
     mc._connected = True
     return mc
 
-def test_setup_subscriptions(client, mock_mqtt):
-    """
-    _setup_subscriptions should be a no-op since subscriptions are handled by base class.
-    """
-    # Call setup - should be a no-op now
-    import asyncio; asyncio.run(client._setup_subscriptions())
-    
-    # No direct MQTT subscriptions should be made in _setup_subscriptions
-    # The actual subscriptions are handled by register_handler calls in __init__
-    # and set up during connection via _setup_registered_handlers
-
-def test_handle_state_invokes_callbacks(client):
-    """
-    _handle_state parses topic, builds State, and calls registered callbacks.
-    """
-    # Prepare a fake State JSON with required fields
-    payload = State(
+@pytest.fixture(scope="module")
+def state_msg():
+    """A valid State message, built once and only read by the tests."""
+    return State(
         headerId=1,
         timestamp="2025-10-01T12:00:00Z",
         version="2.1.0",
@@ -71,33 +41,97 @@ def test_handle_state_invokes_callbacks(client):
         actionStates=[],
         batteryState={"batteryCharge": 100.0, "charging": False},
         errors=[],
-        safetyState={"eStop": "NONE", "fieldViolation": False},
-        position={"x": 1, "y": 2, "theta": 0, "mapId": "test_map"},
-        info={}
-    ).model_dump_json()
+        safetyState={"eStop": "NONE", "fieldViolation": False}
+    )
+
+@pytest.fixture(scope="module")
+def state_payload_json(state_msg):
+    """state_msg serialized once for the _handle_state tests."""
+    return state_msg.model_dump_json()
+
+@pytest.fixture(scope="module")
+def order_msg():
+    """A valid Order message, built once and only read by the tests."""
+    return Order(
+        orderId="o1",
+        headerId=1,
+        timestamp="2025-10-01T12:00:00Z",
+        version="2.1.0",
+        manufacturer="TestMan",
+        serialNumber="Test001",
+        orderUpdateId=1,
+        nodes=[],
+        edges=[]
+    )
+
+@pytest.fixture(scope="module")
+def instant_actions_msg():
+    """A valid InstantActions message, built once and only read by the tests."""
+    return InstantActions(
+        headerId=1,
+        timestamp="2025-10-01T12:00:00Z",
+        version="2.1.0",
+        manufacturer="TestMan",
+        serialNumber="Test001",
+        actions=[]
+    )
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_setup_subscriptions(client, mock_mqtt):
+    """
+    _setup_subscriptions should be a no-op since subscriptions are handled by base class.
+    """
+    # Call setup - should be a no-op now
+    await client._setup_subscriptions()
+    
+    # No direct MQTT subscriptions should be made in _setup_subscriptions
+    # The actual subscriptions are handled by register_handler calls in __init__
+    # and set up during connection via _setup_registered_handlers
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_registered_handlers_subscribe_in_one_call(client, mock_mqtt):
+    """
+    _setup_registered_handlers should send all wildcard topics in a single subscribe_many call.
+    """
+    await client._setup_registered_handlers()
+
+    mock_mqtt.subscribe_many.assert_awaited_once()
+    topics = [topic for topic, _ in mock_mqtt.subscribe_many.await_args[0][0]]
+    assert topics == [
+        "uagv/v2/+/+/state",
+        "uagv/v2/+/+/connection",
+        "uagv/v2/+/+/factsheet",
+    ]
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_handle_state_invokes_callbacks(client, state_payload_json):
+    """
+    _handle_state parses topic, builds State, and calls registered callbacks.
+    """
     # Spy callback
     called = []
     client.on_state_update(lambda serial, st: called.append((serial, st)))
 
     # Simulate handling
     topic = "uagv/v2/TestMan/Test001/state"
-    import asyncio; asyncio.run(client._handle_state(topic, payload))
+    await client._handle_state(topic, state_payload_json)
 
     assert called and called[0][0] == "Test001"
     assert isinstance(called[0][1], State)
 
-def test_handle_state_bad_payload_logs_error(client, caplog):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_handle_state_bad_payload_logs_error(client, error_caplog):
     """
     Invalid JSON payload should log an error and not raise.
     """
-    caplog.set_level("ERROR")
-    client.on_state_update(lambda *_: (_ for _ in ()).throw(AssertionError()))
+    client.on_state_update(_never_call)
 
     # Bad JSON
-    import asyncio; asyncio.run(client._handle_state("uagv/v2/TestMan/Test001/state", "notjson"))
-    assert "Failed to parse State payload" in caplog.text
+    await client._handle_state("uagv/v2/TestMan/Test001/state", "notjson")
+    assert "Failed to parse State payload" in error_caplog.text
 
-def test_handle_connection_invokes_callbacks(client):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_handle_connection_invokes_callbacks(client):
     """
     _handle_connection parses topic and invokes connection-change callbacks.
     """
@@ -105,28 +139,25 @@ def test_handle_connection_invokes_callbacks(client):
     client.on_connection_change(lambda serial, st: called.append((serial, st)))
 
     topic = "uagv/v2/TestMan/Test001/connection"
-    # Use proper JSON payload for Connection message
-    payload = '{"headerId": 1, "timestamp": "2023-01-01T00:00:00Z", "version": "2.1.0", "manufacturer": "TestMan", "serialNumber": "Test001", "connectionState": "ONLINE"}'
-    import asyncio; asyncio.run(client._handle_connection(topic, payload))
+    # Raw Connection JSON, serialized straight from a dict by pydantic-core
+    payload = to_json({
+        "headerId": 1,
+        "timestamp": "2023-01-01T00:00:00Z",
+        "version": "2.1.0",
+        "manufacturer": "TestMan",
+        "serialNumber": "Test001",
+        "connectionState": "ONLINE",
+    })
+    await client._handle_connection(topic, payload)
 
     assert called == [("Test001", "ONLINE")]
 
-def test_send_order_calls_publish(client, mock_mqtt):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_send_order_calls_publish(client, mock_mqtt, order_msg):
     """
     send_order should call _publish_message via MQTT.publish and return True.
     """
-    order = Order(
-        orderId="o1",
-        headerId=1,
-        timestamp="2025-10-01T12:00:00Z",
-        version="2.1.0",
-        manufacturer="TestMan",
-        serialNumber="Test001",
-        orderUpdateId=1,
-        nodes=[],
-        edges=[]
-    )
-    import asyncio; result = asyncio.run(client.send_order("TestMan", "Test001", order))
+    result = await client.send_order("TestMan", "Test001", order_msg)
     assert result is True
     # Verify that publish was called with correct topic
     topic = client.topic_manager.get_target_topic("order", "TestMan", "Test001")
@@ -139,19 +170,12 @@ def test_send_order_calls_publish(client, mock_mqtt):
     assert "TestMan" in payload
     assert "Test001" in payload
 
-def test_send_instant_action_calls_publish(client, mock_mqtt):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_send_instant_action_calls_publish(client, mock_mqtt, instant_actions_msg):
     """
     send_instant_action should call MQTT.publish and return True.
     """
-    action = InstantActions(
-        headerId=1,
-        timestamp="2025-10-01T12:00:00Z",
-        version="2.1.0",
-        manufacturer="TestMan",
-        serialNumber="Test001",
-        actions=[]
-    )
-    import asyncio; result = asyncio.run(client.send_instant_action("TestMan", "Test001", action))
+    result = await client.send_instant_action("TestMan", "Test001", instant_actions_msg)
     assert result is True
     topic = client.topic_manager.get_target_topic("instantActions", "TestMan", "Test001")
     # Get the actual call arguments to verify the correct topic and payload
@@ -1,23 +1,34 @@
 import asyncio
 import pytest
-from unittest.mock import Mock, patch
+import pytest_asyncio
+from unittest.mock import MagicMock, Mock
 import paho.mqtt.client as mqtt
 from vda5050.core.mqtt_abstraction import MQTTAbstraction, ConnectionState
 
+@pytest.fixture(autouse=True)
+def fake_client(monkeypatch):
+    """
+    Patch paho's Client constructor once per test to return a spec'd fake.
+    spec_set keeps the fake to paho's real Client attributes.
+    """
+    fake = MagicMock(spec_set=mqtt.Client)
+    monkeypatch.setattr("paho.mqtt.client.Client", lambda *args, **kwargs: fake)
+    return fake
+
+@pytest_asyncio.fixture
+async def mqtt_pair(fake_client):
+    """
+    (MQTTAbstraction, fake paho client) pair with default broker settings.
+    Built inside the test's event loop, which the abstraction captures.
+    """
+    return MQTTAbstraction("host", 1883), fake_client
+
 # 1. Test successful connect()
 #    - Mocks paho-mqtt Client.connect to do nothing
 #    - Simulates on_connect callback with rc=0
 #    - Expects connect() to return True and state to be CONNECTED
 @pytest.mark.asyncio
-async def test_connect_success(monkeypatch):
-    fake_client = Mock()
-    fake_client.connect = Mock()
-    fake_client.loop_start = Mock()
-    fake_client.loop_stop = Mock()
-    
-    # Patch mqtt.Client constructor
-    monkeypatch.setattr("paho.mqtt.client.Client", lambda api_version=None, client_id=None: fake_client)
-    
+async def test_connect_success(fake_client):
     # Build abstraction
     mqtt_abstraction = MQTTAbstraction("host", 1883, client_id="test")
     
@@ -26,15 +37,11 @@ async def test_connect_success(monkeypatch):
     assert fake_client.on_disconnect == mqtt_abstraction._on_disconnect
     assert fake_client.on_message == mqtt_abstraction._on_message
     
-    # Spy on set() event
-    async def trigger_connect():
-        # delay to let connect() subscribe event
-        await asyncio.sleep(0.01)
-        # simulate paho invoking on_connect with rc=0
-        mqtt_abstraction._on_connect(fake_client, None, None, 0, None)
-
-    # Schedule connect trigger
-    asyncio.create_task(trigger_connect())
+    # Simulate paho invoking on_connect with rc=0 on the next loop tick,
+    # while connect() is awaiting the broker connect in the executor
+    asyncio.get_running_loop().call_soon(
+        mqtt_abstraction._on_connect, fake_client, None, None, 0, None
+    )
 
     # Call connect()
     result = await mqtt_abstraction.connect(timeout=1.0)
@@ -45,34 +52,53 @@ async def test_connect_success(monkeypatch):
     fake_client.connect.assert_called_once_with("host", 1883, 60)
     fake_client.loop_start.assert_called_once()
 
+    # Stop the message processor started by connect()
+    await mqtt_abstraction.disconnect()
+    assert mqtt_abstraction._processor_task is None
+
+# 1.1. Test concurrent connect() calls share one attempt
+#    - Starts two connect() calls before the broker has answered
+#    - Verifies paho's connect and loop_start run once and both calls succeed
+@pytest.mark.asyncio
+async def test_concurrent_connect_connects_once(mqtt_pair):
+    mqtt_abstraction, fake_client = mqtt_pair
+    fake_client.connect.side_effect = lambda *args: mqtt_abstraction._on_connect(
+        fake_client, None, None, 0, None
+    )
+
+    results = await asyncio.gather(
+        mqtt_abstraction.connect(timeout=1.0), mqtt_abstraction.connect(timeout=1.0)
+    )
+
+    assert results == [True, True]
+    fake_client.connect.assert_called_once()
+    fake_client.loop_start.assert_called_once()
+    await mqtt_abstraction.disconnect()
+
 # 2. Test connect failure
 #    - Mocks Client.connect to raise
 #    - Expects connect() to return False and state to remain DISCONNECTED
 @pytest.mark.asyncio
-async def test_connect_failure(monkeypatch):
-    fake_client = Mock()
+async def test_connect_failure(mqtt_pair):
+    mqtt_abstraction, fake_client = mqtt_pair
     fake_client.connect.side_effect = RuntimeError("fail")
-    monkeypatch.setattr("paho.mqtt.client.Client", lambda api_version=None, client_id=None: fake_client)
 
-    mqtt = MQTTAbstraction("host", 1883)
-    result = await mqtt.connect(timeout=0.1)
+    result = await mqtt_abstraction.connect(timeout=0.1)
     assert result is False
-    assert mqtt._state == ConnectionState.DISCONNECTED
+    assert mqtt_abstraction._state == ConnectionState.DISCONNECTED
 
 # 3. Test publish when connected
 #    - Sets state to CONNECTED
 #    - Mocks client.publish returning an object with wait_for_publish
 #    - Expects publish() to return True
 @pytest.mark.asyncio
-async def test_publish_connected(monkeypatch):
-    fake_info = Mock()
-    fake_info.wait_for_publish = Mock()
-    fake_client = Mock(publish=Mock(return_value=fake_info))
-    monkeypatch.setattr("paho.mqtt.client.Client", lambda api_version=None, client_id=None: fake_client)
+async def test_publish_connected(mqtt_pair):
+    fake_info = Mock(spec_set=mqtt.MQTTMessageInfo)
+    mqtt_abstraction, fake_client = mqtt_pair
+    fake_client.publish.return_value = fake_info
 
-    mqtt = MQTTAbstraction("host", 1883)
-    mqtt._state = ConnectionState.CONNECTED
-    result = await mqtt.publish("topic", "payload")
+    mqtt_abstraction._state = ConnectionState.CONNECTED
+    result = await mqtt_abstraction.publish("topic", "payload")
     assert result is True
     fake_client.publish.assert_called_with("topic", "payload", qos=1, retain=False)
     fake_info.wait_for_publish.assert_called()
@@ -81,11 +107,8 @@ async def test_publish_connected(monkeypatch):
 #    - Leaves state DISCONNECTED
 #    - Expects publish() to raise RuntimeError
 @pytest.mark.asyncio
-async def test_publish_not_connected(monkeypatch):
-    fake_client = Mock()
-    monkeypatch.setattr("paho.mqtt.client.Client", lambda api_version=None, client_id=None: fake_client)
-
-    mqtt_abstraction = MQTTAbstraction("host", 1883)
+async def test_publish_not_connected(mqtt_pair):
+    mqtt_abstraction, _ = mqtt_pair
     with pytest.raises(RuntimeError):
         await mqtt_abstraction.publish("topic", "payload")
 
@@ -94,13 +117,9 @@ async def test_publish_not_connected(monkeypatch):
 #    - Calls disconnect()
 #    - Asserts loop_stop() and disconnect() on client were called
 @pytest.mark.asyncio
-async def test_disconnect(monkeypatch):
-    fake_client = Mock()
-    fake_client.loop_stop = Mock()
-    fake_client.disconnect = Mock()
-    monkeypatch.setattr("paho.mqtt.client.Client", lambda api_version=None, client_id=None: fake_client)
+async def test_disconnect(mqtt_pair):
+    mqtt_abstraction, fake_client = mqtt_pair
 
-    mqtt_abstraction = MQTTAbstraction("host", 1883)
     mqtt_abstraction._state = ConnectionState.CONNECTED
     
     await mqtt_abstraction.disconnect()
@@ -115,13 +134,10 @@ async def test_disconnect(monkeypatch):
 #    - Registers exact topic and wildcard topic
 #    - Verifies internal handler maps
 @pytest.mark.asyncio
-async def test_subscribe_registration(monkeypatch):
-    import paho.mqtt.client as mqtt_client
-    fake_client = Mock()
-    fake_client.subscribe = Mock(return_value=(mqtt_client.MQTT_ERR_SUCCESS, 1))
-    monkeypatch.setattr("paho.mqtt.client.Client", lambda api_version=None, client_id=None: fake_client)
+async def test_subscribe_registration(mqtt_pair):
+    mqtt_abstraction, fake_client = mqtt_pair
+    fake_client.subscribe.return_value = (mqtt.MQTT_ERR_SUCCESS, 1)
 
-    mqtt_abstraction = MQTTAbstraction("host", 1883)
     def handler_a(t, p): pass
     def handler_b(t, p): pass
 
@@ -132,58 +148,299 @@ async def test_subscribe_registration(monkeypatch):
     await mqtt_abstraction.subscribe("wild/+/topic", handler_b)
     assert "wild/+/topic" in mqtt_abstraction._wildcard_handlers
 
+# 5.5. Test subscribe_many batches topics into one SUBSCRIBE
+#    - Mocks client.subscribe returning success
+#    - Registers exact and wildcard topics in one call
+#    - Verifies a single client.subscribe call with all (topic, qos) pairs
+@pytest.mark.asyncio
+async def test_subscribe_many_single_call(mqtt_pair):
+    mqtt_abstraction, fake_client = mqtt_pair
+    fake_client.subscribe.return_value = (mqtt.MQTT_ERR_SUCCESS, 1)
+
+    def handler_a(t, p): pass
+    def handler_b(t, p): pass
+
+    await mqtt_abstraction.subscribe_many([("exact/topic", handler_a), ("wild/+/topic", handler_b)])
+
+    fake_client.subscribe.assert_called_once_with([("exact/topic", 1), ("wild/+/topic", 1)])
+    assert mqtt_abstraction._handlers["exact/topic"] == [(handler_a, False)]
+    assert mqtt_abstraction._wildcard_handlers["wild/+/topic"] == [(handler_b, False)]
+
+# 5.6. Test handlers sharing a topic are all kept and removed independently
+#    - Subscribes two handlers to the same wildcard topic, as two clients would
+#    - Verifies a message reaches both
+#    - Verifies UNSUBSCRIBE is only sent once the last handler is removed
+@pytest.mark.asyncio
+async def test_shared_topic_handlers(mqtt_pair):
+    mqtt_abstraction, fake_client = mqtt_pair
+    fake_client.subscribe.return_value = (mqtt.MQTT_ERR_SUCCESS, 1)
+    fake_client.unsubscribe.return_value = (mqtt.MQTT_ERR_SUCCESS, 2)
+    mqtt_abstraction._state = ConnectionState.CONNECTED
+
+    called = []
+    async def handler_a(topic, payload):
+        called.append("a")
+    async def handler_b(topic, payload):
+        called.append("b")
+
+    await mqtt_abstraction.subscribe("test/+/state", handler_a)
+    await mqtt_abstraction.subscribe("test/+/state", handler_b)
+    await mqtt_abstraction._route("test/x/state", b"{}")
+    assert called == ["a", "b"]
+
+    await mqtt_abstraction.unsubscribe("test/+/state", handler_a)
+    fake_client.unsubscribe.assert_not_called()
+    called.clear()
+    await mqtt_abstraction._route("test/x/state", b"{}")
+    assert called == ["b"]
+
+    await mqtt_abstraction.unsubscribe("test/+/state", handler_b)
+    fake_client.unsubscribe.assert_called_once_with(["test/+/state"])
+    assert not mqtt_abstraction._wildcard_handlers
+    assert not mqtt_abstraction._wildcard_regexes
+
 # 6. Test message routing to correct handler
 #    - Registers one exact handler and one wildcard handler
 #    - Enqueues matching and non-matching messages
 #    - Verifies only appropriate handlers are called
 @pytest.mark.asyncio
-async def test_message_routing(monkeypatch):
-    fake_client = Mock()
-    fake_client.subscribe = Mock(return_value=(mqtt.MQTT_ERR_SUCCESS, 1))
-    monkeypatch.setattr("paho.mqtt.client.Client", lambda api_version=None, client_id=None: fake_client)
+async def test_message_routing(mqtt_pair):
+    mqtt_abstraction, fake_client = mqtt_pair
+    fake_client.subscribe.return_value = (mqtt.MQTT_ERR_SUCCESS, 1)
 
-    mqtt_abstraction = MQTTAbstraction("host", 1883)
     mqtt_abstraction._state = ConnectionState.CONNECTED
     mqtt_abstraction._running = True
 
     called = []
+    both_done = asyncio.Event()
     async def handler_exact(topic, payload):
         called.append(("exact", topic, payload))
+        if len(called) == 2:
+            both_done.set()
     async def handler_wild(topic, payload):
         called.append(("wild", topic, payload))
+        if len(called) == 2:
+            both_done.set()
 
     await mqtt_abstraction.subscribe("test/topic", handler_exact)
     await mqtt_abstraction.subscribe("test/+/val", handler_wild)
 
     # Schedule the processor in background
-    processor_task = asyncio.create_task(mqtt_abstraction._message_processor())
+    mqtt_abstraction._processor_task = asyncio.create_task(mqtt_abstraction._message_processor())
 
     # Enqueue messages
-    await mqtt_abstraction._message_queue.put(("test/topic", "a"))
-    await mqtt_abstraction._message_queue.put(("test/foo/val", "b"))
+    mqtt_abstraction._enqueue("test/topic", "a")
+    mqtt_abstraction._enqueue("test/foo/val", "b")
+
+    # Wait until both handlers have run, before disconnect() cancels anything
+    await asyncio.wait_for(both_done.wait(), timeout=1.0)
 
-    # Give the processor time to handle messages
-    await asyncio.sleep(0.05)
+    assert sorted(called) == [("exact", "test/topic", "a"), ("wild", "test/foo/val", "b")]
 
     # Stop the processor loop and wait for it to finish
+    await mqtt_abstraction.disconnect()
+
+# 6.0.1. Test handlers get decoded text unless registered as raw
+#    - Registers a default handler and a raw handler
+#    - Routes a bytes payload to each
+#    - Verifies str for the default handler and bytes for the raw one
+@pytest.mark.asyncio
+async def test_route_decodes_unless_raw(mqtt_pair):
+    mqtt_abstraction, fake_client = mqtt_pair
+    fake_client.subscribe.return_value = (mqtt.MQTT_ERR_SUCCESS, 1)
+
+    received = {}
+    async def handler_text(topic, payload):
+        received["text"] = payload
+    async def handler_raw(topic, payload):
+        received["raw"] = payload
+
+    await mqtt_abstraction.subscribe("test/text", handler_text)
+    await mqtt_abstraction.subscribe("test/+/raw", handler_raw, raw=True)
+
+    await mqtt_abstraction._route("test/text", b'{"a": 1}')
+    await mqtt_abstraction._route("test/x/raw", b'{"a": 1}')
+
+    assert received == {"text": '{"a": 1}', "raw": b'{"a": 1}'}
+
+# 6.0.2. Test a message reaches every matching subscription
+#    - Subscribes an exact topic and an overlapping wildcard
+#    - Verifies both handlers get the message, not only the exact match
+#    - Verifies an undecodable payload is logged and still reaches raw handlers
+@pytest.mark.asyncio
+async def test_route_fans_out_to_all_matches(mqtt_pair, error_caplog):
+    mqtt_abstraction, fake_client = mqtt_pair
+    fake_client.subscribe.return_value = (mqtt.MQTT_ERR_SUCCESS, 1)
+
+    called = []
+    async def handler_exact(topic, payload):
+        called.append(("exact", payload))
+    async def handler_wild(topic, payload):
+        called.append(("wild", payload))
+
+    await mqtt_abstraction.subscribe("test/a/val", handler_exact)
+    await mqtt_abstraction.subscribe("test/+/val", handler_wild, raw=True)
+
+    await mqtt_abstraction._route("test/a/val", b"x")
+    assert called == [("exact", "x"), ("wild", b"x")]
+
+    called.clear()
+    await mqtt_abstraction._route("test/a/val", b"\xff")
+    assert called == [("wild", b"\xff")]
+    assert "Error handling message on topic test/a/val" in error_caplog.text
+
+# 6.1. Test wildcard patterns are compiled once and match MQTT levels
+#    - '+' matches exactly one level, '#' the remainder
+#    - Other characters, such as '.', match literally
+def test_compile_wildcard():
+    single = MQTTAbstraction._compile_wildcard("uagv/v2/+/+/state")
+    assert single.fullmatch("uagv/v2/Man/AGV1/state")
+    assert not single.fullmatch("uagv/v2/Man/AGV1/extra/state")
+
+    multi = MQTTAbstraction._compile_wildcard("site.a/#")
+    assert multi.fullmatch("site.a/x/y")
+    assert not multi.fullmatch("siteXa/x")
+
+# 6.5. Test slow handler does not block later messages
+#    - Registers a handler that blocks on an event and a fast handler
+#    - Enqueues the slow message first
+#    - Verifies the fast message is handled while the slow one is pending
+@pytest.mark.asyncio
+async def test_slow_handler_does_not_block(mqtt_pair):
+    mqtt_abstraction, fake_client = mqtt_pair
+    fake_client.subscribe.return_value = (mqtt.MQTT_ERR_SUCCESS, 1)
+
+    mqtt_abstraction._running = True
+
+    release = asyncio.Event()
+    fast_done = asyncio.Event()
+    async def handler_slow(topic, payload):
+        await release.wait()
+    async def handler_fast(topic, payload):
+        fast_done.set()
+
+    await mqtt_abstraction.subscribe("test/slow", handler_slow)
+    await mqtt_abstraction.subscribe("test/fast", handler_fast)
+
+    mqtt_abstraction._processor_task = asyncio.create_task(mqtt_abstraction._message_processor())
+    mqtt_abstraction._enqueue("test/slow", "a")
+    mqtt_abstraction._enqueue("test/fast", "b")
+
+    await asyncio.wait_for(fast_done.wait(), timeout=1.0)
+    assert len(mqtt_abstraction._pending) == 1
+
+    release.set()
+    await mqtt_abstraction.disconnect()
+
+# 6.5.1. Test disconnect cancels handlers still in flight
+#    - Dispatches a message to a handler that never finishes
+#    - Verifies disconnect() cancels it and leaves nothing pending
+@pytest.mark.asyncio
+async def test_disconnect_cancels_pending_handlers(mqtt_pair):
+    mqtt_abstraction, fake_client = mqtt_pair
+    fake_client.subscribe.return_value = (mqtt.MQTT_ERR_SUCCESS, 1)
+
+    mqtt_abstraction._running = True
+
+    started = asyncio.Event()
+    cancelled = []
+    async def handler_stuck(topic, payload):
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(topic)
+            raise
+
+    await mqtt_abstraction.subscribe("test/stuck", handler_stuck)
+
+    mqtt_abstraction._processor_task = asyncio.create_task(mqtt_abstraction._message_processor())
+    mqtt_abstraction._enqueue("test/stuck", "a")
+    await asyncio.wait_for(started.wait(), timeout=1.0)
+
+    await mqtt_abstraction.disconnect()
+    assert cancelled == ["test/stuck"]
+    assert not mqtt_abstraction._pending
+
+# 6.5.2. Test the processor stops while the in-flight limit is reached
+#    - Fills MAX_INFLIGHT with handlers that never finish, plus one queued message
+#    - Signals stop without cancelling the handlers
+#    - Verifies the processor exits instead of waiting for a free slot
+@pytest.mark.asyncio
+async def test_processor_stops_when_inflight_saturated(mqtt_pair):
+    mqtt_abstraction, fake_client = mqtt_pair
+    fake_client.subscribe.return_value = (mqtt.MQTT_ERR_SUCCESS, 1)
+    mqtt_abstraction.MAX_INFLIGHT = 2
+    mqtt_abstraction._running = True
+
+    async def handler_stuck(topic, payload):
+        await asyncio.Event().wait()
+
+    await mqtt_abstraction.subscribe("test/stuck", handler_stuck)
+
+    processor_task = asyncio.create_task(mqtt_abstraction._message_processor())
+    for payload in ("a", "b", "c"):
+        mqtt_abstraction._enqueue("test/stuck", payload)
+    while len(mqtt_abstraction._pending) < 2:
+        await asyncio.sleep(0)
+
     mqtt_abstraction._running = False
-    await processor_task
+    mqtt_abstraction._stop_event.set()
+    await asyncio.wait_for(processor_task, timeout=1.0)
+    assert len(mqtt_abstraction._pending) == 2
+
+    await mqtt_abstraction._cancel_pending()
+
+# 6.5.3. Test disconnect completes while the in-flight limit is reached
+#    - Runs the processor with MAX_INFLIGHT handlers that never finish
+#    - Verifies disconnect() returns in time and stops processor and handlers
+@pytest.mark.asyncio
+async def test_disconnect_with_saturated_inflight(mqtt_pair):
+    mqtt_abstraction, fake_client = mqtt_pair
+    fake_client.subscribe.return_value = (mqtt.MQTT_ERR_SUCCESS, 1)
+    mqtt_abstraction.MAX_INFLIGHT = 2
+    mqtt_abstraction._running = True
 
-    assert ("exact", "test/topic", "a") in called
-    assert ("wild", "test/foo/val", "b") in called
+    async def handler_stuck(topic, payload):
+        await asyncio.Event().wait()
+
+    await mqtt_abstraction.subscribe("test/stuck", handler_stuck)
+
+    processor_task = asyncio.create_task(mqtt_abstraction._message_processor())
+    mqtt_abstraction._processor_task = processor_task
+    for payload in ("a", "b", "c"):
+        mqtt_abstraction._enqueue("test/stuck", payload)
+    while len(mqtt_abstraction._pending) < 2:
+        await asyncio.sleep(0)
+
+    await asyncio.wait_for(mqtt_abstraction.disconnect(), timeout=1.0)
+    assert processor_task.done()
+    assert not mqtt_abstraction._pending
+
+# 6.6. Test incoming messages are queued from the network thread
+#    - Invokes _on_message from a separate thread, as paho does
+#    - Verifies the raw bytes payload lands on the queue without a helper task
+@pytest.mark.asyncio
+async def test_on_message_queues_payload(mqtt_pair):
+    mqtt_abstraction, fake_client = mqtt_pair
+
+    msg = mqtt.MQTTMessage(topic=b"test/topic")
+    msg.payload = b'{"a": 1}'
+
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, mqtt_abstraction._on_message, fake_client, None, msg)
+
+    await asyncio.wait_for(mqtt_abstraction._msg_event.wait(), timeout=1.0)
+    assert mqtt_abstraction._msg_deque.popleft() == ("test/topic", b'{"a": 1}')
 
 # 7. Test automatic reconnection logic scheduling
 #    - Simulates on_disconnect with rc!=0
 #    - Patches connect() to succeed
 #    - Verifies state transitions back to CONNECTED
 @pytest.mark.asyncio
-async def test_reconnect(monkeypatch):
-    fake_client = Mock()
-    fake_client.loop_start = Mock()
-    fake_client.loop_stop = Mock()
-    monkeypatch.setattr("paho.mqtt.client.Client", lambda api_version=None, client_id=None: fake_client)
+async def test_reconnect(mqtt_pair):
+    mqtt_abstraction, fake_client = mqtt_pair
 
-    mqtt_abstraction = MQTTAbstraction("host", 1883)
     # Patch connect to set state and return True
     async def fake_connect(timeout=10.0):
         mqtt_abstraction._state = ConnectionState.CONNECTED
@@ -191,19 +448,66 @@ async def test_reconnect(monkeypatch):
         return True
     mqtt_abstraction.connect = fake_connect
 
-    # Trigger unexpected disconnect
+    # Retry immediately instead of after the default backoff
+    mqtt_abstraction.RECONNECT_MIN_DELAY = 0
+
+    # Trigger unexpected disconnect (paho v2 callback signature)
     mqtt_abstraction._state = ConnectionState.CONNECTED
-    mqtt_abstraction._on_disconnect(fake_client, None, rc=1)
+    mqtt_abstraction._on_disconnect(fake_client, None, None, 1, None)
     
     # Verify state is set to DISCONNECTED
     assert mqtt_abstraction._state == ConnectionState.DISCONNECTED
     
-    # Let the scheduled reconnection task run
+    # One loop tick runs the call_soon_threadsafe callback that starts the task
     await asyncio.sleep(0)
-    
-    # If the task didn't run automatically, trigger it manually
-    if mqtt_abstraction._state == ConnectionState.DISCONNECTED:
-        await mqtt_abstraction._reconnect()
+    await asyncio.wait_for(mqtt_abstraction._reconnect_task, timeout=1.0)
     
     # Verify state is back to CONNECTED
     assert mqtt_abstraction._state == ConnectionState.CONNECTED
+
+# 7.0.1. Test disconnect cancels a reconnect in progress
+#    - Simulates an unexpected disconnect so the reconnect loop starts its backoff
+#    - Calls disconnect() during the backoff
+#    - Verifies the reconnect task is cancelled and never reconnects
+@pytest.mark.asyncio
+async def test_disconnect_cancels_reconnect(mqtt_pair):
+    mqtt_abstraction, fake_client = mqtt_pair
+
+    mqtt_abstraction._state = ConnectionState.CONNECTED
+    mqtt_abstraction._on_disconnect(fake_client, None, None, 1, None)
+    await asyncio.sleep(0)
+    reconnect_task = mqtt_abstraction._reconnect_task
+    assert reconnect_task is not None and not reconnect_task.done()
+
+    await asyncio.wait_for(mqtt_abstraction.disconnect(), timeout=1.0)
+
+    assert reconnect_task.cancelled()
+    assert mqtt_abstraction._reconnect_task is None
+    fake_client.connect.assert_not_called()
+
+# 7.1. Test reconnecting keeps a single message processor
+#    - Connects through the real connect(), with paho's connect firing on_connect
+#    - Simulates an unexpected disconnect and lets the reconnect loop run
+#    - Verifies the original processor is reused rather than a second one started
+@pytest.mark.asyncio
+async def test_reconnect_reuses_processor(mqtt_pair):
+    mqtt_abstraction, fake_client = mqtt_pair
+    fake_client.connect.side_effect = lambda *args: mqtt_abstraction._on_connect(
+        fake_client, None, None, 0, None
+    )
+    mqtt_abstraction.RECONNECT_MIN_DELAY = 0
+
+    assert await mqtt_abstraction.connect(timeout=1.0)
+    processor_task = mqtt_abstraction._processor_task
+
+    mqtt_abstraction._on_disconnect(fake_client, None, None, 1, None)
+    await asyncio.sleep(0)
+    await asyncio.wait_for(mqtt_abstraction._reconnect_task, timeout=1.0)
+
+    assert mqtt_abstraction._state == ConnectionState.CONNECTED
+    assert fake_client.connect.call_count == 2
+    assert mqtt_abstraction._processor_task is processor_task
+    assert not processor_task.done()
+
+    await mqtt_abstraction.disconnect()
+    assert processor_task.done()
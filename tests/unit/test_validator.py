@@ -3,6 +3,7 @@
 import pytest
 import json
 from pathlib import Path
+from pydantic_core import from_json
 from jsonschema import ValidationError as JSONSchemaValidationError
 from vda5050.validation.validator import MessageValidator
 from vda5050.utils.exceptions import ValidationError as VDA5050ValidationError
@@ -11,8 +12,20 @@ from vda5050.utils.exceptions import ValidationError as VDA5050ValidationError
 # Three levels up from tests/unit → project root, then into src/vda5050/validation/schemas
 SCHEMAS_DIR = Path(__file__).resolve().parents[2] / "src" / "vda5050" / "validation" / "schemas"
 
-@pytest.fixture
+# Serialized once; the str and bytes tests only read them
+_VALID_CONNECTION_JSON = json.dumps({
+    "headerId": 2,
+    "timestamp": "2025-10-01T13:00:00Z",
+    "version": "2.1.0",
+    "manufacturer": "TestMan",
+    "serialNumber": "AGV002",
+    "connectionState": "OFFLINE"
+})
+_VALID_CONNECTION_JSON_BYTES = _VALID_CONNECTION_JSON.encode("utf-8")
+
+@pytest.fixture(scope="module")
 def validator():
+    # Shared so each schema is loaded once per module; tests only read from it
     return MessageValidator(schema_dir=SCHEMAS_DIR)
 
 def test_load_missing_schema(validator):
@@ -44,15 +57,10 @@ def test_validate_message_valid_dict(validator):
     assert validator.validate_message("connection", payload) is True
 
 def test_validate_message_valid_str(validator):
-    payload_str = json.dumps({
-        "headerId": 2,
-        "timestamp": "2025-10-01T13:00:00Z",
-        "version": "2.1.0",
-        "manufacturer": "TestMan",
-        "serialNumber": "AGV002",
-        "connectionState": "OFFLINE"
-    })
-    assert validator.validate_message("connection", payload_str) is True
+    assert validator.validate_message("connection", _VALID_CONNECTION_JSON) is True
+
+def test_validate_message_valid_bytes(validator):
+    assert validator.validate_message("connection", _VALID_CONNECTION_JSON_BYTES) is True
 
 def test_validate_message_missing_field(validator):
     payload = {
@@ -86,15 +94,17 @@ def test_validate_message_malformed_json(validator):
         validator.validate_message("connection", bad_json)
     assert "Invalid JSON" in str(exc.value)
 
-def test_schema_caching(monkeypatch, validator):
+def test_schema_caching(monkeypatch):
+    # Fresh instance: the shared fixture may already have "connection" cached
+    validator = MessageValidator(schema_dir=SCHEMAS_DIR)
     load_calls = []
-    original_load = json.load
+    original_load = from_json
 
-    def spy_load(fp):
+    def spy_load(data):
         load_calls.append(True)
-        return original_load(fp)
+        return original_load(data)
 
-    monkeypatch.setattr("vda5050.validation.validator.json.load", spy_load)
+    monkeypatch.setattr("vda5050.validation.validator.from_json", spy_load)
     # First load from file
     validator.get_schema("connection")
     # Second load should use cache, not reload file
@@ -216,29 +226,36 @@ VALID_PAYLOADS = {
 }
 
 
-@pytest.mark.parametrize("message_type", SCHEMAS)
-def test_validate_all_schemas_valid(validator, message_type):
+def test_validate_all_schemas_valid(validator):
     """Test that all schemas accept minimal valid payloads."""
-    payload = VALID_PAYLOADS[message_type]
-    assert validator.validate_message(message_type, payload) is True
+    errors = []
+    for message_type in SCHEMAS:
+        try:
+            validator.validate_message(message_type, VALID_PAYLOADS[message_type])
+        except VDA5050ValidationError as e:
+            errors.append(f"{message_type}: {e}")
+    if errors:
+        pytest.fail("\n".join(errors))
 
 
-@pytest.mark.parametrize("message_type", SCHEMAS)
-def test_validate_all_schemas_missing_field(validator, message_type):
+def test_validate_all_schemas_missing_field(validator):
     """Test that all schemas reject payloads missing a required field."""
-    required_fields = validator.get_required_fields(message_type)
-    
-    # Skip if no required fields (like visualization)
-    if not required_fields:
-        pytest.skip(f"Schema '{message_type}' has no required fields")
-    
-    # Create a copy of the valid payload
-    payload = VALID_PAYLOADS[message_type].copy()
-    
-    # Remove the first required field
-    missing_field = required_fields[0]
-    payload.pop(missing_field, None)
-    
-    # Should raise validation error
-    with pytest.raises(VDA5050ValidationError):
-        validator.validate_message(message_type, payload)
+    errors = []
+    for message_type in SCHEMAS:
+        required_fields = validator.get_required_fields(message_type)
+        
+        # Nothing to remove if there are no required fields (like visualization)
+        if not required_fields:
+            continue
+        
+        # Copy the valid payload without its first required field
+        missing_field = required_fields[0]
+        payload = {k: v for k, v in VALID_PAYLOADS[message_type].items() if k != missing_field}
+        
+        try:
+            validator.validate_message(message_type, payload)
+        except VDA5050ValidationError:
+            continue
+        errors.append(f"{message_type}: accepted payload without '{missing_field}'")
+    if errors:
+        pytest.fail("\n".join(errors))